@@ -6,6 +6,7 @@ from typing import Annotated, Any, Concatenate
 from sqlalchemy.orm import DeclarativeBase
 
 from bolinette.api import ApiController
+from bolinette.core.mapping import JsonBytes
 from bolinette.core.types import Function, Type
 from bolinette.web import Payload, delete, get, patch, post, put
 
@@ -19,9 +20,9 @@ class _Autoroute:
         dto_t = func_f.return_type
 
         @get("")
-        async def _inner(self: ApiController[DeclarativeBase]) -> list[dto_t.origin]:
+        async def _inner(self: ApiController[DeclarativeBase]) -> JsonBytes:
             entity = await self.service.get_all()
-            return self.mapper.map(list[self.cls], dto_t.origin, entity)
+            return self.mapper.serialize(list[self.cls], dto_t.origin, entity)
 
         return _inner
 
@@ -33,9 +34,9 @@ class _Autoroute:
         dto_t = func_f.return_type
 
         @get(r"{id}")
-        async def _inner(self: ApiController[DeclarativeBase], id: str) -> dto_t.origin:
+        async def _inner(self: ApiController[DeclarativeBase], id: str) -> JsonBytes:
             entity = await self.service.get_by_primary(id)
-            return self.mapper.map(self.cls, dto_t.origin, entity)
+            return self.mapper.serialize(self.cls, dto_t.origin, entity)
 
         return _inner
 
@@ -10,7 +10,7 @@ from bolinette.core.events import EventDispatcher
 from bolinette.core.extensions import Extension, ExtensionModule
 from bolinette.core.injection import Injection, injectable, injection_arg_resolver
 from bolinette.core.logging import LoggerArgResolver
-from bolinette.core.mapping import Mapper, mapping_worker
+from bolinette.core.mapping import JsonCodec, Mapper, StdJsonCodec, mapping_worker
 from bolinette.core.mapping.mapper import (
     BoolMapper,
     BytesMapper,
@@ -66,6 +66,8 @@ class CoreExtension:
         mapping_worker(cache=cache, match_all=True)(DictMapper)
         mapping_worker(cache=cache, match_all=True)(SequenceMapper)
 
+        injectable(strategy="singleton", cache=cache, interfaces=[JsonCodec])(StdJsonCodec)
+
         command(
             "debug injection",
             "Debug command that lists all registered types",
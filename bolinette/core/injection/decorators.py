@@ -13,6 +13,11 @@ class PostInitMeta:
     pass
 
 
+class PostInitPlanMeta:
+    def __init__(self, methods: list[Callable[..., Any]]) -> None:
+        self.methods = methods
+
+
 def post_init[InstanceT](
     func: Callable[Concatenate[InstanceT, ...], None],
 ) -> Callable[Concatenate[InstanceT, ...], None]:
@@ -2,7 +2,7 @@ from typing import Any, override
 
 from bolinette.core import injection, meta
 from bolinette.core.exceptions import InjectionError
-from bolinette.core.injection.context import InjectionContext
+from bolinette.core.injection.context import InjectionContext, InjectionStrategy
 from bolinette.core.types import Type
 
 
@@ -30,19 +30,31 @@ class InjectionHook[InstanceT]:
         return None  # pyright: ignore
 
 
-class InjectionProxy[InstanceT]:
-    def __init__(
-        self,
-        t: Type[InstanceT],
-        context: InjectionContext,
-    ) -> None:
-        self.t: Type[InstanceT] = t
-        self.context = context
+class InjectionHookMeta:
+    def __init__(self, hooks: dict[str, InjectionHook[Any]]) -> None:
+        self.hooks = hooks
+
+
+class InjectionProxyMeta:
+    def __init__(self, origin: Type[Any], strategy: InjectionStrategy, hooks: dict[str, InjectionHook[Any]]) -> None:
+        self.origin = origin
+        self.strategy = strategy
+        self.hooks = hooks
+
+
+class InjectionProxy:
+    def __init__(self, name: str) -> None:
+        self.name = name
 
     def __get__(self, instance: Any, _) -> Any:
         if instance is None:
             return self
         inject = meta.get(instance, injection.Injection)
-        obj = inject.__require__(self.t, self.context)
-        setattr(instance, self.context.arg_name, obj)
+        proxy_meta = meta.get(instance, InjectionProxyMeta)
+        hook = proxy_meta.hooks[self.name]
+        obj = inject.__require__(
+            hook.t,
+            InjectionContext(proxy_meta.origin, proxy_meta.strategy, self.name, hook.default_set, hook.default),
+        )
+        setattr(instance, self.name, obj)
         return obj
@@ -11,8 +11,10 @@ from bolinette.core.injection.decorators import (
     InjectionParamsMeta,
     InjectionSymbol,
     PostInitMeta,
+    PostInitPlanMeta,
 )
-from bolinette.core.injection.hook import InjectionHook, InjectionProxy
+from bolinette.core.injection.hook import InjectionHook, InjectionHookMeta, InjectionProxy, InjectionProxyMeta
+from bolinette.core.injection.plan import ResolutionPlanCache
 from bolinette.core.injection.pool import InstancePool
 from bolinette.core.injection.registration import RegisteredType, RegisteredTypeBag
 from bolinette.core.injection.resolver import (
@@ -34,14 +36,31 @@ class Injection:
         global_pool: InstancePool | None = None,
         types: "dict[type[Any], RegisteredTypeBag[Any]] | None" = None,
         resolvers: list[ArgumentResolver] | None = None,
+        plans: ResolutionPlanCache | None = None,
+    ) -> None:
+        self._init_state(
+            cache,
+            global_pool or InstancePool(),
+            types if types is not None else self._pickup_types(cache),
+            plans,
+        )
+        self._arg_resolvers = self._pickup_resolvers(cache, resolvers or [])
+        self._scoped_resolver_types = self._pickup_resolver_types(cache, self._arg_resolvers, True)
+
+    def _init_state(
+        self,
+        cache: Cache,
+        global_pool: InstancePool,
+        types: "dict[type[Any], RegisteredTypeBag[Any]]",
+        plans: ResolutionPlanCache | None,
     ) -> None:
         self.cache = cache
-        self._global_pool = global_pool or InstancePool()
-        self._types = types if types is not None else self._pickup_types(cache)
+        self._global_pool = global_pool
+        self._plans = plans if plans is not None else ResolutionPlanCache()
+        self._types = types
         self._arg_resolvers: list[ArgumentResolver] = []
-        self._register_type(Type(Cache), Type(Cache), False, "singleton", {}, instance=cache, safe=True)
-        self._register_type(Type(Injection), Type(Injection), False, "singleton", {}, instance=self, safe=True)
-        self._arg_resolvers = self._pickup_resolvers(cache, resolvers or [])
+        self._register_type(Type.of(Cache), Type.of(Cache), False, "singleton", {}, instance=cache, safe=True)
+        self._register_type(Type.of(Injection), Type.of(Injection), False, "singleton", {}, instance=self, safe=True)
 
     @property
     def registered_types(self) -> dict[type[Any], RegisteredTypeBag[Any]]:
@@ -53,14 +72,14 @@ class Injection:
 
     def is_registered(self, cls: type[Any] | Type[Any]) -> bool:
         if not isinstance(cls, Type):
-            t = Type(cls)
+            t = Type.of(cls)
         else:
             t = cls
         return t.cls in self._types and self._types[t.cls].is_registered(t)
 
     def get_registered_type[InstanceT](self, cls: type[InstanceT] | Type[InstanceT]) -> RegisteredTypeBag[InstanceT]:
         if not isinstance(cls, Type):
-            t = Type(cls)
+            t = Type.of(cls)
         else:
             t = cls
         if not self.is_registered(t):
@@ -119,10 +138,19 @@ class Injection:
         self,
         cache: Cache,
         parent_resolvers: list[ArgumentResolver],
-        add_scoped: bool = False,
     ) -> list[ArgumentResolver]:
+        resolvers: list[ArgumentResolver] = [*parent_resolvers]
+        for cls in self._pickup_resolver_types(cache, parent_resolvers, False):
+            resolvers.append(self.instantiate(cls, additional_resolvers=resolvers))
+        return resolvers
+
+    @staticmethod
+    def _pickup_resolver_types(
+        cache: Cache,
+        parent_resolvers: list[ArgumentResolver],
+        scoped: bool,
+    ) -> list[type[ArgumentResolver]]:
         existing_resolver_types = {type(r) for r in parent_resolvers}
-        resolver_scoped: dict[type, bool] = {}
         resolver_priority: dict[type, int] = {}
         resolver_types: list[type[ArgumentResolver]] = []
 
@@ -130,18 +158,14 @@ class Injection:
             if cls in existing_resolver_types:
                 continue
             _meta = meta.get(cls, ArgResolverMeta)
+            if _meta.scoped and not scoped:
+                continue
             resolver_priority[cls] = _meta.priority
-            resolver_scoped[cls] = _meta.scoped
             resolver_types.append(cls)
-        resolver_types = sorted(resolver_types, key=lambda t: resolver_priority[t])
+        return sorted(resolver_types, key=lambda t: resolver_priority[t])
 
-        resolvers: list[ArgumentResolver] = [*parent_resolvers]
-        for cls in resolver_types:
-            if resolver_scoped[cls] and not add_scoped:
-                continue
-            resolvers.append(self.instantiate(cls, additional_resolvers=resolvers))
-
-        return resolvers
+    def _get_arg_resolvers(self) -> list[ArgumentResolver]:
+        return self._arg_resolvers
 
     def _has_instance(self, t: Type[Any]) -> bool:
         return self._global_pool.has_instance(t)
@@ -154,7 +178,7 @@ class Injection:
             self._global_pool.set_instance(r_type.implmt_t, instance)
 
     def add_instance[InstanceT](self, cls: type[InstanceT], instance: InstanceT) -> None:
-        self._global_pool.set_instance(Type(cls), instance)
+        self._global_pool.set_instance(Type.of(cls), instance)
 
     def _resolve_args(
         self,
@@ -172,71 +196,47 @@ class Injection:
             raise InjectionError(f"A circular call has been detected: {call_chain}", cls=circular_guard[0])
         circular_guard.add(obj)
 
-        try:
-            if isinstance(obj, Function):
-                annotations = obj.annotations(lookup=vars_lookup)
-            else:
-                annotations = obj.init.annotations(lookup=vars_lookup)
-        except NameError as exp:
-            raise InjectionError(f"Type hint '{exp.name}' could not be resolved", func=obj) from exp
-        func_params = obj.parameters()
-
-        if any((n, p) for n, p in func_params.items() if p.kind in (p.POSITIONAL_ONLY, p.VAR_POSITIONAL)):
-            raise InjectionError(
-                "Positional only parameters and positional wildcards are not allowed",
-                func=obj,
-            )
+        plan = self._plans.get(obj, vars_lookup)
 
         f_args: dict[str, Any] = {}
-        _args = [*args]
-        _named_args = {**named_args}
-
-        for p_name, param in func_params.items():
-            if param.kind == param.VAR_KEYWORD:
-                for kw_name, kw_value in _named_args.items():
-                    f_args[kw_name] = kw_value
+        args_count = len(args)
+        args_index = 0
+        _named_args = {**named_args} if named_args else named_args
+
+        for slot in plan.slots:
+            p_name = slot.name
+            if slot.var_keyword:
+                f_args |= _named_args
                 _named_args = {}
                 break
 
-            if _args:
-                f_args[p_name] = _args.pop(0)
+            if args_index < args_count:
+                f_args[p_name] = args[args_index]
+                args_index += 1
                 continue
             if p_name in _named_args:
                 f_args[p_name] = _named_args.pop(p_name)
                 continue
 
-            default_set = False
-            default = None
-            if param.default is not param.empty:
-                default_set = True
-                default = param.default
-
-            if p_name not in annotations:
-                if default_set:
-                    f_args[p_name] = default
-                    continue
-                raise InjectionError("Annotation is required", func=obj, param=p_name)
-
-            hint: Type[Any] = annotations[p_name]
-
-            if hint.is_union:
-                raise InjectionError("Type unions are not allowed", func=obj, param=p_name)
+            if slot.error is not None:
+                raise InjectionError(slot.error, func=obj, param=p_name)
+            if slot.hint is None:
+                f_args[p_name] = slot.default
+                continue
 
             if immediate:
-                arg_value = self._resolve_dependency(
-                    hint,
-                    InjectionContext(obj, strategy, p_name, default_set, default),
+                f_args[p_name] = self._resolve_dependency(
+                    slot.hint,
+                    slot.context(obj, strategy),
                     circular_guard,
                     additional_resolvers,
                 )
             else:
-                arg_value = InjectionHook(hint, default_set, default)
+                f_args[p_name] = slot.hook
 
-            f_args[p_name] = arg_value
-
-        if _args or _named_args:
+        if args_index < args_count or _named_args:
             raise InjectionError(
-                f"Expected {len(func_params)} arguments, {len(args) + len(named_args)} given",
+                f"Expected {len(plan.slots)} arguments, {len(args) + len(named_args)} given",
                 func=obj,
             )
 
@@ -253,14 +253,14 @@ class Injection:
             return self._get_instance(t)
 
         if t.cls is Type:
-            return Type(t.vars[0])
+            return Type.of(t.vars[0])
         if t.cls is type:
             return t.vars[0]
 
         if self.is_registered(t):
             return self._resolve_dependency_default(t, context, circular_guard, additional_resolvers)
 
-        all_resolvers = [*additional_resolvers, *self._arg_resolvers]
+        all_resolvers = [*additional_resolvers, *self._get_arg_resolvers()]
 
         if not len(all_resolvers):
             if t.nullable:
@@ -309,49 +309,84 @@ class Injection:
         return self._instantiate(r_type, circular_guard, additional_resolvers)
 
     def __hook_proxies__(self, t: Type[Any], strategy: InjectionStrategy, instance: object) -> None:
-        hooks: dict[str, InjectionHook[Any]] = {}
         cls = type(instance)
-        cls_attrs: dict[str, Any] = dict(vars(cls))
+        hook_meta = self._get_hook_meta(cls)
+        hooks = hook_meta.hooks
+        instance_hooks: dict[str, InjectionHook[Any]] = {}
+        if hasattr(instance, "__dict__"):
+            instance_hooks = {n: a for n, a in vars(instance).items() if isinstance(a, InjectionHook)}
+        if instance_hooks:
+            hooks = {**hooks, **instance_hooks} if hooks else instance_hooks
+            for name in instance_hooks:
+                delattr(instance, name)
+                if not isinstance(vars(cls).get(name), InjectionProxy):
+                    setattr(cls, name, InjectionProxy(name))
+        if hooks:
+            meta.set(instance, InjectionProxyMeta(t, strategy, hooks))
+
+    @staticmethod
+    def _get_hook_meta(cls: type[Any]) -> InjectionHookMeta:
+        try:
+            if meta.has(cls, InjectionHookMeta):
+                return meta.get(cls, InjectionHookMeta)
+        except TypeError:
+            return InjectionHookMeta({})
+        hooks: dict[str, InjectionHook[Any]] = {}
+        for base in reversed(cls.__bases__):
+            if base in (object, Generic):
+                continue
+            hooks.update(Injection._get_hook_meta(base).hooks)
         attr: InjectionHook[Any] | Any
-        for name, attr in cls_attrs.items():
+        for name, attr in dict(vars(cls)).items():
             if isinstance(attr, InjectionHook):
-                delattr(cls, name)
+                setattr(cls, name, InjectionProxy(name))
                 hooks[name] = attr
-        instance_attrs: dict[str, Any] = dict(vars(instance))
-        for name, attr in instance_attrs.items():
-            if isinstance(attr, InjectionHook):
-                delattr(instance, name)
-                hooks[name] = attr
-        for name, hook in hooks.items():
-            setattr(
-                cls,
-                name,
-                InjectionProxy(hook.t, InjectionContext(t, strategy, name, hook.default_set, hook.default)),
-            )
+        hook_meta = InjectionHookMeta(hooks)
+        try:
+            meta.set(cls, hook_meta)
+        except TypeError:
+            pass
+        return hook_meta
 
-    def _run_init_recursive[InstanceT](
+    def _run_init_plan[InstanceT](
         self,
         cls: type[InstanceT],
         instance: InstanceT,
         vars_lookup: TypeVarLookup[InstanceT] | None,
         circular_guard: OrderedSet[Any] | None,
-        post_init_guard: set[Callable[..., Any]],
         additional_resolvers: list[ArgumentResolver],
     ) -> None:
+        for method in self._get_post_init_plan(cls):
+            self.call(
+                method,
+                args=[instance],
+                vars_lookup=vars_lookup,
+                additional_resolvers=additional_resolvers,
+                circular_guard=circular_guard,
+            )
+
+    @staticmethod
+    def _get_post_init_plan(cls: type[Any]) -> list[Callable[..., Any]]:
+        try:
+            if meta.has(cls, PostInitPlanMeta):
+                return meta.get(cls, PostInitPlanMeta).methods
+        except TypeError:
+            return []
+        methods: list[Callable[..., Any]] = []
         for base in cls.__bases__:
             if base in (object, Generic):
                 continue
-            self._run_init_recursive(base, instance, vars_lookup, circular_guard, post_init_guard, additional_resolvers)
-        for _, attr in vars(cls).items():
-            if meta.has(attr, PostInitMeta) and attr not in post_init_guard:
-                self.call(
-                    attr,
-                    args=[instance],
-                    vars_lookup=vars_lookup,
-                    additional_resolvers=additional_resolvers,
-                    circular_guard=circular_guard,
-                )
-                post_init_guard.add(attr)
+            for method in Injection._get_post_init_plan(base):
+                if method not in methods:
+                    methods.append(method)
+        for attr in vars(cls).values():
+            if meta.has(attr, PostInitMeta) and attr not in methods:
+                methods.append(attr)
+        try:
+            meta.set(cls, PostInitPlanMeta(methods))
+        except TypeError:
+            pass
+        return methods
 
     def _run_post_inits[InstanceT](
         self,
@@ -363,9 +398,7 @@ class Injection:
     ):
         for method in r_type.before_init:
             self.call(method, args=[instance], circular_guard=circular_guard)
-        self._run_init_recursive(
-            r_type.implmt_t.cls, instance, vars_lookup, circular_guard, set(), additional_resolvers
-        )
+        self._run_init_plan(r_type.implmt_t.cls, instance, vars_lookup, circular_guard, additional_resolvers)
         for method in r_type.after_init:
             self.call(method, args=[instance], circular_guard=circular_guard)
 
@@ -435,7 +468,7 @@ class Injection:
         named_args: dict[str, Any] | None = None,
         additional_resolvers: list[ArgumentResolver] | None = None,
     ) -> InstanceT:
-        t = Type(cls)
+        t = Type.of(cls)
         vars_lookup = TypeVarLookup(t)
         init_args = self._resolve_args(
             t,
@@ -450,7 +483,7 @@ class Injection:
         instance = cls(**init_args)
         self.__hook_proxies__(t, "immediate", instance)
         meta.set(instance, self, cls=Injection)
-        self._run_init_recursive(cls, instance, vars_lookup, None, set(), additional_resolvers or [])
+        self._run_init_plan(cls, instance, vars_lookup, None, additional_resolvers or [])
         if isinstance(instance, HasEnter):
             instance.__enter__()
         return instance
@@ -610,21 +643,37 @@ class Injection:
         instance: Any | None,
         match_all: bool,
     ) -> None:
-        intrfc_t = Type(interface)
-        implmt_t = Type(implementation)
+        intrfc_t = Type.of(interface)
+        implmt_t = Type.of(implementation)
         self._register_type(intrfc_t, implmt_t, match_all, strategy, options, instance=instance)
 
     def __require__[InstanceT](self, t: Type[InstanceT], context: InjectionContext | None) -> InstanceT:
         return self._resolve_dependency(t, context, OrderedSet(), [])
 
     def require[InstanceT](self, cls: type[InstanceT]) -> InstanceT:
-        return self.__require__(Type(cls), None)
+        return self.__require__(Type.of(cls), None)
 
     def get_scoped_session(self) -> "ScopedInjection":
-        return ScopedInjection(self.cache, self._global_pool, InstancePool(), self._types, self._arg_resolvers)
+        return ScopedInjection(
+            self.cache,
+            self._global_pool,
+            InstancePool(),
+            self._types,
+            self._arg_resolvers,
+            self._plans,
+            self._scoped_resolver_types,
+        )
 
     def get_async_scoped_session(self) -> "AsyncScopedSession":
-        return AsyncScopedSession(self.cache, self._global_pool, InstancePool(), self._types, self._arg_resolvers)
+        return AsyncScopedSession(
+            self.cache,
+            self._global_pool,
+            InstancePool(),
+            self._types,
+            self._arg_resolvers,
+            self._plans,
+            self._scoped_resolver_types,
+        )
 
     def __enter__(self) -> Self:
         return self
@@ -648,10 +697,17 @@ class ScopedInjection(Injection):
         scoped_pool: InstancePool,
         types: "dict[type[Any], RegisteredTypeBag[Any]]",
         resolvers: list[ArgumentResolver] | None = None,
+        plans: ResolutionPlanCache | None = None,
+        scoped_resolver_types: list[type[ArgumentResolver]] | None = None,
     ) -> None:
         self._scoped_pool = scoped_pool
-        super().__init__(cache, global_pool, types, resolvers)
-        self._scoped_pool.set_instance(Type(Injection), self)
+        self._init_state(cache, global_pool, types, plans)
+        self._arg_resolvers = resolvers or []
+        self._scoped_resolvers: list[ArgumentResolver] | None = None
+        if scoped_resolver_types is None:
+            scoped_resolver_types = self._pickup_resolver_types(cache, self._arg_resolvers, True)
+        self._scoped_resolver_types = scoped_resolver_types
+        self._scoped_pool.set_instance(Type.of(Injection), self)
 
     @property
     @override
@@ -678,16 +734,44 @@ class ScopedInjection(Injection):
 
     @override
     def add_instance[InstanceT](self, cls: type[InstanceT], instance: InstanceT) -> None:
-        self._scoped_pool.set_instance(Type(cls), instance)
+        self._scoped_pool.set_instance(Type.of(cls), instance)
 
     @override
-    def _pickup_resolvers(
-        self,
-        cache: Cache,
-        parent_resolvers: list[ArgumentResolver],
-        add_scoped: bool = False,
-    ) -> list[ArgumentResolver]:
-        return super()._pickup_resolvers(cache, parent_resolvers, add_scoped=True)
+    def _get_arg_resolvers(self) -> list[ArgumentResolver]:
+        if self._scoped_resolvers is None:
+            resolvers: list[ArgumentResolver] = [*self._arg_resolvers]
+            self._scoped_resolvers = resolvers
+            try:
+                for cls in self._scoped_resolver_types:
+                    resolvers.append(self.instantiate(cls, additional_resolvers=resolvers))
+            except BaseException:
+                self._scoped_resolvers = None
+                raise
+        return self._scoped_resolvers
+
+    @override
+    def get_scoped_session(self) -> "ScopedInjection":
+        return ScopedInjection(
+            self.cache,
+            self._global_pool,
+            InstancePool(),
+            self._types,
+            self._get_arg_resolvers(),
+            self._plans,
+            [],
+        )
+
+    @override
+    def get_async_scoped_session(self) -> "AsyncScopedSession":
+        return AsyncScopedSession(
+            self.cache,
+            self._global_pool,
+            InstancePool(),
+            self._types,
+            self._get_arg_resolvers(),
+            self._plans,
+            [],
+        )
 
     @override
     def call[FuncT](
@@ -734,8 +818,10 @@ class AsyncScopedSession(ScopedInjection):
         scoped_pool: InstancePool,
         types: dict[type, RegisteredTypeBag[Any]],
         resolvers: list[ArgumentResolver] | None = None,
+        plans: ResolutionPlanCache | None = None,
+        scoped_resolver_types: list[type[ArgumentResolver]] | None = None,
     ) -> None:
-        super().__init__(cache, global_pool, scoped_pool, types, resolvers)
+        super().__init__(cache, global_pool, scoped_pool, types, resolvers, plans, scoped_resolver_types)
 
     async def __aenter__(self) -> Self:
         return self
@@ -0,0 +1,113 @@
+import inspect
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from bolinette.core.exceptions import InjectionError
+from bolinette.core.injection.context import InjectionContext, InjectionStrategy
+from bolinette.core.injection.hook import InjectionHook
+from bolinette.core.types import Function, Type, TypeVarLookup
+
+
+class ResolutionSlot:
+    def __init__(
+        self,
+        name: str,
+        var_keyword: bool,
+        hint: Type[Any] | None,
+        default_set: bool,
+        default: Any,
+        error: str | None,
+    ) -> None:
+        self.name = name
+        self.var_keyword = var_keyword
+        self.hint = hint
+        self.default_set = default_set
+        self.default = default
+        self.error = error
+        self.hook: InjectionHook[Any] | None = None
+        if hint is not None and error is None:
+            self.hook = InjectionHook(hint, default_set, default)
+
+    def context(self, origin: Type[Any] | Function[..., Any], strategy: InjectionStrategy) -> InjectionContext:
+        return InjectionContext(origin, strategy, self.name, self.default_set, self.default)
+
+
+class ResolutionPlan:
+    def __init__(self, slots: list[ResolutionSlot]) -> None:
+        self.slots = slots
+
+    @staticmethod
+    def build(
+        obj: Type[Any] | Function[..., Any],
+        vars_lookup: TypeVarLookup[Any] | None,
+    ) -> "ResolutionPlan":
+        try:
+            if isinstance(obj, Function):
+                annotations = obj.annotations(lookup=vars_lookup)
+            else:
+                annotations = obj.init.annotations(lookup=vars_lookup)
+        except NameError as exp:
+            raise InjectionError(f"Type hint '{exp.name}' could not be resolved", func=obj) from exp
+        func_params = obj.parameters()
+
+        if any((n, p) for n, p in func_params.items() if p.kind in (p.POSITIONAL_ONLY, p.VAR_POSITIONAL)):
+            raise InjectionError(
+                "Positional only parameters and positional wildcards are not allowed",
+                func=obj,
+            )
+
+        slots: list[ResolutionSlot] = []
+        for p_name, param in func_params.items():
+            default_set = param.default is not param.empty
+            default = param.default if default_set else None
+            hint: Type[Any] | None = None
+            error: str | None = None
+            if param.kind != param.VAR_KEYWORD:
+                if p_name in annotations:
+                    hint = annotations[p_name]
+                    if hint.is_union:
+                        error = "Type unions are not allowed"
+                elif not default_set:
+                    error = "Annotation is required"
+            slots.append(ResolutionSlot(p_name, param.kind == param.VAR_KEYWORD, hint, default_set, default, error))
+        return ResolutionPlan(slots)
+
+
+class ResolutionPlanCache:
+    def __init__(self) -> None:
+        self._plans: WeakKeyDictionary[Any, dict[tuple[Any, ...], ResolutionPlan]] = WeakKeyDictionary()
+
+    def get(
+        self,
+        obj: Type[Any] | Function[..., Any],
+        vars_lookup: TypeVarLookup[Any] | None,
+    ) -> ResolutionPlan:
+        owner, key = self._get_key(obj, vars_lookup)
+        try:
+            plans = self._plans.get(owner)
+            if plans is not None and key in plans:
+                return plans[key]
+        except TypeError:
+            return ResolutionPlan.build(obj, vars_lookup)
+        plan = ResolutionPlan.build(obj, vars_lookup)
+        if plans is None:
+            plans = self._plans[owner] = {}
+        plans[key] = plan
+        return plan
+
+    def clear(self) -> None:
+        self._plans.clear()
+
+    @staticmethod
+    def _get_key(
+        obj: Type[Any] | Function[..., Any],
+        vars_lookup: TypeVarLookup[Any] | None,
+    ) -> tuple[Any, tuple[Any, ...]]:
+        if isinstance(obj, Type):
+            return obj.cls, (obj.vars, vars_lookup)
+        if inspect.ismethod(obj.func):
+            return obj.func.__func__, (True, vars_lookup)
+        return obj.func, (False, vars_lookup)
+
+    def __len__(self) -> int:
+        return sum(len(p) for p in self._plans.values())
@@ -5,4 +5,11 @@ from bolinette.core.mapping.mapper import (
     MappingRunner as MappingRunner,
     MappingWorker as MappingWorker,
 )
-from bolinette.core.mapping.json import JsonObjectEncoder as JsonObjectEncoder
+from bolinette.core.mapping.json import (
+    JsonBytes as JsonBytes,
+    JsonCodec as JsonCodec,
+    JsonObjectEncoder as JsonObjectEncoder,
+    MsgspecCodec as MsgspecCodec,
+    OrjsonCodec as OrjsonCodec,
+    StdJsonCodec as StdJsonCodec,
+)
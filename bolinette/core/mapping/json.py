@@ -1,7 +1,10 @@
 import json
+from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from typing import Any, override
 
+from bolinette.core.exceptions import InitError
+
 
 class JsonObjectEncoder(json.JSONEncoder):
     @override
@@ -14,3 +17,74 @@ class JsonObjectEncoder(json.JSONEncoder):
         if isinstance(o, Iterable):
             return [*o]
         return {k: v for k, v in vars(o).items()}
+
+
+class JsonBytes(bytes): ...
+
+
+class JsonCodec(ABC):
+    @abstractmethod
+    def encode(self, value: Any) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, raw: bytes | str) -> Any: ...
+
+
+class StdJsonCodec(JsonCodec):
+    def __init__(self) -> None:
+        self._encoder = JsonObjectEncoder(separators=(", ", ": "))
+
+    @override
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, JsonBytes):
+            return value
+        return self._encoder.encode(value).encode()
+
+    @override
+    def decode(self, raw: bytes | str) -> Any:
+        return json.loads(raw)
+
+
+class OrjsonCodec(JsonCodec):
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as err:
+            raise InitError("Library orjson is not available, make sure to install it") from err
+        self._orjson = orjson
+        self._default = JsonObjectEncoder().obj_to_primitives
+
+    @override
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, JsonBytes):
+            return value
+        return self._orjson.dumps(value, default=self._default)
+
+    @override
+    def decode(self, raw: bytes | str) -> Any:
+        return self._orjson.loads(raw)
+
+
+class MsgspecCodec(JsonCodec):
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError as err:
+            raise InitError("Library msgspec is not available, make sure to install it") from err
+        self._encoder = msgspec.json.Encoder(enc_hook=JsonObjectEncoder().obj_to_primitives)
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    @override
+    def encode(self, value: Any) -> bytes:
+        if isinstance(value, JsonBytes):
+            return value
+        return self._encoder.encode(value)
+
+    @override
+    def decode(self, raw: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(raw)
+        except self._decode_error as err:
+            doc = raw if isinstance(raw, str) else raw.decode(errors="replace")
+            raise json.JSONDecodeError(str(err), doc, 0) from err
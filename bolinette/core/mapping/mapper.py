@@ -1,5 +1,6 @@
+import inspect
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any, Literal, TypeGuard, override
 from typing import TypedDict as TypedDict
 
@@ -20,6 +21,7 @@ from bolinette.core.mapping.exceptions import (
     UnionError,
     ValidationError,
 )
+from bolinette.core.mapping.json import JsonBytes, JsonCodec, StdJsonCodec
 from bolinette.core.mapping.profiles import Profile
 from bolinette.core.mapping.sequence import IgnoreAttribute, MapFromAttribute, MappingSequence
 from bolinette.core.types import Type, TypeCollection
@@ -30,6 +32,14 @@ class Mapper:
         self._sequences: dict[int, MappingSequence[Any, Any]] = {}
         self._type_mappers: TypeCollection[type[MappingWorker[Any]]] = TypeCollection()
         self._default_mapper: type[MappingWorker[object]] = ObjectMapper
+        self._runner: MappingRunner | None = None
+        self._codec: JsonCodec = StdJsonCodec()
+
+    @property
+    def runner(self) -> "MappingRunner":
+        if self._runner is None:
+            self._runner = MappingRunner(self._sequences, self._type_mappers, self._default_mapper)
+        return self._runner
 
     @post_init
     def _init_profiles(self, cache: Cache, inject: Injection) -> None:
@@ -40,6 +50,12 @@ class Mapper:
                 sequence.complete(completed)
                 completed[hash(sequence)] = sequence
         self._sequences = completed
+        self._runner = None
+
+    @post_init
+    def _init_codec(self, inject: Injection) -> None:
+        if inject.is_registered(JsonCodec):
+            self._codec = inject.require(JsonCodec)
 
     @post_init
     def _init_type_mappers(self, cache: Cache) -> None:
@@ -55,9 +71,11 @@ class Mapper:
                 self._type_mappers.add(t, mapper_t.cls, match_all=match_all)
         else:
             self._type_mappers.add(mapped_t, mapper_t.cls, match_all=match_all)
+        self._runner = None
 
     def set_default_type_mapper(self, mapper: "type[MappingWorker[object]]") -> None:
         self._default_mapper = mapper
+        self._runner = None
 
     def map[SrcT, DestT](
         self,
@@ -70,8 +88,8 @@ class Mapper:
         dest_expr: ExpressionNode | None = None,
         validate: bool = False,
     ) -> DestT:
-        src_t = Type(src_cls)
-        dest_t = Type(dest_cls)
+        src_t = Type.of(src_cls)
+        dest_t = Type.of(dest_cls)
 
         exc_grp: list[MappingError] | None
         if validate:
@@ -79,7 +97,7 @@ class Mapper:
         else:
             exc_grp = None
 
-        mapped = MappingRunner(self._sequences, self._type_mappers, self._default_mapper).map(
+        mapped = self.runner.map(
             src_expr or ExpressionTree.new(src_t),
             src_t,
             dest_expr or ExpressionTree.new(dest_t),
@@ -92,6 +110,63 @@ class Mapper:
             raise ValidationError(exc_grp)
         return mapped
 
+    def map_many[SrcT, DestT](
+        self,
+        src_cls: type[SrcT],
+        dest_cls: type[DestT],
+        src: Iterable[SrcT],
+        *,
+        validate: bool = False,
+    ) -> Iterator[DestT]:
+        src_t = Type.of(src_cls)
+        dest_t = Type.of(dest_cls)
+        runner = self.runner
+
+        compiled: CompiledObjectMapping | None = None
+        if not dest_t.is_union and not dest_t.is_any and isinstance(runner.get_worker(dest_t), ObjectMapper):
+            compiled = runner.compile(src_t, dest_t)
+
+        exc_grp: list[MappingError] | None
+        if validate:
+            exc_grp = []
+        else:
+            exc_grp = None
+
+        for index, elem in enumerate(src):
+            if compiled is not None and elem is not None:
+                try:
+                    mapped = compiled.map(elem)
+                except (MappingError, _CompiledMappingError):
+                    pass
+                else:
+                    yield mapped
+                    continue
+            yield runner.map(
+                ExpressionTree.new(Type.of(list[src_cls]))[index],
+                src_t,
+                ExpressionTree.new(Type.of(list[dest_cls]))[index],
+                dest_t,
+                elem,
+                None,
+                exc_grp,
+            )
+        if exc_grp is not None and len(exc_grp) > 0:
+            raise ValidationError(exc_grp)
+
+    def serialize[SrcT, DestT](self, src_cls: type[SrcT], dest_cls: type[DestT], src: SrcT) -> JsonBytes:
+        src_t = Type.of(src_cls)
+        dest_t = Type.of(dest_cls)
+        runner = self.runner
+        try:
+            projection = runner.compile_projection(src_t, dest_t) if src is not None else None
+            if projection is not None:
+                value = projection.project(src)
+            else:
+                value = runner.get_projector(dest_t)(src)
+        except (MappingError, _CompiledMappingError, _StopFieldMappingError):
+            value = self.map(src_cls, dest_cls, src)
+        return JsonBytes(self._codec.encode(value))
+
 
 class MappingRunner:
     def __init__(
@@ -104,6 +179,9 @@ class MappingRunner:
         self.mappers = mappers
         self.default_mapper = default_mapper
         self._mapper_cache: dict[type[MappingWorker[Any]], MappingWorker[Any]] = {}
+        self._compiled: dict[tuple[Type[Any], Type[Any]], CompiledObjectMapping | None] = {}
+        self._projections: dict[tuple[Type[Any], Type[Any]], JsonProjection | None] = {}
+        self._projectors: dict[tuple[Type[Any], bool], _ValueMapper] = {}
 
     def map[SrcT, DestT](
         self,
@@ -124,6 +202,9 @@ class MappingRunner:
                 return None  # pyright: ignore
             return None  # pyright: ignore
 
+        return self.get_worker(dest_t).map(src_expr, src_t, dest_expr, dest_t, src, dest, exc_grp)
+
+    def get_worker(self, dest_t: Type[Any]) -> "MappingWorker[Any]":
         mapper_cls: type[MappingWorker[Any]]
         if self.mappers.has(dest_t):
             mapper_cls = self.mappers.get(dest_t)
@@ -135,8 +216,48 @@ class MappingRunner:
         else:
             mapper = mapper_cls(self)
             self._mapper_cache[mapper_cls] = mapper
+        return mapper
 
-        return mapper.map(src_expr, src_t, dest_expr, dest_t, src, dest, exc_grp)
+    def compile(self, src_t: Type[Any], dest_t: Type[Any]) -> "CompiledObjectMapping | None":
+        key = (src_t, dest_t)
+        if key in self._compiled:
+            return self._compiled[key]
+        compiled: CompiledObjectMapping | None
+        try:
+            compiled = CompiledObjectMapping(
+                self,
+                dest_t,
+                self.sequences.get(MappingSequence.get_hash(src_t, dest_t), None),
+            )
+        except Exception:
+            compiled = None
+        self._compiled[key] = compiled
+        return compiled
+
+    def compile_projection(self, src_t: Type[Any], dest_t: Type[Any]) -> "JsonProjection | None":
+        key = (src_t, dest_t)
+        if key in self._projections:
+            return self._projections[key]
+        projection: JsonProjection | None = None
+        if not dest_t.is_union and not dest_t.is_any and isinstance(self.get_worker(dest_t), ObjectMapper):
+            try:
+                projection = JsonProjection(
+                    self,
+                    dest_t,
+                    self.sequences.get(MappingSequence.get_hash(src_t, dest_t), None),
+                )
+            except Exception:
+                projection = None
+        self._projections[key] = projection
+        return projection
+
+    def get_projector(self, t: Type[Any]) -> "_ValueMapper":
+        key = (t, t.nullable)
+        if key in self._projectors:
+            return self._projectors[key]
+        projector = JsonProjection.compile_projector(self, t)
+        self._projectors[key] = projector
+        return projector
 
 
 class MappingWorker[TargetT](ABC):
@@ -210,6 +331,12 @@ class ObjectMapper(MappingWorker[Any]):
         if dest_t.is_any:
             return self.runner.map(src_expr, src_t, dest_expr, src_t, src, None, exc_grp)
 
+        if dest is None and (compiled := self.runner.compile(src_t, dest_t)) is not None:
+            try:
+                return compiled.map(src)
+            except (MappingError, _CompiledMappingError):
+                pass
+
         sequence: MappingSequence[SrcT, object] | None = self.runner.sequences.get(
             MappingSequence.get_hash(src_t, dest_t), None
         )
@@ -226,7 +353,7 @@ class ObjectMapper(MappingWorker[Any]):
             for name, param in init_parameters.items():
                 if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
                     continue
-                param_t = Type(param.annotation)
+                param_t = Type.of(param.annotation)
                 param_t, value = self._get_value(
                     src_expr,
                     src_t,
@@ -238,13 +365,7 @@ class ObjectMapper(MappingWorker[Any]):
                     sequence,
                     exc_grp,
                 )
-                new_value = self._map_value(
-                    self._get_expr(src_expr, src, name),
-                    getattr(dest_expr, name),
-                    param_t,
-                    value,
-                    exc_grp,
-                )
+                new_value = self._map_value(src_expr, src, dest_expr, name, param_t, value, exc_grp)
                 if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
                     init_args.append(new_value)
                 elif param.kind in (param.KEYWORD_ONLY,):
@@ -282,13 +403,7 @@ class ObjectMapper(MappingWorker[Any]):
                     )
                 except _StopFieldMappingError:
                     continue
-                new_value = self._map_value(
-                    self._get_expr(src_expr, src, dest_name),
-                    getattr(dest_expr, dest_name),
-                    anno_t,
-                    value,
-                    exc_grp,
-                )
+                new_value = self._map_value(src_expr, src, dest_expr, dest_name, anno_t, value, exc_grp)
             self._set_attr(dest, dest_name, new_value)
 
         if sequence is not None:
@@ -309,16 +424,13 @@ class ObjectMapper(MappingWorker[Any]):
         sequence: MappingSequence[SrcT, object] | None,
         exc_grp: list[MappingError] | None,
     ) -> tuple[Type[Any], Any]:
-        src_name = dest_name
-        field_src_expr = self._get_expr(src_expr, src, src_name)
-        field_dest_expr: ExpressionNode = getattr(dest_expr, dest_name)
         selected_t: Type[Any] | None = None
-        src_value_expr = self._get_expr(ExpressionTree.new(src_t), src, src_name)
+        src_value_expr: ExpressionNode | None = None
         if sequence is not None and dest_name in sequence.for_attrs:
             for_attr = sequence.for_attrs[dest_name]
             if isinstance(for_attr, IgnoreAttribute):
                 if not dest_t.nullable:
-                    exc = IgnoreImpossibleError(field_dest_expr, dest_t)
+                    exc = IgnoreImpossibleError(getattr(dest_expr, dest_name), dest_t)
                     if exc_grp is None:
                         raise exc
                     exc_grp.append(exc)
@@ -328,20 +440,28 @@ class ObjectMapper(MappingWorker[Any]):
                 selected_t = for_attr.use_type
         if dest_t.is_union and selected_t is not None:
             if selected_t not in dest_t.union:
-                exc = TypeMismatchError(field_src_expr, field_dest_expr, selected_t, dest_t)
+                exc = TypeMismatchError(
+                    self._get_expr(src_expr, src, dest_name), getattr(dest_expr, dest_name), selected_t, dest_t
+                )
                 if exc_grp is None:
                     raise exc
                 exc_grp.append(exc)
                 return dest_t, None
             dest_t = selected_t
         try:
-            return dest_t, ExpressionTree.get_value(src_value_expr, src)
+            if src_value_expr is not None:
+                return dest_t, ExpressionTree.get_value(src_value_expr, src)
+            if isinstance(src, dict):
+                return dest_t, src[dest_name]
+            return dest_t, getattr(src, dest_name)
         except (AttributeError, KeyError) as err:
             if not dest_t.required or not recipient_dest_t.total:
                 raise _StopFieldMappingError from err
             if not self._has_default_value(recipient_dest_t.cls, dest_name):
                 if not dest_t.nullable:
-                    exc = SourceNotFoundError(field_src_expr, field_dest_expr, dest_t)
+                    exc = SourceNotFoundError(
+                        self._get_expr(src_expr, src, dest_name), getattr(dest_expr, dest_name), dest_t
+                    )
                     if exc_grp is None:
                         raise exc from err
                     exc_grp.append(exc)
@@ -351,16 +471,20 @@ class ObjectMapper(MappingWorker[Any]):
 
     def _map_value(
         self,
-        field_src_expr: ExpressionNode,
-        field_dest_expr: ExpressionNode,
+        src_expr: ExpressionNode,
+        src: Any,
+        dest_expr: ExpressionNode,
+        name: str,
         anno_t: Type[Any],
         value: Any,
         exc_grp: list[MappingError] | None,
     ) -> Any:
+        if value is not None and type(value) is _PASSTHROUGH_TYPES.get(type(self.runner.get_worker(anno_t))):
+            return value
         return self.runner.map(
-            field_src_expr,
-            Type(type(value)),  # pyright: ignore[reportUnknownArgumentType]
-            field_dest_expr,
+            self._get_expr(src_expr, src, name),
+            Type.of(type(value)),  # pyright: ignore[reportUnknownArgumentType]
+            getattr(dest_expr, name),
             anno_t,
             value,
             None,
@@ -539,7 +663,7 @@ class DictMapper(MappingWorker[dict[str, Any]]):
                 src_expr[src_name],
                 Type.from_instance(src_value),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
                 getattr(dest_expr, src_name),
-                Type(dest_t.vars[1]),
+                Type.of(dest_t.vars[1]),
                 src_value,
                 None,
                 exc_grp,
@@ -572,13 +696,18 @@ class SequenceMapper(MappingWorker[list[Any] | tuple[Any, ...] | set[Any] | froz
                 raise exc
             exc_grp.append(exc)
             return None  # pyright: ignore
+        elem_t = Type.of(dest_t.vars[0])
+        passthrough = _PASSTHROUGH_TYPES.get(type(self.runner.get_worker(elem_t)))
         for index, elem in enumerate(src):
+            if type(elem) is passthrough:
+                elems.append(elem)
+                continue
             elems.append(
                 self.runner.map(
                     src_expr[index],
                     Type.from_instance(elem),  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
                     dest_expr[index],
-                    Type(dest_t.vars[0]),
+                    elem_t,
                     elem,
                     None,
                     exc_grp,
@@ -605,4 +734,247 @@ class SequenceMapper(MappingWorker[list[Any] | tuple[Any, ...] | set[Any] | froz
         return hasattr(obj, "__iter__")
 
 
+class CompiledObjectMapping:
+    def __init__(
+        self,
+        runner: MappingRunner,
+        dest_t: Type[Any],
+        sequence: MappingSequence[Any, Any] | None,
+    ) -> None:
+        if sequence is not None and (sequence.head or sequence.tail):
+            raise _CompiledMappingError
+        self.dest_t = dest_t
+
+        try:
+            init_parameters = dest_t.parameters()
+        except ValueError:
+            init_parameters = {}
+
+        self.init_fields: list[tuple[str, bool, _FieldGetter, _ValueMapper]] = []
+        for name, param in init_parameters.items():
+            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+                continue
+            field_t, getter = self._compile_getter(dest_t, name, Type.of(param.annotation), sequence)
+            positional = param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+            self.init_fields.append((name, positional, getter, self._compile_value(runner, field_t)))
+
+        init_names = {f[0] for f in self.init_fields}
+        self.fields: list[tuple[str, bool, _FieldGetter | None, _ValueMapper | None]] = []
+        for name, anno_t in dest_t.annotations().items():
+            if name in init_names:
+                self.fields.append((name, True, None, None))
+                continue
+            field_t, getter = self._compile_getter(dest_t, name, anno_t, sequence)
+            self.fields.append((name, False, getter, self._compile_value(runner, field_t)))
+
+    def map(self, src: Any) -> Any:
+        src_is_dict = isinstance(src, dict)
+        init_args: list[Any] = []
+        init_kwargs: dict[str, Any] = {}
+        mapped_fields: dict[str, Any] = {}
+        for name, positional, getter, value_mapper in self.init_fields:
+            new_value = value_mapper(getter(src, src_is_dict))
+            if positional:
+                init_args.append(new_value)
+            else:
+                init_kwargs[name] = new_value
+            mapped_fields[name] = new_value
+
+        try:
+            dest = self.dest_t.cls(*init_args, **init_kwargs)
+        except Exception as err:
+            raise _CompiledMappingError from err
+
+        dest_is_dict = isinstance(dest, dict)
+        for name, from_init, getter, value_mapper in self.fields:
+            if from_init:
+                new_value = mapped_fields[name]
+            else:
+                try:
+                    value = getter(src, src_is_dict)  # pyright: ignore[reportOptionalCall]
+                except _StopFieldMappingError:
+                    continue
+                new_value = value_mapper(value)  # pyright: ignore[reportOptionalCall]
+            if dest_is_dict:
+                dest[name] = new_value
+            else:
+                setattr(dest, name, new_value)
+
+        return dest
+
+    @staticmethod
+    def _compile_getter(
+        recipient_t: Type[Any],
+        dest_name: str,
+        dest_t: Type[Any],
+        sequence: MappingSequence[Any, Any] | None,
+    ) -> "tuple[Type[Any], _FieldGetter]":
+        src_value_expr: ExpressionNode | None = None
+        selected_t: Type[Any] | None = None
+        if sequence is not None and dest_name in sequence.for_attrs:
+            for_attr = sequence.for_attrs[dest_name]
+            if isinstance(for_attr, IgnoreAttribute):
+                if not dest_t.nullable:
+                    return dest_t, _fail_getter
+                return dest_t, _none_getter
+            if isinstance(for_attr, MapFromAttribute):
+                src_value_expr = for_attr.src_expr
+                selected_t = for_attr.use_type
+        if dest_t.is_union and selected_t is not None:
+            if selected_t not in dest_t.union:
+                return dest_t, _fail_getter
+            dest_t = selected_t
+
+        field_t = dest_t
+
+        def _missing() -> Any:
+            if not field_t.required or not recipient_t.total:
+                raise _StopFieldMappingError
+            if ObjectMapper._has_default_value(recipient_t.cls, dest_name):
+                return ObjectMapper._get_default_value(recipient_t.cls, dest_name)
+            if field_t.nullable:
+                return None
+            raise _CompiledMappingError
+
+        if src_value_expr is not None:
+            expr = src_value_expr
+
+            def _get_from_expr(src: Any, src_is_dict: bool) -> Any:
+                try:
+                    return ExpressionTree.get_value(expr, src)
+                except (AttributeError, KeyError):
+                    return _missing()
+
+            return field_t, _get_from_expr
+
+        def _get_attr(src: Any, src_is_dict: bool) -> Any:
+            try:
+                if src_is_dict:
+                    return src[dest_name]
+                return getattr(src, dest_name)
+            except (AttributeError, KeyError):
+                return _missing()
+
+        return field_t, _get_attr
+
+    @staticmethod
+    def _compile_value(runner: MappingRunner, t: Type[Any]) -> "_ValueMapper":
+        worker = runner.get_worker(t)
+        nullable = t.nullable
+        passthrough = _PASSTHROUGH_TYPES.get(type(worker))
+
+        def _map_value(value: Any) -> Any:
+            if value is None:
+                if nullable:
+                    return None
+                raise _CompiledMappingError
+            if type(value) is passthrough:
+                return value
+            return worker.map(_COMPILED_EXPR, Type.of(type(value)), _COMPILED_EXPR, t, value, None, None)
+
+        return _map_value
+
+
+class JsonProjection:
+    def __init__(
+        self,
+        runner: MappingRunner,
+        dest_t: Type[Any],
+        sequence: MappingSequence[Any, Any] | None,
+    ) -> None:
+        if sequence is not None and (sequence.head or sequence.tail):
+            raise _CompiledMappingError
+        if self._runs_init_code(dest_t.cls):
+            raise _CompiledMappingError
+        annotations = dest_t.annotations()
+        if not annotations:
+            raise _CompiledMappingError
+        try:
+            init_parameters = dest_t.parameters()
+        except ValueError:
+            init_parameters = {}
+        if any(name not in annotations for name in init_parameters):
+            raise _CompiledMappingError
+
+        self.fields: list[tuple[str, _FieldGetter, _ValueMapper]] = []
+        for name, anno_t in annotations.items():
+            field_t, getter = CompiledObjectMapping._compile_getter(dest_t, name, anno_t, sequence)
+            self.fields.append((name, getter, runner.get_projector(field_t)))
+
+    def project(self, src: Any) -> dict[str, Any]:
+        src_is_dict = isinstance(src, dict)
+        projected: dict[str, Any] = {}
+        for name, getter, projector in self.fields:
+            try:
+                value = getter(src, src_is_dict)
+            except _StopFieldMappingError:
+                continue
+            projected[name] = projector(value)
+        return projected
+
+    @staticmethod
+    def _runs_init_code(cls: type[Any]) -> bool:
+        return hasattr(cls, "__post_init__") or inspect.isfunction(getattr(cls, "__init__", None))
+
+    @staticmethod
+    def compile_projector(runner: MappingRunner, t: Type[Any]) -> "_ValueMapper":
+        nullable = t.nullable
+        worker = runner.get_worker(t)
+
+        if isinstance(worker, ObjectMapper) and not t.is_union and not t.is_any:
+
+            def _project_object(value: Any) -> Any:
+                if value is None:
+                    if nullable:
+                        return None
+                    raise _CompiledMappingError
+                projection = runner.compile_projection(Type.of(type(value)), t)
+                if projection is None:
+                    return worker.map(_COMPILED_EXPR, Type.of(type(value)), _COMPILED_EXPR, t, value, None, None)
+                return projection.project(value)
+
+            return _project_object
+
+        if isinstance(worker, SequenceMapper) and t.vars:
+            elem_t = Type.of(t.vars[0])
+
+            def _project_sequence(value: Any) -> Any:
+                if value is None:
+                    if nullable:
+                        return None
+                    raise _CompiledMappingError
+                if not SequenceMapper._is_iterable(value):
+                    raise _CompiledMappingError
+                projector = runner.get_projector(elem_t)
+                return [projector(elem) for elem in value]
+
+            return _project_sequence
+
+        return CompiledObjectMapping._compile_value(runner, t)
+
+
+type _FieldGetter = Callable[[Any, bool], Any]
+type _ValueMapper = Callable[[Any], Any]
+
+
+def _fail_getter(src: Any, src_is_dict: bool) -> Any:
+    raise _CompiledMappingError
+
+
+def _none_getter(src: Any, src_is_dict: bool) -> Any:
+    return None
+
+
+_COMPILED_EXPR = ExpressionTree.new()
+_PASSTHROUGH_TYPES: dict[type[MappingWorker[Any]], type[Any]] = {
+    IntegerMapper: int,
+    FloatMapper: float,
+    BoolMapper: bool,
+    StringMapper: str,
+}
+
+
 class _StopFieldMappingError(Exception): ...
+
+
+class _CompiledMappingError(Exception): ...
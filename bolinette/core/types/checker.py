@@ -27,7 +27,7 @@ class TypeChecker:
 
     def instanceof(self, value: Any, of_type: type[Any] | Type[Any], /) -> Any:
         if not isinstance(of_type, Type):
-            of_type = Type(of_type)
+            of_type = Type.of(of_type)
         for validator in self.validators:
             if validator.supports(of_type):
                 return validator.validate(value, of_type)
@@ -1,4 +1,5 @@
 import inspect
+from collections import OrderedDict
 from collections.abc import Callable
 from types import NoneType
 from typing import Any, get_type_hints, override
@@ -7,12 +8,15 @@ from bolinette.core.types import Type, TypeVarLookup
 
 
 class Function[**FuncP, FuncT]:
+    ANNOTATIONS_CACHE_SIZE = 32
+
     def __init__(self, func: Callable[FuncP, FuncT]) -> None:
         if isinstance(func, Function):
             raise TypeError(f"Cannot wrap {func}, already wrapped")
         self.func = func
         self.bound_to = getattr(self.func, "__self__", None)
-        self._annotations: dict[str, Any] | None = None
+        self._hints: dict[str, Any] | None = None
+        self._annotations: OrderedDict[TypeVarLookup[Any] | None, dict[str, Any]] = OrderedDict()
         self._signature: inspect.Signature | None = None
         self._parameters: dict[str, inspect.Parameter] | None = None
 
@@ -32,12 +36,22 @@ class Function[**FuncP, FuncT]:
         return all_params[index]
 
     def annotations(self, *, lookup: TypeVarLookup[Any] | None = None) -> dict[str, Any]:
-        if self._annotations is None:
-            self._annotations = {
-                n: self._transform_annotation(c, lookup)
-                for n, c in get_type_hints(self.func, include_extras=True).items()
-            }
-        return self._annotations
+        try:
+            if (annotations := self._annotations.get(lookup)) is not None:
+                self._annotations.move_to_end(lookup)
+                return annotations
+        except TypeError:
+            return self._get_annotations(lookup)
+        annotations = self._get_annotations(lookup)
+        self._annotations[lookup] = annotations
+        if len(self._annotations) > self.ANNOTATIONS_CACHE_SIZE:
+            self._annotations.popitem(last=False)
+        return annotations
+
+    def _get_annotations(self, lookup: TypeVarLookup[Any] | None) -> dict[str, Any]:
+        if self._hints is None:
+            self._hints = get_type_hints(self.func, include_extras=True)
+        return {n: self._transform_annotation(c, lookup) for n, c in self._hints.items()}
 
     def anno_at(self, index: int) -> Any:
         return self.annotations()[self.param_at(index).name]
@@ -52,10 +66,10 @@ class Function[**FuncP, FuncT]:
     @staticmethod
     def _transform_annotation(anno: Any, lookup: TypeVarLookup[Any] | None) -> Any:
         if lookup is not None and anno in lookup:
-            return Type(lookup[anno], lookup=lookup)
+            return Type.of(lookup[anno], lookup=lookup)
         if anno in (NoneType, Ellipsis):
             return anno
-        return Type(anno, lookup=lookup)
+        return Type.of(anno, lookup=lookup)
 
     @override
     def __str__(self) -> str:
@@ -40,6 +40,14 @@ class TypeVarLookup[T]:
     def items(self, /) -> Iterator[tuple[TypeVar, type[Any]]]:
         yield from self._lookup.items()
 
+    @override
+    def __eq__(self, value: object, /) -> bool:
+        return isinstance(value, TypeVarLookup) and self._lookup == value._lookup
+
+    @override
+    def __hash__(self) -> int:
+        return hash(tuple(self._lookup.items()))
+
     @override
     def __str__(self) -> str:
         return f"{self.t.base_name}[{', '.join(f'{k}: {v.__qualname__}' for k, v in self._lookup.items())}]"
@@ -58,5 +66,5 @@ class TypeVarLookup[T]:
             for base in t.cls.__orig_bases__:
                 if get_origin(base) in (Generic, object):
                     continue
-                base_lookups |= TypeVarLookup.get_lookup(Type(base, lookup=lookup))
+                base_lookups |= TypeVarLookup.get_lookup(Type.of(base, lookup=lookup))
         return base_lookups | lookup
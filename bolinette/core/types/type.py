@@ -19,7 +19,7 @@ from typing import (
     override,
 )
 
-from bolinette.core import types
+from bolinette.core import meta, types
 from bolinette.core.exceptions import TypingError
 
 
@@ -36,7 +36,58 @@ class Type[T]:
 
     @staticmethod
     def from_instance(__instance: T) -> "Type[T]":
-        return Type(type(__instance))
+        return Type.of(type(__instance))
+
+    @overload
+    @staticmethod
+    def of[OfT](
+        origin: type[OfT],
+        /,
+        *,
+        lookup: "types.TypeVarMapping | None" = None,
+        raise_on_string: bool = True,
+        raise_on_typevar: bool = True,
+    ) -> "Type[OfT]": ...
+
+    @overload
+    @staticmethod
+    def of(
+        origin: Any,
+        /,
+        *,
+        lookup: "types.TypeVarMapping | None" = None,
+        raise_on_string: bool = True,
+        raise_on_typevar: bool = True,
+    ) -> "Type[Any]": ...
+
+    @staticmethod
+    def of(
+        origin: Any,
+        /,
+        *,
+        lookup: "types.TypeVarMapping | None" = None,
+        raise_on_string: bool = True,
+        raise_on_typevar: bool = True,
+    ) -> "Type[Any]":
+        try:
+            lookup_key = None if lookup is None else tuple((k, lookup[k]) for k in lookup)
+            key = (type(origin), origin, lookup_key, raise_on_string, raise_on_typevar)
+            table = _TypeInternTable.get_table(origin, lookup_key)
+            if (t := table.types.get(key)) is not None:
+                _intern_stats.hits += 1
+                return t
+        except TypeError:
+            _intern_stats.bypassed += 1
+            return Type(origin, lookup=lookup, raise_on_string=raise_on_string, raise_on_typevar=raise_on_typevar)
+        t = Type(origin, lookup=lookup, raise_on_string=raise_on_string, raise_on_typevar=raise_on_typevar)
+        if table.max_size is None or len(table.types) < table.max_size:
+            table.types[key] = t
+        _intern_stats.misses += 1
+        return t
+
+    @staticmethod
+    def intern_stats() -> "TypeInternStats":
+        return _intern_stats
 
     @overload
     def __init__(
@@ -86,6 +137,9 @@ class Type[T]:
         self.lookup = types.TypeVarLookup(self)
         self._hash = hash((self.cls, self.vars))
         self._bases: tuple[Type[Any], ...] | None = None
+        self._parameters: dict[str, inspect.Parameter] | None = None
+        self._parameters_error: ValueError | None = None
+        self._annotations: dict[str, Type[Any]] | None = None
 
     def _unpack_annotations(self, cls: Any) -> Any:
         if isinstance(cls, TypeAliasType):
@@ -103,7 +157,7 @@ class Type[T]:
             args = tuple(a for a in args if a not in (None, NoneType))
             cls, *additional_cls = args
             if len(additional_cls):
-                self.union = (Type(cls), *(Type(c) for c in additional_cls))
+                self.union = (Type.of(cls), *(Type.of(c) for c in additional_cls))
             return self._unpack_annotations(cls)
         return cls
 
@@ -130,10 +184,10 @@ class Type[T]:
         if self._bases is None:
             if hasattr(self.cls, "__orig_bases__"):
                 self._bases = tuple(
-                    Type(c, lookup=self.lookup) for c in self.cls.__orig_bases__ if get_origin(c) is not Generic
+                    Type.of(c, lookup=self.lookup) for c in self.cls.__orig_bases__ if get_origin(c) is not Generic
                 )
             else:
-                self._bases = tuple(Type(c, lookup=self.lookup) for c in self.cls.__bases__)
+                self._bases = tuple(Type.of(c, lookup=self.lookup) for c in self.cls.__bases__)
         return self._bases
 
     @override
@@ -179,33 +233,55 @@ class Type[T]:
         return self.cls(*args, **kwargs)
 
     def parameters(self) -> dict[str, inspect.Parameter]:
-        return {**inspect.signature(self.cls).parameters}
+        if self._parameters is None:
+            if self._parameters_error is not None:
+                raise ValueError(*self._parameters_error.args)
+            try:
+                self._parameters = {**inspect.signature(self.cls).parameters}
+            except ValueError as err:
+                self._parameters_error = err
+                raise
+        return self._parameters
 
     def annotations(self) -> "dict[str, Type[Any]]":
-        return self._get_recursive_annotations(self.cls)
+        if self._annotations is not None:
+            return self._annotations
+        annotations, complete = self._get_recursive_annotations(self.cls)
+        if complete:
+            self._annotations = annotations
+        return annotations
+
+    def clear_cache(self) -> None:
+        self._bases = None
+        self._parameters = None
+        self._parameters_error = None
+        self._annotations = None
 
     def isinstance(self, instance: Any) -> TypeGuard[T]:
         return isinstance(instance, self.cls)
 
-    def _get_recursive_annotations(self, _cls: type[Any]) -> "dict[str, Type[Any]]":
+    def _get_recursive_annotations(self, _cls: type[Any]) -> "tuple[dict[str, Type[Any]], bool]":
         annotations: dict[str, Type[Any]] = {}
+        complete = True
         try:
             for base in _cls.__bases__:
-                annotations |= self._get_recursive_annotations(base)
+                base_annotations, base_complete = self._get_recursive_annotations(base)
+                annotations |= base_annotations
+                complete = complete and base_complete
             hints: dict[str, type[Any] | TypeVar] = get_type_hints(_cls, include_extras=True)
             for attr_name, hint in hints.items():
                 if isinstance(hint, TypeVar):
                     if hint in self.lookup:
-                        annotations[attr_name] = Type(self.lookup[hint])
+                        annotations[attr_name] = Type.of(self.lookup[hint])
                     else:
                         raise TypingError(
                             f"TypeVar ~{hint.__name__} could not be found in lookup", cls=_cls.__qualname__
                         )
                 else:
-                    annotations[attr_name] = Type(hint, lookup=self.lookup)
+                    annotations[attr_name] = Type.of(hint, lookup=self.lookup)
         except (AttributeError, TypeError, NameError):
-            return annotations
-        return annotations
+            return annotations, False
+        return annotations, complete
 
     def matches(self, t: "Type[Any]") -> bool:
         if self.cls is not t.cls or len(self.vars) != len(t.vars):
@@ -257,6 +333,77 @@ class Type[T]:
         return 0
 
 
+class TypeInternStats:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses + self.bypassed
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @override
+    def __repr__(self) -> str:
+        return f"<TypeInternStats hits={self.hits} misses={self.misses} bypassed={self.bypassed}>"
+
+
+class _TypeInternTable:
+    def __init__(self, max_size: int | None = None) -> None:
+        self.types: dict[tuple[Any, ...], Type[Any]] = {}
+        self.max_size = max_size
+
+    @staticmethod
+    def get_table(origin: Any, lookup_key: tuple[tuple[Any, Any], ...] | None) -> "_TypeInternTable":
+        owners = [origin] if lookup_key is None else [origin, *(v for _, v in lookup_key)]
+        for owner in owners:
+            if (table := _TypeInternTable._get_owner_table(owner)) is not None:
+                return table
+        return _shared_intern_table
+
+    @staticmethod
+    def _get_owner_table(origin: Any) -> "_TypeInternTable | None":
+        owner = get_origin(origin) or origin
+        if isinstance(owner, type) and owner not in _shared_intern_owners:
+            try:
+                if meta.has(owner, _TypeInternTable):
+                    return meta.get(owner, _TypeInternTable)
+                table = _TypeInternTable()
+                meta.set(owner, table)
+                return table
+            except (AttributeError, TypeError):
+                _shared_intern_owners.add(owner)
+        for arg in get_args(origin):
+            if (table := _TypeInternTable._get_owner_table(arg)) is not None:
+                return table
+        return None
+
+
+_intern_stats = TypeInternStats()
+_shared_intern_table = _TypeInternTable(max_size=4096)
+_shared_intern_owners: set[type[Any]] = {
+    int,
+    float,
+    bool,
+    str,
+    bytes,
+    list,
+    tuple,
+    set,
+    frozenset,
+    dict,
+    type,
+    object,
+    NoneType,
+    UnionType,
+}
+
 _BUILTIN_PARAM_COUNT: dict[type[Any], int] = {
     collections.abc.Hashable: 0,
     collections.abc.Awaitable: 1,
@@ -1,6 +1,8 @@
 import importlib
 import re
 from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from types import TracebackType
 from typing import Any, Protocol
 
 from bolinette.core import Cache, __user_cache__
@@ -8,6 +10,7 @@ from bolinette.core.injection import Injection, post_init
 from bolinette.core.logging import Logger
 from bolinette.data import DataSection
 from bolinette.data.exceptions import DatabaseError
+from bolinette.data.objects import DatabaseSection
 
 
 class DatabaseManager:
@@ -26,6 +29,13 @@ class DatabaseManager:
         self._systems: list[DatabaseSystem] = []
         self._connections: list[DatabaseConnection] = []
         self._logger = logger
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self._section.sync_workers, thread_name_prefix="bolinette-db")
+        return self._executor
 
     def has_system(self, scheme: str) -> bool:
         return any(s for s in self._systems if s.scheme == scheme)
@@ -66,9 +76,34 @@ class DatabaseManager:
                     f"Database system supporting scheme '{scheme}' was not found", connection=db_config.name
                 )
             system = self.get_system(scheme)
-            self._connections.append(DatabaseConnection(db_config.name, db_config.url, db_config.echo, system.manager))
+            self._connections.append(
+                DatabaseConnection(
+                    db_config.name,
+                    db_config.url,
+                    db_config.echo,
+                    system.manager,
+                    self._get_engine_options(db_config),
+                )
+            )
             self._logger.debug(f"Opening connection to {db_config.url}")
 
+    @staticmethod
+    def _get_engine_options(db_config: DatabaseSection) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "pool_size": db_config.pool_size,
+            "max_overflow": db_config.max_overflow,
+            "pool_timeout": db_config.pool_timeout,
+            "pool_recycle": db_config.pool_recycle,
+            "pool_pre_ping": db_config.pool_pre_ping,
+            "query_cache_size": db_config.query_cache_size,
+        }
+        return {k: v for k, v in options.items() if v is not None}
+
+    def __exit__(self, *args: tuple[type[BaseException], Exception, TracebackType] | tuple[None, None, None]) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
 
 class DatabaseSystem(Protocol):
     scheme: str
@@ -88,8 +123,16 @@ def database_system[SystemT: DatabaseSystem](*, cache: Cache | None = None) -> C
 
 
 class DatabaseConnection:
-    def __init__(self, name: str, url: str, echo: bool, manager: Any) -> None:
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        echo: bool,
+        manager: Any,
+        options: dict[str, Any] | None = None,
+    ) -> None:
         self.name = name
         self.url = url
         self.echo = echo
         self.manager = manager
+        self.options = options or {}
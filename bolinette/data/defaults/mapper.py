@@ -20,4 +20,4 @@ class OrmColumnTypeMapper(MappingWorker[Mapped[Any]]):
         dest: Any | None,
         exc_grp: list[MappingError] | None,
     ) -> Any:
-        return self.runner.map(src_expr, src_t, dest_expr, Type(dest_t.vars[0]), src, dest, exc_grp)
+        return self.runner.map(src_expr, src_t, dest_expr, Type.of(dest_t.vars[0]), src, dest, exc_grp)
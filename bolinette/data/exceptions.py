@@ -67,3 +67,9 @@ class ColumnNotNullableError(EntityValidationError):
 class WrongColumnTypeError(EntityValidationError):
     def __init__(self, entity: type[Any], column: str, value: Any, expected: type[Any]) -> None:
         super().__init__(f"Column '{column}' of entity {entity} must be of type {expected}, got value '{value}'")
+
+
+class InvalidCursorError(DataError):
+    def __init__(self, entity: type[Any]) -> None:
+        super().__init__(f"Invalid pagination cursor for entity {entity}")
+        self.entity = entity
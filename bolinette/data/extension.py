@@ -16,7 +16,7 @@ from bolinette.data.defaults import (
     SQLite,
     create_db_tables,
 )
-from bolinette.data.relational import AsyncTransaction, EntityManager
+from bolinette.data.relational import AsyncTransaction, EntityManager, LruResultCache, PoolStatistics, ResultCache
 from bolinette.data.relational.manager import create_tables_for_memory_db
 
 
@@ -30,6 +30,8 @@ class DataExtension:
         injectable(strategy="singleton", cache=cache)(DatabaseManager)
         injectable(strategy="singleton", cache=cache)(EntityManager)
         injectable(strategy="scoped", cache=cache)(AsyncTransaction)
+        injectable(strategy="singleton", cache=cache)(PoolStatistics)
+        injectable(strategy="singleton", cache=cache, interfaces=[ResultCache])(LruResultCache)
         injection_arg_resolver(scoped=True, cache=cache)(AsyncSessionArgResolver)
 
         mapping_worker(match_all=True)(OrmColumnTypeMapper)
@@ -6,8 +6,17 @@ class DatabaseSection:
     name: str
     url: str
     echo: bool = False
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    pool_timeout: float | None = None
+    pool_recycle: int | None = None
+    pool_pre_ping: bool | None = None
+    query_cache_size: int | None = None
 
 
 @dataclass
 class DataSection:
     databases: list[DatabaseSection]
+    sync_workers: int = 4
+    result_cache_size: int = 1024
+    result_cache_ttl: float | None = 60
@@ -3,7 +3,13 @@ from bolinette.data.relational.base import (
     DeclarativeMeta as DeclarativeMeta,
 )
 from bolinette.data.relational.entity import entity as entity, EntityMeta as EntityMeta
+from bolinette.data.relational.results import (
+    LruResultCache as LruResultCache,
+    ResultCache as ResultCache,
+    TrackedSession as TrackedSession,
+)
 from bolinette.data.relational.session import EntitySession as EntitySession
+from bolinette.data.relational.pagination import Page as Page
 from bolinette.data.relational.transaction import AsyncTransaction as AsyncTransaction
 from bolinette.data.relational.database import (
     AsyncRelationalDatabase as AsyncRelationalDatabase,
@@ -12,4 +18,5 @@ from bolinette.data.relational.database import (
 )
 from bolinette.data.relational.repository import Repository as Repository, repository as repository
 from bolinette.data.relational.manager import EntityManager as EntityManager
+from bolinette.data.relational.pools import PoolStatistics as PoolStatistics, PoolStats as PoolStats
 from bolinette.data.relational.service import Service as Service, service as service
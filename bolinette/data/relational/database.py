@@ -1,20 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import override
+from concurrent.futures import Executor
+from typing import Any, override
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import Pool
+from sqlalchemy.util import get_cls_kwargs
 
-from bolinette.data.relational import AsyncTransaction, EntitySession
+from bolinette.data.relational import AsyncTransaction, EntitySession, TrackedSession
 
 
 class AbstractDatabase(ABC):
     _session_maker: sessionmaker[Session] | async_sessionmaker[AsyncSession]
-
-    def __init__(self, base: type[DeclarativeBase], name: str, uri: str, echo: bool):
+    _executor: Executor | None = None
+    _is_async: bool = False
+
+    def __init__(
+        self,
+        base: type[DeclarativeBase],
+        name: str,
+        uri: str,
+        echo: bool,
+        options: dict[str, Any] | None = None,
+    ):
         self._base = base
         self._name = name
         self._uri = uri
+        self._options = self._filter_pool_options(uri, self._is_async, options or {})
 
     @property
     def name(self) -> str:
@@ -28,10 +42,27 @@ class AbstractDatabase(ABC):
     def in_memory(self) -> bool:
         return self._uri in ("sqlite://", "sqlite+aiosqlite://")
 
+    def set_executor(self, executor: Executor | None, /) -> None:
+        self._executor = executor
+
     def open_session(self, transaction: AsyncTransaction, /) -> None:
-        session: EntitySession[DeclarativeBase] = EntitySession(self._session_maker(expire_on_commit=False))
+        session: EntitySession[DeclarativeBase] = EntitySession(
+            self._session_maker(expire_on_commit=False), self._executor
+        )
         transaction.add(self._name, session)
 
+    @staticmethod
+    def _filter_pool_options(uri: str, is_async: bool, options: dict[str, Any]) -> dict[str, Any]:
+        if (pool_cls := options.get("poolclass")) is None:
+            url = make_url(uri)
+            pool_cls = url.get_dialect(_is_async=is_async).get_pool_class(url)
+        pool_args = get_cls_kwargs(pool_cls)
+        return {k: v for k, v in options.items() if k not in _POOL_OPTIONS or _POOL_OPTIONS[k] in pool_args}
+
+    @property
+    @abstractmethod
+    def pool(self) -> Pool: ...
+
     @abstractmethod
     async def create_all(self) -> None: ...
 
@@ -40,10 +71,26 @@ class AbstractDatabase(ABC):
 
 
 class RelationalDatabase(AbstractDatabase):
-    def __init__(self, base: type[DeclarativeBase], name: str, uri: str, echo: bool):
-        super().__init__(base, name, uri, echo)
-        self._engine = create_engine(uri, echo=echo)
-        self._session_maker = sessionmaker(self._engine)
+    def __init__(
+        self,
+        base: type[DeclarativeBase],
+        name: str,
+        uri: str,
+        echo: bool,
+        options: dict[str, Any] | None = None,
+    ):
+        super().__init__(base, name, uri, echo, options)
+        self._engine = create_engine(uri, echo=echo, **self._options)
+        self._session_maker = sessionmaker(self._engine, class_=TrackedSession)
+
+    @override
+    def set_executor(self, executor: Executor | None, /) -> None:
+        super().set_executor(None if self.in_memory else executor)
+
+    @property
+    @override
+    def pool(self) -> Pool:
+        return self._engine.pool
 
     @override
     async def create_all(self) -> None:
@@ -55,10 +102,24 @@ class RelationalDatabase(AbstractDatabase):
 
 
 class AsyncRelationalDatabase(AbstractDatabase):
-    def __init__(self, base: type[DeclarativeBase], name: str, uri: str, echo: bool):
-        super().__init__(base, name, uri, echo)
-        self._engine = create_async_engine(uri, echo=echo)
-        self._session_maker = async_sessionmaker(self._engine)
+    _is_async = True
+
+    def __init__(
+        self,
+        base: type[DeclarativeBase],
+        name: str,
+        uri: str,
+        echo: bool,
+        options: dict[str, Any] | None = None,
+    ):
+        super().__init__(base, name, uri, echo, options)
+        self._engine = create_async_engine(uri, echo=echo, **self._options)
+        self._session_maker = async_sessionmaker(self._engine, sync_session_class=TrackedSession)
+
+    @property
+    @override
+    def pool(self) -> Pool:
+        return self._engine.pool
 
     @override
     async def create_all(self) -> None:
@@ -68,3 +129,12 @@ class AsyncRelationalDatabase(AbstractDatabase):
     @override
     async def dispose(self) -> None:
         await self._engine.dispose()
+
+
+_POOL_OPTIONS = {
+    "pool_size": "pool_size",
+    "max_overflow": "max_overflow",
+    "pool_timeout": "timeout",
+    "pool_recycle": "recycle",
+    "pool_pre_ping": "pre_ping",
+}
@@ -40,7 +40,9 @@ class EntityManager:
             conn = databases.get_connection(_m.name)
             if not issubclass(conn.manager, AbstractDatabase):
                 raise EntityError(f"Database connection '{_m.name}' is not a relational system")
-            self._engines[base] = conn.manager(base, conn.name, conn.url, conn.echo)
+            engine = conn.manager(base, conn.name, conn.url, conn.echo, conn.options)
+            engine.set_executor(databases.executor)
+            self._engines[base] = engine
 
     @post_init
     def _init_entities(self, cache: Cache) -> None:
@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+
+class Page[EntityT]:
+    def __init__(self, items: list[EntityT], next_cursor: str | None) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+_TAGGED_TYPES: dict[str, tuple[type[Any], Any]] = {
+    "dt": (datetime, datetime.fromisoformat),
+    "d": (date, date.fromisoformat),
+    "t": (time, time.fromisoformat),
+    "u": (UUID, UUID),
+    "n": (Decimal, Decimal),
+}
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    encoded: list[Any] = []
+    for value in values:
+        for tag, (cls, _) in _TAGGED_TYPES.items():
+            if isinstance(value, cls):
+                encoded.append({tag: value.isoformat() if hasattr(value, "isoformat") else str(value)})
+                break
+        else:
+            encoded.append(value)
+    return base64.urlsafe_b64encode(json.dumps(encoded, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any] | None:
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        return None
+    if not isinstance(raw, list):
+        return None
+    values: list[Any] = []
+    for value in raw:  # pyright: ignore[reportUnknownVariableType]
+        if isinstance(value, dict):
+            if len(value) != 1:  # pyright: ignore[reportUnknownArgumentType]
+                return None
+            ((tag, encoded),) = value.items()  # pyright: ignore[reportUnknownVariableType]
+            if tag not in _TAGGED_TYPES:
+                return None
+            try:
+                value = _TAGGED_TYPES[tag][1](encoded)
+            except (TypeError, ValueError, ArithmeticError):
+                return None
+        values.append(value)
+    return values
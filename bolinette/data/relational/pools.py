@@ -0,0 +1,35 @@
+from sqlalchemy.pool import Pool, QueuePool
+
+from bolinette.data import relational
+from bolinette.data.exceptions import DatabaseError
+
+
+class PoolStats:
+    def __init__(self, name: str, pool: Pool) -> None:
+        self.name = name
+        self.status = pool.status()
+        self.size: int | None = None
+        self.checked_in: int | None = None
+        self.checked_out: int | None = None
+        self.overflow: int | None = None
+        self.timeout: float | None = None
+        if isinstance(pool, QueuePool):
+            self.size = pool.size()
+            self.checked_in = pool.checkedin()
+            self.checked_out = pool.checkedout()
+            self.overflow = pool.overflow()
+            self.timeout = pool.timeout()
+
+
+class PoolStatistics:
+    def __init__(self, entities: "relational.EntityManager") -> None:
+        self._entities = entities
+
+    def get(self, name: str) -> PoolStats:
+        for engine in self._entities.engines.values():
+            if engine.name == name:
+                return PoolStats(name, engine.pool)
+        raise DatabaseError("No relational engine was found", connection=name)
+
+    def all(self) -> list[PoolStats]:
+        return [PoolStats(engine.name, engine.pool) for engine in self._entities.engines.values()]
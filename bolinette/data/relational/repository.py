@@ -1,16 +1,31 @@
-from collections.abc import AsyncIterable, Callable, Iterable
-from typing import Any, Literal, overload
+from collections.abc import AsyncIterable, Callable, Iterable, Mapping, Sequence
+from itertools import islice
+from typing import Any, Literal, cast, overload
 
-from sqlalchemy import select
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    Executable,
+    Result,
+    Select,
+    delete,
+    insert,
+    inspect,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import DeclarativeBase, QueryableAttribute
 from sqlalchemy.sql.elements import NamedColumn
 from sqlalchemy.sql.selectable import TypedReturnsRows
+from sqlalchemy.sql.util import find_tables
 
 from bolinette.core import Cache, __user_cache__, meta
 from bolinette.core.injection import post_init
 from bolinette.core.types import Type
-from bolinette.data.exceptions import DataError, EntityNotFoundError
-from bolinette.data.relational import EntitySession
+from bolinette.data.exceptions import DataError, EntityNotFoundError, InvalidCursorError
+from bolinette.data.relational import EntitySession, Page, ResultCache
+from bolinette.data.relational.pagination import decode_cursor, encode_cursor
 
 
 class Repository[EntityT: DeclarativeBase]:
@@ -18,37 +33,129 @@ class Repository[EntityT: DeclarativeBase]:
         self._entity: type[EntityT]
         self._session: EntitySession[EntityT]
         self._primary_key: Iterable[NamedColumn[Any]]
+        self._results: ResultCache | None = None
 
     @post_init
-    def _init_session(self, entity: type[EntityT], session: EntitySession[EntityT]) -> None:
+    def _init_session(
+        self,
+        entity: type[EntityT],
+        session: EntitySession[EntityT],
+        results: ResultCache | None = None,
+    ) -> None:
         self._entity = entity
         self._session = session
         self._primary_key = self._entity.__table__.primary_key
+        self._results = results
 
     @property
     def primary_key(self) -> list[NamedColumn[Any]]:
         return list(self._primary_key)
 
-    async def iterate(self, statement: TypedReturnsRows[tuple[EntityT]]) -> AsyncIterable[EntityT]:
-        result = await self._session.execute(statement)
+    def iterate(
+        self,
+        statement: TypedReturnsRows[tuple[EntityT]],
+        *,
+        cached: bool = False,
+        ttl: float | None = None,
+    ) -> AsyncIterable[EntityT]:
+        if cached:
+            return self._iterate_cached(statement, ttl)
+        return self.stream(statement)
+
+    async def _iterate_cached(
+        self,
+        statement: TypedReturnsRows[tuple[EntityT]],
+        ttl: float | None,
+    ) -> AsyncIterable[EntityT]:
+        result = await self._execute_cached(statement, ttl)
         for row in result.scalars():
             yield row
 
+    async def stream(
+        self,
+        statement: TypedReturnsRows[tuple[EntityT]],
+        batch_size: int = 1000,
+    ) -> AsyncIterable[EntityT]:
+        async for partition in self._session.stream(statement, batch_size=batch_size):
+            for row in partition:
+                yield row
+
     @overload
-    async def first(self, statement: TypedReturnsRows[tuple[EntityT]], *, raises: Literal[True] = True) -> EntityT:
+    async def first(
+        self,
+        statement: TypedReturnsRows[tuple[EntityT]],
+        *,
+        raises: Literal[True] = True,
+        cached: bool = False,
+        ttl: float | None = None,
+    ) -> EntityT:
         pass
 
     @overload
-    async def first(self, statement: TypedReturnsRows[tuple[EntityT]], *, raises: Literal[False]) -> EntityT | None:
+    async def first(
+        self,
+        statement: TypedReturnsRows[tuple[EntityT]],
+        *,
+        raises: Literal[False],
+        cached: bool = False,
+        ttl: float | None = None,
+    ) -> EntityT | None:
         pass
 
-    async def first(self, statement: TypedReturnsRows[tuple[EntityT]], *, raises: bool = True) -> EntityT | None:
-        result = await self._session.execute(statement)
+    async def first(
+        self,
+        statement: TypedReturnsRows[tuple[EntityT]],
+        *,
+        raises: bool = True,
+        cached: bool = False,
+        ttl: float | None = None,
+    ) -> EntityT | None:
+        if cached:
+            result = await self._execute_cached(statement, ttl)
+        else:
+            result = await self._session.execute(statement)
         entity = result.scalar_one_or_none()
         if entity is None and raises:
             raise EntityNotFoundError(self._entity)
         return entity
 
+    async def _execute_cached(self, statement: TypedReturnsRows[tuple[EntityT]], ttl: float | None) -> Result[Any]:
+        if (
+            self._results is None
+            or not self._is_cacheable(statement)
+            or self._loads_relationships(statement)
+            or self._session.has_pending_writes()
+        ):
+            return await self._session.execute(statement)
+        compiled = statement.compile()
+        key = f"{self._entity.__module__}.{self._entity.__qualname__}:{compiled}:{compiled.params!r}"
+        if (cached := self._results.get(key)) is not None:
+            return self._session.merge_frozen(cached)
+        tables = frozenset(t.fullname for t in find_tables(statement))
+        generation = self._results.generation(tables)
+        result = await self._session.execute(statement)
+        frozen = result.freeze()
+        self._results.set(key, self._session.detach_frozen(frozen), tables, ttl, generation)
+        return frozen()
+
+    @staticmethod
+    def _is_cacheable(statement: Any) -> bool:
+        return (
+            isinstance(statement, Executable)
+            and not statement._with_options  # pyright: ignore[reportPrivateUsage]
+            and not statement.get_execution_options()
+        )
+
+    @staticmethod
+    def _loads_relationships(statement: Any) -> bool:
+        for description in getattr(statement, "column_descriptions", ()):
+            if (entity := description.get("entity")) is None:
+                continue
+            mapper = inspect(entity).mapper
+            if any(rel.lazy in (False, "joined", "selectin", "subquery", "immediate") for rel in mapper.relationships):
+                return True
+        return False
+
     def find_all(self) -> AsyncIterable[EntityT]:
         return self.iterate(select(self._entity))
 
@@ -63,14 +170,125 @@ class Repository[EntityT: DeclarativeBase]:
     async def get_by_primary(self, *values: Any, raises: bool = True) -> EntityT | None:
         if (val_l := len(values)) != (prim_l := len(list(self._primary_key))):
             raise DataError(f"Primary key of {self._entity} has {prim_l} columns, but {val_l} values were provided")
-        query = select(self._entity)
-        for col, value in zip(self._primary_key, values, strict=True):
-            query = query.where(col == value)
-        return await self.first(query, raises=raises)
+        entity = await self._session.get(self._entity, values[0] if val_l == 1 else values)
+        if entity is None and raises:
+            raise EntityNotFoundError(self._entity)
+        return entity
+
+    @overload
+    async def get_many_by_primary(self, keys: Sequence[Any], *, raises: Literal[True] = True) -> list[EntityT]:
+        pass
+
+    @overload
+    async def get_many_by_primary(self, keys: Sequence[Any], *, raises: Literal[False]) -> list[EntityT | None]:
+        pass
+
+    async def get_many_by_primary(self, keys: Sequence[Any], *, raises: bool = True) -> list[EntityT | None]:
+        if not keys:
+            return []
+        columns = list(self._primary_key)
+        if len(columns) == 1:
+            idents = [self._coerce_ident(columns, (k,)) for k in keys]
+            query = select(self._entity).where(columns[0].in_([i[0] for i in idents]))
+        else:
+            idents = [tuple(k) for k in keys]
+            for ident in idents:
+                if len(ident) != len(columns):
+                    raise DataError(
+                        f"Primary key of {self._entity} has {len(columns)} columns, "
+                        f"but {len(ident)} values were provided"
+                    )
+            idents = [self._coerce_ident(columns, i) for i in idents]
+            query = select(self._entity).where(tuple_(*columns).in_(idents))
+        mapper = inspect(self._entity)
+        result = await self._session.execute(query)
+        found = {mapper.identity_key_from_instance(e)[1]: e for e in result.scalars()}
+        entities = [found.get(i) for i in idents]
+        if raises and any(e is None for e in entities):
+            raise EntityNotFoundError(self._entity)
+        return entities
+
+    @staticmethod
+    def _coerce_ident(columns: list[NamedColumn[Any]], ident: tuple[Any, ...]) -> tuple[Any, ...]:
+        values: list[Any] = []
+        for column, value in zip(columns, ident, strict=True):
+            try:
+                python_t = column.type.python_type
+                if value is not None and not isinstance(value, python_t):
+                    value = python_t(value)
+            except (NotImplementedError, TypeError, ValueError):
+                pass
+            values.append(value)
+        return tuple(values)
+
+    async def paginate(
+        self,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        order_by: Sequence[NamedColumn[Any] | QueryableAttribute[Any]] = (),
+        desc: bool = False,
+        statement: Select[tuple[EntityT]] | None = None,
+    ) -> Page[EntityT]:
+        if limit <= 0:
+            raise DataError(f"Page limit must be strictly positive, got {limit}")
+        columns = self._get_keyset_columns(order_by)
+        query = statement if statement is not None else select(self._entity)
+        if cursor is not None:
+            values = decode_cursor(cursor)
+            if values is None or len(values) != len(columns):
+                raise InvalidCursorError(self._entity)
+            keyset, bound = tuple_(*columns), tuple_(*values)
+            query = query.where(keyset < bound if desc else keyset > bound)
+        query = query.order_by(*(c.desc() if desc else c.asc() for c in columns)).limit(limit + 1)
+        result = await self._session.execute(query)
+        items = list(result.scalars())
+        if len(items) <= limit:
+            return Page(items, None)
+        items = items[:limit]
+        mapper = inspect(self._entity)
+        last = items[-1]
+        return Page(items, encode_cursor([getattr(last, mapper.get_property_by_column(c).key) for c in columns]))
+
+    def _get_keyset_columns(
+        self,
+        order_by: Sequence[NamedColumn[Any] | QueryableAttribute[Any]],
+    ) -> list[NamedColumn[Any]]:
+        mapper = inspect(self._entity)
+        columns: list[NamedColumn[Any]] = []
+        for column in order_by:
+            if isinstance(column, QueryableAttribute):
+                column = mapper.columns[column.key]
+            columns.append(column)
+        for column in self._primary_key:
+            if not any(c is column for c in columns):
+                columns.append(column)
+        return columns
 
     def add(self, entity: EntityT) -> None:
         self._session.add(entity)
 
+    async def add_many(self, entities: Iterable[EntityT], *, chunk_size: int = 1000) -> list[EntityT]:
+        mapper = inspect(self._entity)
+        keys = [attr.key for attr in mapper.column_attrs]
+        # RETURNING loads new persistent instances in the session, the given entities are left transient
+        statement = insert(self._entity).returning(self._entity, sort_by_parameter_order=True)
+        persisted: list[EntityT] = []
+        iterator = iter(entities)
+        while chunk := list(islice(iterator, chunk_size)):
+            rows = [{k: e.__dict__[k] for k in keys if k in e.__dict__} for e in chunk]
+            result = await self._session.execute(statement, rows)
+            persisted.extend(result.scalars())
+        return persisted
+
+    async def update_many(self, where: ColumnElement[bool], values: Mapping[str, Any]) -> int:
+        result = await self._session.execute(update(self._entity).where(where).values(values))
+        return cast(CursorResult[Any], result).rowcount
+
+    async def delete_where(self, where: ColumnElement[bool]) -> int:
+        result = await self._session.execute(delete(self._entity).where(where))
+        return cast(CursorResult[Any], result).rowcount
+
     async def delete(self, entity: EntityT) -> None:
         await self._session.delete(entity)
 
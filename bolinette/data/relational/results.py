@@ -0,0 +1,138 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any, override
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction, object_mapper
+
+from bolinette.data import DataSection
+
+WRITTEN_TABLES = "bolinette_written_tables"
+COMMITTED_TABLES = "bolinette_committed_tables"
+
+
+class ResultCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    def generation(self, tables: frozenset[str]) -> tuple[int, ...]: ...
+
+    @abstractmethod
+    def set(
+        self,
+        key: str,
+        value: Any,
+        tables: frozenset[str],
+        ttl: float | None = None,
+        generation: tuple[int, ...] | None = None,
+    ) -> None: ...
+
+    @abstractmethod
+    def invalidate(self, tables: Iterable[str]) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class LruResultCache(ResultCache):
+    def __init__(self, section: DataSection) -> None:
+        self._max_size = section.result_cache_size
+        self._ttl = section.result_cache_ttl
+        self._entries: OrderedDict[str, tuple[Any, frozenset[str], float | None]] = OrderedDict()
+        self._tables: dict[str, set[str]] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @override
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, _, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    @override
+    def generation(self, tables: frozenset[str]) -> tuple[int, ...]:
+        return (self._epoch, *(self._generations.get(table, 0) for table in sorted(tables)))
+
+    @override
+    def set(
+        self,
+        key: str,
+        value: Any,
+        tables: frozenset[str],
+        ttl: float | None = None,
+        generation: tuple[int, ...] | None = None,
+    ) -> None:
+        if generation is not None and generation != self.generation(tables):
+            return
+        if key in self._entries:
+            self._remove(key)
+        if ttl is None:
+            ttl = self._ttl
+        self._entries[key] = (value, tables, time.monotonic() + ttl if ttl is not None else None)
+        for table in tables:
+            self._tables.setdefault(table, set()).add(key)
+        while len(self._entries) > self._max_size:
+            self._remove(next(iter(self._entries)))
+
+    @override
+    def invalidate(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            for key in [*self._tables.get(table, ())]:
+                self._remove(key)
+
+    @override
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tables.clear()
+        self._generations.clear()
+        self._epoch += 1
+
+    def _remove(self, key: str) -> None:
+        _, tables, _ = self._entries.pop(key)
+        for table in tables:
+            keys = self._tables[table]
+            keys.discard(key)
+            if not keys:
+                del self._tables[table]
+
+
+class TrackedSession(Session):
+    pass
+
+
+@event.listens_for(TrackedSession, "after_flush")
+def _track_flushed_tables(session: Session, _: UOWTransaction) -> None:
+    tables: set[str] = session.info.setdefault(WRITTEN_TABLES, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        tables.update(t.fullname for t in object_mapper(instance).tables)
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _track_executed_tables(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        table = state.statement.table  # pyright: ignore[reportAttributeAccessIssue]
+        state.session.info.setdefault(WRITTEN_TABLES, set()).add(table.fullname)
+
+
+@event.listens_for(TrackedSession, "after_commit")
+def _track_committed_tables(session: Session) -> None:
+    if tables := session.info.pop(WRITTEN_TABLES, None):
+        session.info.setdefault(COMMITTED_TABLES, set()).update(tables)
+
+
+@event.listens_for(TrackedSession, "after_rollback")
+def _discard_written_tables(session: Session) -> None:
+    session.info.pop(WRITTEN_TABLES, None)
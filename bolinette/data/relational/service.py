@@ -1,14 +1,15 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, Literal, overload
 
 from sqlalchemy import Table
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, QueryableAttribute
+from sqlalchemy.sql.elements import NamedColumn
 
 from bolinette.core import Cache, __user_cache__, meta
 from bolinette.core.mapping import Mapper
 from bolinette.core.types import Type
 from bolinette.data.exceptions import ColumnNotNullableError, WrongColumnTypeError
-from bolinette.data.relational import Repository
+from bolinette.data.relational import Page, Repository
 
 
 class Service[EntityT: DeclarativeBase]:
@@ -30,15 +31,46 @@ class Service[EntityT: DeclarativeBase]:
             return await self._repository.get_by_primary(*values, raises=False)
         return await self._repository.get_by_primary(*values)
 
+    @overload
+    async def get_many_by_primary(self, keys: Sequence[Any], *, raises: Literal[True] = True) -> list[EntityT]:
+        pass
+
+    @overload
+    async def get_many_by_primary(self, keys: Sequence[Any], *, raises: Literal[False]) -> list[EntityT | None]:
+        pass
+
+    async def get_many_by_primary(self, keys: Sequence[Any], *, raises: bool = True) -> list[EntityT | None]:
+        if raises is False:
+            return await self._repository.get_many_by_primary(keys, raises=False)
+        return await self._repository.get_many_by_primary(keys)
+
     async def get_all(self) -> list[EntityT]:
         return [e async for e in self._repository.find_all()]
 
+    async def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        *,
+        order_by: Sequence[NamedColumn[Any] | QueryableAttribute[Any]] = (),
+        desc: bool = False,
+    ) -> Page[EntityT]:
+        return await self._repository.paginate(limit=limit, cursor=cursor, order_by=order_by, desc=desc)
+
     def create(self, payload: object) -> EntityT:
         entity = self._mapper.map(type(payload), self._entity, payload)
         self._repository.add(entity)
         self.validate_entity(entity)
         return entity
 
+    async def create_many[PayloadT](self, payloads: Sequence[PayloadT]) -> list[EntityT]:
+        if not payloads:
+            return []
+        entities = list(self._mapper.map_many(type(payloads[0]), self._entity, payloads))
+        for entity in entities:
+            self.validate_entity(entity)
+        return await self._repository.add_many(entities)
+
     def update(self, entity: EntityT, payload: object) -> EntityT:
         self._mapper.map(type(payload), self._entity, payload, entity)
         self.validate_entity(entity)
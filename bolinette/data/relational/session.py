@@ -1,29 +1,40 @@
-from collections.abc import Callable, Mapping, Sequence
+import asyncio
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from concurrent.futures import Executor
+from functools import partial
 from types import CoroutineType
 from typing import Any
 
-from sqlalchemy import Result
+from sqlalchemy import FrozenResult, Result, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.orm import DeclarativeBase, InstanceState, Mapper, Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import instance_state, set_committed_value
 from sqlalchemy.sql.selectable import TypedReturnsRows
 
+from bolinette.data.relational.results import COMMITTED_TABLES, WRITTEN_TABLES
+
 
 class EntitySession[EntityT: DeclarativeBase]:
-    def __init__(self, session: Session | AsyncSession) -> None:
+    def __init__(self, session: Session | AsyncSession, executor: Executor | None = None) -> None:
+        self._session = session
         if isinstance(session, AsyncSession):
             self.execute = session.execute
+            self.stream = partial(_stream_async, session)
+            self.get = session.get
             self.add = session.add
             self.delete = session.delete
             self.commit = session.commit
             self.rollback = session.rollback
             self.close = session.close
         else:
-            self.execute = _to_async(session.execute)
+            self.execute = _to_async(_prebuffered(session.execute), executor)
+            self.stream = partial(_stream_sync, session, executor)
+            self.get = _to_async(session.get, executor)
             self.add = session.add
-            self.delete = _to_async(session.delete)
-            self.commit = _to_async(session.commit)
-            self.rollback = _to_async(session.rollback)
-            self.close = _to_async(session.close)
+            self.delete = _to_async(session.delete, executor)
+            self.commit = _to_async(session.commit, executor)
+            self.rollback = _to_async(session.rollback, executor)
+            self.close = _to_async(session.close, executor)
 
     async def execute(
         self,
@@ -31,6 +42,16 @@ class EntitySession[EntityT: DeclarativeBase]:
         params: Sequence[Mapping[str, Any]] | Mapping[str, Any] | None = None,
     ) -> Result[tuple[EntityT]]: ...
 
+    def stream(
+        self,
+        statement: TypedReturnsRows[tuple[EntityT]],
+        params: Mapping[str, Any] | None = None,
+        *,
+        batch_size: int,
+    ) -> AsyncIterator[Sequence[EntityT]]: ...
+
+    async def get(self, entity: type[EntityT], ident: Any) -> EntityT | None: ...
+
     def add(self, instance: EntityT) -> None: ...
 
     async def delete(self, instance: EntityT) -> None: ...
@@ -41,9 +62,104 @@ class EntitySession[EntityT: DeclarativeBase]:
 
     async def close(self) -> None: ...
 
+    @staticmethod
+    def detach_frozen(frozen: FrozenResult[tuple[EntityT]]) -> FrozenResult[tuple[EntityT]]:
+        rows = [tuple(_EntitySnapshot.take(value) for value in row) for row in frozen.rewrite_rows()]
+        return frozen.with_new_rows(rows)  # pyright: ignore[reportArgumentType]
+
+    def merge_frozen(self, frozen: FrozenResult[tuple[EntityT]]) -> Result[tuple[EntityT]]:
+        session = self._session.sync_session if isinstance(self._session, AsyncSession) else self._session
+        rows = [tuple(_EntitySnapshot.restore(session, value) for value in row) for row in frozen.rewrite_rows()]
+        return frozen.with_new_rows(rows)()  # pyright: ignore[reportArgumentType]
+
+    def has_pending_writes(self) -> bool:
+        session = self._session
+        return bool(session.info.get(WRITTEN_TABLES) or session.new or session.dirty or session.deleted)
+
+    def pop_committed_tables(self) -> set[str]:
+        return self._session.info.pop(COMMITTED_TABLES, set())
+
+
+class _EntitySnapshot:
+    def __init__(self, mapper: Mapper[Any], values: dict[str, Any]) -> None:
+        self.mapper = mapper
+        self.values = values
+
+    @staticmethod
+    def take(value: Any) -> Any:
+        state = inspect(value, raiseerr=False)
+        if not isinstance(state, InstanceState):
+            return value
+        mapper: Mapper[Any] = state.mapper
+        state_dict = state.dict
+        return _EntitySnapshot(
+            mapper,
+            {attr.key: state_dict[attr.key] for attr in mapper.column_attrs if attr.key in state_dict},
+        )
+
+    @staticmethod
+    def restore(session: Session, value: Any) -> Any:
+        if not isinstance(value, _EntitySnapshot):
+            return value
+        instance = value.mapper.class_manager.new_instance()
+        for key, attr_value in value.values.items():
+            set_committed_value(instance, key, attr_value)
+        make_transient_to_detached(instance)
+        if (existing := session.identity_map.get(instance_state(instance).key)) is not None:
+            return existing
+        return session.merge(instance, load=False)
+
+
+async def _stream_async(
+    session: AsyncSession,
+    statement: TypedReturnsRows[tuple[Any]],
+    params: Mapping[str, Any] | None = None,
+    *,
+    batch_size: int,
+) -> AsyncIterator[Sequence[Any]]:
+    result = await session.stream_scalars(statement, params, execution_options={"yield_per": batch_size})
+    try:
+        async for partition in result.partitions():
+            yield partition
+    finally:
+        await result.close()
+
+
+async def _stream_sync(
+    session: Session,
+    executor: Executor | None,
+    statement: TypedReturnsRows[tuple[Any]],
+    params: Mapping[str, Any] | None = None,
+    *,
+    batch_size: int,
+) -> AsyncIterator[Sequence[Any]]:
+    scalars = _to_async(session.scalars, executor)
+    result = await scalars(statement, params, execution_options={"yield_per": batch_size})
+    fetch = _to_async(result.fetchmany, executor)
+    try:
+        while partition := await fetch(batch_size):
+            yield partition
+    finally:
+        await _to_async(result.close, executor)()
+
+
+def _to_async[**P, T](func: Callable[P, T], executor: Executor | None) -> Callable[P, CoroutineType[Any, Any, T]]:
+    if executor is None:
+
+        async def _call(*args: P.args, **kwargs: P.kwargs) -> T:
+            return func(*args, **kwargs)
+
+    else:
+
+        async def _call(*args: P.args, **kwargs: P.kwargs) -> T:
+            return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
+    return _call
+
 
-def _to_async[**P, T](func: Callable[P, T]) -> Callable[P, CoroutineType[Any, Any, T]]:
-    async def _call(*args: P.args, **kwargs: P.kwargs) -> T:
+def _prebuffered[**P, T](func: Callable[P, T]) -> Callable[P, T]:
+    def _call(*args: P.args, **kwargs: P.kwargs) -> T:
+        kwargs["execution_options"] = {**kwargs.get("execution_options", {}), "prebuffer_rows": True}  # pyright: ignore
         return func(*args, **kwargs)
 
     return _call
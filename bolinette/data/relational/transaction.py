@@ -7,29 +7,38 @@ from sqlalchemy.orm import DeclarativeBase
 from bolinette.core.injection import post_init
 from bolinette.core.logging import Logger
 from bolinette.data import relational
-from bolinette.data.relational import EntitySession
+from bolinette.data.relational import EntitySession, ResultCache
 
 
 class AsyncTransaction:
-    def __init__(self, entities: "relational.EntityManager", logger: "Logger[AsyncTransaction]") -> None:
+    def __init__(
+        self,
+        entities: "relational.EntityManager",
+        logger: "Logger[AsyncTransaction]",
+        results: ResultCache | None = None,
+    ) -> None:
         self._entities = entities
         self._logger = logger
+        self._results = results
         self._sessions: dict[str, EntitySession[DeclarativeBase]] = {}
+        self._engines: dict[str, relational.AbstractDatabase] = {}
 
     def add(self, key: str, session: EntitySession[DeclarativeBase]) -> None:
         self._sessions[key] = session
 
     def __contains__(self, key: str) -> bool:
-        return key in self._sessions
+        return key in self._sessions or key in self._engines
 
     def get(self, key: str) -> EntitySession[DeclarativeBase]:
+        if key not in self._sessions:
+            self._engines[key].open_session(self)
+            self._logger.debug(f"Opened session to the '{key}' database")
         return self._sessions[key]
 
     @post_init
-    def open_sessions(self) -> None:
+    def _init_engines(self) -> None:
         for engine in self._entities.engines.values():
-            engine.open_session(self)
-        self._logger.debug("Opened sessions to the database")
+            self._engines[engine.name] = engine
 
     async def __aenter__(self) -> Self:
         return self
@@ -37,6 +46,8 @@ class AsyncTransaction:
     async def __aexit__(
         self, *args: tuple[type[BaseException], Exception, TracebackType] | tuple[None, None, None]
     ) -> None:
+        if not self._sessions:
+            return
         rollback = False
         if args == (None, None, None):
             try:
@@ -51,6 +62,7 @@ class AsyncTransaction:
             for session in self._sessions.values():
                 await session.rollback()
             self._logger.error("Rolling back changes from the database")
+        self._invalidate_results()
         for session in self._sessions.values():
             await session.close()
         self._logger.debug("Closed sessions to the database")
@@ -58,6 +70,7 @@ class AsyncTransaction:
     async def commit(self) -> None:
         for session in self._sessions.values():
             await session.commit()
+        self._invalidate_results()
 
     async def rollback(self) -> None:
         for session in self._sessions.values():
@@ -66,3 +79,9 @@ class AsyncTransaction:
     async def close(self) -> None:
         for session in self._sessions.values():
             await session.close()
+
+    def _invalidate_results(self) -> None:
+        for session in self._sessions.values():
+            tables = session.pop_committed_tables()
+            if tables and self._results is not None:
+                self._results.invalidate(tables)
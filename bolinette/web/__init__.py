@@ -8,6 +8,7 @@ from bolinette.web.routing import (
     delete as delete,
 )
 from bolinette.web.middleware import (
+    middleware_options as middleware_options,
     with_middleware as with_middleware,
     without_middleware as without_middleware,
 )
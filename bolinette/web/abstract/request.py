@@ -7,7 +7,7 @@ class Request(Protocol):
     path: str
     headers: dict[str, str]
     query_params: dict[str, str]
-    path_params: dict[str, str]
+    path_params: dict[str, Any]
 
     async def raw(self) -> bytes: ...
     async def text(self, *, encoding: str = "utf-8") -> str: ...
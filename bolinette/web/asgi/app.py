@@ -3,6 +3,7 @@ from collections.abc import Awaitable, Callable
 from typing import Any
 
 from bolinette.core.bolinette import Bolinette
+from bolinette.core.mapping import JsonCodec
 from bolinette.web.asgi import (
     AsgiCallable,
     AsgiRequest,
@@ -32,6 +33,13 @@ class AsgiApplication:
         self._blnt = blnt
         self._resources: WebResources | None = None
         self._ws_handler: WebSocketHandler | None = None
+        self._codec: JsonCodec | None = None
+
+    @property
+    def codec(self) -> JsonCodec:
+        if self._codec is None:
+            self._codec = self._blnt.injection.require(JsonCodec)
+        return self._codec
 
     async def _handle_startup(
         self,
@@ -84,7 +92,7 @@ class AsgiApplication:
             query = {k.decode(): v.decode() for k, v in [p.split(b"=", 1) for p in scope["query_string"].split(b"&")]}
         else:
             query = {}
-        request = AsgiRequest(scope["method"], scope["path"], headers, query, received, receive)
+        request = AsgiRequest(scope["method"], scope["path"], headers, query, received, receive, self.codec)
 
         response = AsgiResponse(send)
         await self._resources.dispatch(request, response)
@@ -117,7 +125,7 @@ class AsgiApplication:
         receive: Callable[[], Awaitable[WebSocketReceivedEvent]],
         send: Callable[[WebSocketResult], Awaitable[None]],
     ) -> None:
-        response = AsgiSocketResponse(send)
+        response = AsgiSocketResponse(send, self.codec)
         if self._ws_handler is None:
             self._ws_handler = self._blnt.injection.require(WebSocketHandler)
             await self._blnt.dispatch_event("ws_initialized")
@@ -127,7 +135,7 @@ class AsgiApplication:
                 case "websocket.connect":
                     await self._handle_ws_connect(send)
                 case "websocket.receive":
-                    request = AsgiSocketRequest(received.get("bytes", None), received.get("text", None))
+                    request = AsgiSocketRequest(received.get("bytes", None), received.get("text", None), self.codec)
                     await self._ws_handler.handle(request, response)
                 case "websocket.disconnect":
                     await self._ws_handler.remove_connection(response)
@@ -2,6 +2,7 @@ import json
 from collections.abc import Awaitable, Callable
 from typing import Any, Literal
 
+from bolinette.core.mapping import JsonCodec
 from bolinette.web.asgi import HttpReceivedEvent, HttpRequestEvent
 
 
@@ -32,13 +33,15 @@ class AsgiRequest:
         query_params: dict[str, str],
         received: HttpRequestEvent,
         receive: Callable[[], Awaitable[HttpReceivedEvent]],
+        codec: JsonCodec,
     ) -> None:
         self.method = method
         self.path = path
         self.headers = {k.lower(): v for k, v in headers.items()}
         self.query_params = query_params
-        self.path_params: dict[str, str] = {}
+        self.path_params: dict[str, Any] = {}
         self._body = AsgiAsyncBody(received, receive)
+        self._codec = codec
 
     async def raw(self) -> bytes:
         return await self._body.read()
@@ -47,7 +50,9 @@ class AsgiRequest:
         return (await self._body.read()).decode(encoding)
 
     async def json(self, *, cls: type[json.JSONDecoder] | None = None) -> Any:
-        return json.loads(await self._body.read(), cls=cls)
+        if cls is not None:
+            return json.loads(await self._body.read(), cls=cls)
+        return self._codec.decode(await self._body.read())
 
     def has_header(self, key: str, /) -> bool:
         return key.lower() in self.headers
@@ -61,9 +66,11 @@ class AsgiSocketRequest:
         self,
         bytes: bytes | None,
         text: str | None,
+        codec: JsonCodec,
     ) -> None:
         self._bytes = bytes
         self._text = text
+        self._codec = codec
 
     def get_type(self) -> Literal["raw", "text"]:
         if self._bytes is not None:
@@ -81,7 +88,9 @@ class AsgiSocketRequest:
         return self._text
 
     def json(self, *, cls: type[json.JSONDecoder] | None = None) -> Any:
-        if self._bytes is not None:
-            return json.loads(self._bytes, cls=cls)
-        if self._text is not None:
-            return json.loads(self._text, cls=cls)
+        content = self._bytes if self._bytes is not None else self._text
+        if content is None:
+            return None
+        if cls is not None:
+            return json.loads(content, cls=cls)
+        return self._codec.decode(content)
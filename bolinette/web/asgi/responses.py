@@ -2,6 +2,7 @@ import json
 from collections.abc import Awaitable, Callable
 from typing import Any, overload
 
+from bolinette.core.mapping import JsonCodec
 from bolinette.web.abstract import ResponseState
 from bolinette.web.asgi.types import HttpResponseResult, WebSocketSendResult
 from bolinette.web.exceptions import InternalServerError
@@ -75,8 +76,9 @@ class AsgiResponse:
 
 
 class AsgiSocketResponse:
-    def __init__(self, send: Callable[[WebSocketSendResult], Awaitable[None]]) -> None:
+    def __init__(self, send: Callable[[WebSocketSendResult], Awaitable[None]], codec: JsonCodec) -> None:
         self._send = send
+        self._codec = codec
 
     @overload
     async def send(self, *, raw: bytes) -> None: ...
@@ -91,5 +93,9 @@ class AsgiSocketResponse:
         if "text" in kwargs:
             self._send({"type": "websocket.send", "text": kwargs["text"]})
         if "json" in kwargs:
-            encoder: Callable[[object], str] = kwargs.get("encoder", json.dumps)
-            await self._send({"type": "websocket.send", "text": encoder(kwargs["json"])})
+            if "encoder" in kwargs:
+                encoder: Callable[[object], str] = kwargs["encoder"]
+                text = encoder(kwargs["json"])
+            else:
+                text = self._codec.encode(kwargs["json"]).decode()
+            await self._send({"type": "websocket.send", "text": text})
@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from typing import Protocol
+from typing import Literal, Protocol
 
 from bolinette.core import Cache, __user_cache__, meta
 
@@ -9,18 +9,20 @@ class Controller(Protocol):
 
 
 class ControllerMeta:
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, strategy: Literal["singleton", "scoped"] = "scoped") -> None:
         self.path = path
+        self.strategy = strategy
 
 
 def controller[TCtrl: Controller](
     path: str,
     /,
     *,
+    strategy: Literal["singleton", "scoped"] = "scoped",
     cache: Cache | None = None,
 ) -> Callable[[type[TCtrl]], type[TCtrl]]:
     def decorator(cls: type[TCtrl]) -> type[TCtrl]:
-        meta.set(cls, ControllerMeta(path))
+        meta.set(cls, ControllerMeta(path, strategy))
         (cache or __user_cache__).add(ControllerMeta, cls)
         return cls
 
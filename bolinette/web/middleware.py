@@ -1,9 +1,13 @@
 from collections.abc import Awaitable, Callable
-from typing import Any, Protocol
+from functools import partial
+from typing import Any, Literal, Protocol
 
 from bolinette.core import meta
+from bolinette.core.injection import Injection
+from bolinette.core.logging import Logger
 from bolinette.core.types import Type
 from bolinette.web import Controller
+from bolinette.web.routing import Route
 
 
 class Middleware[**MdlwInitP](Protocol):
@@ -24,6 +28,84 @@ class MiddlewareBag:
         self.removed: list[Type[Any]] = []
 
 
+class MiddlewareOptionsMeta:
+    def __init__(self, strategy: Literal["singleton", "scoped"]) -> None:
+        self.strategy = strategy
+
+
+class MiddlewareStep:
+    def __init__(self, t: Type[Middleware[...]], mdlw_meta: MiddlewareMeta) -> None:
+        self.t = t
+        self.args = mdlw_meta.args
+        self.kwargs = mdlw_meta.kwargs
+        self.singleton = (
+            meta.has(t.cls, MiddlewareOptionsMeta) and meta.get(t.cls, MiddlewareOptionsMeta).strategy == "singleton"
+        )
+        self._instance: Middleware[...] | None = None
+
+    def get_instance(self, inject: Injection, scoped: Injection) -> Middleware[...]:
+        if self.singleton:
+            if self._instance is None:
+                self._instance = self._instantiate(inject)
+            return self._instance
+        return self._instantiate(scoped)
+
+    def _instantiate(self, inject: Injection) -> Middleware[...]:
+        mdlw = inject.instantiate(self.t.cls)
+        mdlw.options(*self.args, **self.kwargs)
+        return mdlw
+
+
+class MiddlewarePipeline:
+    def __init__(self, steps: list[MiddlewareStep], logger: "Logger[Any]") -> None:
+        self.steps = steps
+        self.logger = logger
+
+    @staticmethod
+    def from_route(route: Route[..., Any], logger: "Logger[Any]") -> "MiddlewarePipeline":
+        bags: list[MiddlewareBag] = []
+        if meta.has(route.controller.cls, MiddlewareBag):
+            bags.append(meta.get(route.controller.cls, MiddlewareBag))
+        if meta.has(route.func.func, MiddlewareBag):
+            bags.append(meta.get(route.func.func, MiddlewareBag))
+        added: dict[Type[Middleware[...]], MiddlewareMeta] = {}
+        for bag in bags:
+            for t, mdlw_meta in reversed(bag.added.items()):
+                added[t] = mdlw_meta
+            for t in bag.removed:
+                added.pop(t, None)
+        return MiddlewarePipeline([MiddlewareStep(t, mdlw_meta) for t, mdlw_meta in added.items()], logger)
+
+    async def run(self, inject: Injection, scoped: Injection, handler: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.steps:
+            return await handler()
+        mdlws = [step.get_instance(inject, scoped) for step in self.steps]
+        call_next = handler
+        for mdlw in reversed(mdlws):
+            call_next = partial(self._call_middleware, scoped, mdlw, call_next)
+        return await call_next()
+
+    async def _call_middleware(
+        self,
+        scoped: Injection,
+        mdlw: Middleware[...],
+        call_next: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        self.logger.debug(f"Calling middleware {mdlw.__class__.__qualname__}")
+        return await scoped.call(mdlw.handle, args=[call_next])
+
+
+def middleware_options[MdlwT: Middleware[...]](
+    *,
+    strategy: Literal["singleton", "scoped"] = "scoped",
+) -> Callable[[type[MdlwT]], type[MdlwT]]:
+    def decorator(cls: type[MdlwT]) -> type[MdlwT]:
+        meta.set(cls, MiddlewareOptionsMeta(strategy))
+        return cls
+
+    return decorator
+
+
 def with_middleware[CtrlT: Controller | Callable[..., Any], **MdlwInitP](
     middleware: type[Middleware[MdlwInitP]],
     *args: MdlwInitP.args,
@@ -1,5 +1,6 @@
 from http import HTTPStatus
 from typing import Any
+from uuid import UUID
 
 from bolinette.core.injection.resolver import ArgResolverOptions
 from bolinette.core.mapping import Mapper
@@ -10,7 +11,6 @@ from bolinette.core.mapping.exceptions import (
     SourceNotFoundError,
     ValidationError,
 )
-from bolinette.web import Payload
 from bolinette.web.abstract import Request
 from bolinette.web.exceptions import (
     BadRequestError,
@@ -37,6 +37,10 @@ class RouteParamArgResolver:
         param_name = options.context.arg_name
         value = self.request.path_params[param_name]
         t = options.t
+        if type(value) is t.cls:
+            return value
+        if not isinstance(value, str):
+            value = str(value)
         try:
             match t.cls:
                 case cls if cls is int:
@@ -47,6 +51,8 @@ class RouteParamArgResolver:
                     value = value.lower() in ("1", "true")
                 case cls if cls is str:
                     pass
+                case cls if cls is UUID:
+                    value = UUID(value)
                 case _:
                     raise InternalServerError(f"Could not inject param '{param_name}' of type {t}")
         except ValueError as err:
@@ -61,9 +67,7 @@ class RoutePayloadArgResolver:
         self.body = body
 
     def supports(self, options: ArgResolverOptions) -> bool:
-        return any(
-            isinstance(a, Payload) or (isinstance(a, type) and issubclass(a, Payload)) for a in options.t.annotated
-        )
+        return Route.is_payload(options.t)
 
     def resolve(self, options: ArgResolverOptions) -> Any:
         if self.body is None:
@@ -1,12 +1,14 @@
 import json
 from collections.abc import Callable
+from functools import partial
 from http import HTTPStatus
 from typing import Any
 
 from bolinette.core import Cache, CoreSection, meta
-from bolinette.core.injection import Injection, ScopedInjection, post_init
+from bolinette.core.injection import Injection, post_init
+from bolinette.core.injection.resolver import ArgumentResolver
 from bolinette.core.logging import Logger
-from bolinette.core.mapping import Mapper
+from bolinette.core.mapping import JsonCodec, Mapper
 from bolinette.core.types import Function, Type, TypeChecker, TypeVarLookup
 from bolinette.core.utils import AttributeUtils
 from bolinette.web.abstract import Request, Response, ResponseState
@@ -16,7 +18,7 @@ from bolinette.web.exceptions import (
     NotFoundDispatchError,
     WebErrorHandler,
 )
-from bolinette.web.middleware import Middleware, MiddlewareBag
+from bolinette.web.middleware import MiddlewarePipeline
 from bolinette.web.resources import (
     HttpHeaders,
     ResponseData,
@@ -34,20 +36,27 @@ class WebResources:
         logger: "Logger[WebResources]",
         core_section: CoreSection,
         checker: TypeChecker,
+        codec: JsonCodec,
     ) -> None:
         self.inject = inject
         self.logger = logger
         self.core_section = core_section
         self.checker = checker
+        self.codec = codec
         self.router = Router()
+        self.pipelines: dict[Route[..., Any], MiddlewarePipeline] = {}
+        self.singleton_ctrls: dict[type[Controller], Controller] = {}
 
     @post_init
     def _init_ctrls(self, cache: Cache) -> None:
         for ctrl_cls in cache.get(ControllerMeta, hint=type[Controller], raises=False):
             ctrl_meta = meta.get(ctrl_cls, ControllerMeta)
             self.add_controller(ctrl_cls, ctrl_meta.path)
+        self.router.compile()
 
     def add_controller(self, ctrl_cls: type[Controller], path: str) -> None:
+        if meta.has(ctrl_cls, ControllerMeta) and meta.get(ctrl_cls, ControllerMeta).strategy == "singleton":
+            self.singleton_ctrls[ctrl_cls] = self.inject.instantiate(ctrl_cls)
         attr: Any
         for attr in AttributeUtils.get_cls_attrs(ctrl_cls).values():
             if not meta.has(attr, RouteBucket):
@@ -68,7 +77,9 @@ class WebResources:
             route_path = "/".join(p for p in [controller_path.removesuffix("/"), route_path] if p)
         if not route_path.startswith("/"):
             route_path = f"/{route_path}"
-        self.router.add_route(Route(method, route_path, Type(ctrl_cls), Function(route_func)))
+        route = Route(method, route_path, Type(ctrl_cls), Function(route_func))
+        self.pipelines[route] = MiddlewarePipeline.from_route(route, self.logger)
+        self.router.add_route(route)
 
     async def dispatch(self, request: Request, response: Response) -> None:
         result: object | None = None
@@ -86,7 +97,7 @@ class WebResources:
             if response.state != ResponseState.Idle:
                 self.logger.error("Response has already started, unable to send error")
             else:
-                writer = ResponseWriter(self.inject, response)
+                writer = ResponseWriter(self.inject, response, self.codec)
                 await writer.write_result(result, data)
                 await writer.close()
 
@@ -102,13 +113,16 @@ class WebResources:
         response: Response,
     ) -> None:
         self.logger.info(f"Received request on {request.path}")
-        writer = ResponseWriter(self.inject, response)
+        writer = ResponseWriter(self.inject, response, self.codec)
         try:
             async with self.inject.get_async_scoped_session() as scoped_inject:
                 data = ResponseData()
                 self._prepare_session(scoped_inject, request, data)
-                mdlws = self._collect_middlewares(route, scoped_inject)
-                result = await self._middleware_chain(route, request, scoped_inject, mdlws)
+                result = await self.pipelines[route].run(
+                    self.inject,
+                    scoped_inject,
+                    partial(self._call_controller, route, request, scoped_inject),
+                )
                 await writer.write_result(result, data)
         except Exception as err:
             status, content = WebErrorHandler.create_error_payload(err, self.core_section.debug)
@@ -129,60 +143,29 @@ class WebResources:
         finally:
             await writer.close()
 
-    async def _middleware_chain(
-        self,
-        route: Route[..., Any],
-        request: Request,
-        scoped: ScopedInjection,
-        mdlws: list[Middleware[Any]],
-        index: int = 0,
-    ) -> Any:
-        async def _next_handle() -> Any:
-            return await self._middleware_chain(route, request, scoped, mdlws, index + 1)
-
-        if index >= len(mdlws):
-            return await self._call_controller(route, request, scoped)
-        else:
-            mdlw = mdlws[index]
-            self.logger.debug(f"Calling middleware {mdlw.__class__.__qualname__}")
-            return await scoped.call(mdlw.handle, args=[_next_handle])
-
     async def _call_controller(
         self,
         route: Route[..., Any],
         request: Request,
         scoped: Injection,
     ) -> Any:
-        try:
-            body = await request.json()
-        except json.JSONDecodeError:
-            body = None
-        ctrl = scoped.instantiate(route.controller.cls)
+        resolvers: list[ArgumentResolver] = [RouteParamArgResolver(route, request)]
+        if route.consumes_payload:
+            try:
+                body = await request.json()
+            except json.JSONDecodeError:
+                body = None
+            resolvers.append(RoutePayloadArgResolver(route, scoped.require(Mapper), body))
+        ctrl = self._get_controller(route.controller.cls, scoped)
         self.logger.debug(f"Calling controller route {route.func}(...)")
         return scoped.call(
             route.func.func,
             args=[ctrl],
-            additional_resolvers=[
-                RouteParamArgResolver(route, request),
-                RoutePayloadArgResolver(route, scoped.require(Mapper), body),
-            ],
+            additional_resolvers=resolvers,
             vars_lookup=TypeVarLookup(route.controller),
         )
 
-    @staticmethod
-    def _collect_middlewares(route: Route[..., Any], scoped: Injection) -> list[Middleware[Any]]:
-        bags: list[MiddlewareBag] = []
-        if meta.has(route.controller.cls, MiddlewareBag):
-            bags.append(meta.get(route.controller.cls, MiddlewareBag))
-        if meta.has(route.func, MiddlewareBag):
-            bags.append(meta.get(route.func, MiddlewareBag))
-        mdlws: dict[Type[Middleware[...]], Middleware[...]] = {}
-        for bag in bags:
-            for t, mdlw_meta in reversed(bag.added.items()):
-                mdlw = scoped.instantiate(t.cls)
-                mdlw.options(*mdlw_meta.args, **mdlw_meta.kwargs)
-                mdlws[t] = mdlw
-            for t in bag.removed:
-                if t in mdlws:
-                    del mdlws[t]
-        return list(mdlws.values())
+    def _get_controller(self, ctrl_cls: type[Controller], scoped: Injection) -> Controller:
+        if ctrl_cls in self.singleton_ctrls:
+            return self.singleton_ctrls[ctrl_cls]
+        return scoped.instantiate(ctrl_cls)
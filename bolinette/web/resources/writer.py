@@ -1,19 +1,19 @@
 import inspect
-import json
 from collections.abc import AsyncIterator, Callable, Iterator
 from types import CoroutineType
 from typing import Any, Protocol
 
 from bolinette.core.injection import Injection
-from bolinette.core.mapping import JsonObjectEncoder
+from bolinette.core.mapping import JsonBytes, JsonCodec
 from bolinette.web.abstract import Response
 from bolinette.web.resources import HttpHeaders, ResponseData
 
 
 class ResponseWriter:
-    def __init__(self, inject: Injection, response: Response) -> None:
+    def __init__(self, inject: Injection, response: Response, codec: JsonCodec) -> None:
         self.inject = inject
         self.response = response
+        self.codec = codec
 
     async def close(self) -> None:
         await self.response.close()
@@ -40,18 +40,21 @@ class ResponseWriter:
             return await self._unpack_result(self.inject.call(result), data)
         await self._write_single(result, data)
 
-    @staticmethod
-    def _get_value_writer(value: Any, data: ResponseData, as_list: bool) -> "ValueWriter[Any]":
+    def _get_value_writer(self, value: Any, data: ResponseData, as_list: bool) -> "ValueWriter[Any]":
         value_writer: ValueWriter[Any] | None = None
         match value:
+            case JsonBytes() if as_list:
+                value_writer = JsonListValueTransformer(self.codec)
+            case JsonBytes():
+                value_writer = JsonValueTransformer(self.codec)
             case None | bytes():
                 value_writer = RawValueTransformer()
             case str():
                 value_writer = StringValueTransformer()
             case _ if as_list:
-                value_writer = JsonListValueTransformer()
+                value_writer = JsonListValueTransformer(self.codec)
             case _:
-                value_writer = JsonValueTransformer()
+                value_writer = JsonValueTransformer(self.codec)
         if not data.has_header(HttpHeaders.ContentType):
             data.set_header(HttpHeaders.ContentType, value_writer.default_content_type())
         return value_writer
@@ -134,8 +137,8 @@ class StringValueTransformer:
 
 
 class JsonValueTransformer:
-    def __init__(self) -> None:
-        self.item = 0
+    def __init__(self, codec: JsonCodec) -> None:
+        self.codec = codec
 
     def default_content_type(self) -> str:
         return "application/json"
@@ -143,14 +146,15 @@ class JsonValueTransformer:
     def write(
         self, write: Callable[[bytes], CoroutineType[Any, Any, None]], value: Any
     ) -> CoroutineType[Any, Any, None]:
-        return write(json.dumps(value, cls=JsonObjectEncoder, separators=(", ", ": ")).encode())
+        return write(self.codec.encode(value))
 
     async def close(self, write: Callable[[bytes], CoroutineType[Any, Any, None]]) -> None:
         pass
 
 
 class JsonListValueTransformer:
-    def __init__(self) -> None:
+    def __init__(self, codec: JsonCodec) -> None:
+        self.codec = codec
         self.item = 0
 
     def default_content_type(self) -> str:
@@ -161,7 +165,7 @@ class JsonListValueTransformer:
             await write(b"[")
         else:
             await write(b", ")
-        await write(json.dumps(value, cls=JsonObjectEncoder, separators=(", ", ": ")).encode())
+        await write(self.codec.encode(value))
         self.item += 1
 
     def close(self, write: Callable[[bytes], CoroutineType[Any, Any, None]]) -> CoroutineType[Any, Any, None]:
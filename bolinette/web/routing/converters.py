@@ -0,0 +1,70 @@
+from typing import Any, override
+from uuid import UUID
+
+
+class PathConverter:
+    regex: str
+
+    def match(self, path: str) -> tuple[int, Any]:
+        raise NotImplementedError()
+
+    @staticmethod
+    def _segment_length(path: str) -> int:
+        length = path.find("/")
+        if length < 0:
+            return len(path)
+        return length
+
+
+class StrConverter(PathConverter):
+    regex = "[^/]+"
+
+    @override
+    def match(self, path: str) -> tuple[int, Any]:
+        length = self._segment_length(path)
+        return length, path[:length]
+
+
+class IntConverter(PathConverter):
+    regex = "[0-9]+"
+
+    @override
+    def match(self, path: str) -> tuple[int, Any]:
+        length = 0
+        for char in path:
+            if not "0" <= char <= "9":
+                break
+            length += 1
+        if length == 0:
+            return 0, None
+        return length, int(path[:length])
+
+
+class UUIDConverter(PathConverter):
+    regex = "[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+
+    @override
+    def match(self, path: str) -> tuple[int, Any]:
+        length = self._segment_length(path)
+        if length != 36 or path[8] != "-" or path[13] != "-" or path[18] != "-" or path[23] != "-":
+            return 0, None
+        try:
+            return length, UUID(path[:length])
+        except ValueError:
+            return 0, None
+
+
+class PathRestConverter(PathConverter):
+    regex = ".+"
+
+    @override
+    def match(self, path: str) -> tuple[int, Any]:
+        return len(path), path
+
+
+PATH_CONVERTERS: dict[str, PathConverter] = {
+    "str": StrConverter(),
+    "int": IntConverter(),
+    "uuid": UUIDConverter(),
+    "path": PathRestConverter(),
+}
@@ -2,8 +2,10 @@ import os
 import re
 from typing import Any, override
 
-from bolinette.core.types import Function, Type
+from bolinette.core.types import Function, Type, TypeVarLookup
 from bolinette.web import Controller
+from bolinette.web.payload import Payload
+from bolinette.web.routing.converters import PATH_CONVERTERS, PathConverter
 
 
 class Route[**FuncP, FuncT]:
@@ -18,6 +20,18 @@ class Route[**FuncP, FuncT]:
         self.controller = controller
         self.func = func
         self.path = path
+        self.consumes_payload = self._consumes_payload()
+
+    def _consumes_payload(self) -> bool:
+        try:
+            annotations = self.func.annotations(lookup=TypeVarLookup(self.controller))
+        except Exception:
+            return True
+        return any(Route.is_payload(t) for name, t in annotations.items() if name != "return" and isinstance(t, Type))
+
+    @staticmethod
+    def is_payload(t: Type[Any]) -> bool:
+        return any(isinstance(a, Payload) or (isinstance(a, type) and issubclass(a, Payload)) for a in t.annotated)
 
     def __call__(self, *args: FuncP.args, **kwargs: FuncP.kwargs) -> FuncT:
         return self.func(*args, **kwargs)
@@ -66,7 +80,7 @@ class ResourceNode:
         self.resource = resource
         self.subnodes = subnodes
 
-    def match(self, path: str, path_params: dict[str, str]) -> int:
+    def match(self, path: str, path_params: dict[str, Any]) -> int:
         raise NotImplementedError()
 
     def set_resource(self, resource: Resource | None, /) -> None:
@@ -204,7 +218,7 @@ class StaticResourceNode(ResourceNode):
         self.path = path
 
     @override
-    def match(self, path: str, path_params: dict[str, str]) -> int:
+    def match(self, path: str, path_params: dict[str, Any]) -> int:
         if path.startswith(self.path):
             return len(self.path)
         return 0
@@ -229,14 +243,22 @@ class PatternResourceNode(ResourceNode):
         super().__init__(resource, subnodes)
         self.param_name = param_name
         self.pattern = pattern
+        self.converter: PathConverter | None = PATH_CONVERTERS.get(pattern or "str")
         if norm_pattern is not None:
             self.norm_pattern = norm_pattern
+        elif self.converter is not None:
+            self.norm_pattern = self.converter.regex
         else:
             self.norm_pattern = pattern or "[^/]+"
         self.regex = re.compile(f"({self.norm_pattern})")
 
     @override
-    def match(self, path: str, path_params: dict[str, str]) -> int:
+    def match(self, path: str, path_params: dict[str, Any]) -> int:
+        if self.converter is not None:
+            length, value = self.converter.match(path)
+            if length > 0:
+                path_params[self.param_name] = value
+            return length
         if match := self.regex.match(path):
             group = match.group(1)
             path_params[self.param_name] = group
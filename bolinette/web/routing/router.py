@@ -3,11 +3,13 @@ from typing import Any
 from bolinette.web.abstract import Request
 from bolinette.web.exceptions import MethodNotAllowedDispatchError, NotFoundDispatchError
 from bolinette.web.routing import Resource, ResourceNode, Route
+from bolinette.web.routing.resource import StaticResourceNode
 
 
 class Router:
     def __init__(self) -> None:
         self.root_node: ResourceNode | None = None
+        self._compiled: CompiledRouter | None = None
 
     def add_route(self, route: Route[..., Any], /) -> None:
         new_node = ResourceNode.from_resource(Resource(route.path, [route]))
@@ -15,26 +17,78 @@ class Router:
             self.root_node = new_node
         else:
             self.root_node = ResourceNode.merge(self.root_node, new_node)
+        self._compiled = None
 
-    def dispatch(self, request: Request) -> Route[..., Any]:
-        def find_node(req_path: str, res_node: ResourceNode | None) -> ResourceNode | None:
-            if not res_node or not len(req_path):
-                return None
-            length = res_node.match(req_path, request.path_params)
-            if length <= 0:
-                return None
-            if length == len(req_path):
-                return res_node
-            req_path = req_path[length:]
-            for subnode in res_node.subnodes:
-                res = find_node(req_path, subnode)
-                if res is not None:
-                    return res
-            return None
+    def compile(self) -> "CompiledRouter":
+        if self._compiled is None:
+            self._compiled = CompiledRouter(self.root_node)
+        return self._compiled
 
-        node = find_node(request.path, self.root_node)
-        if not node or not node.resource:
+    def dispatch(self, request: Request) -> Route[..., Any]:
+        resource = self.compile().find(request.path, request.path_params)
+        if resource is None:
             raise NotFoundDispatchError(request.path)
-        if request.method not in node.resource:
+        if request.method not in resource:
             raise MethodNotAllowedDispatchError(request.path)
-        return node.resource[request.method]
+        return resource[request.method]
+
+
+class CompiledRouter:
+    def __init__(self, root_node: ResourceNode | None) -> None:
+        self.static_routes: dict[str, Resource] = {}
+        self.root: CompiledResourceNode | None = None
+        if root_node is not None:
+            self.root = CompiledResourceNode(root_node)
+            self._collect_static_routes(root_node, "")
+
+    def find(self, path: str, path_params: dict[str, Any]) -> Resource | None:
+        if (resource := self.static_routes.get(path)) is not None:
+            return resource
+        if self.root is None or not len(path):
+            return None
+        node = self.root.find(path, path_params)
+        if node is None:
+            return None
+        return node.resource
+
+    def _collect_static_routes(self, node: ResourceNode, prefix: str) -> None:
+        if not isinstance(node, StaticResourceNode):
+            return
+        path = prefix + node.path
+        if node.resource is not None:
+            self.static_routes[path] = node.resource
+        for subnode in node.subnodes:
+            self._collect_static_routes(subnode, path)
+
+
+class CompiledResourceNode:
+    def __init__(self, node: ResourceNode) -> None:
+        self.node = node
+        self.resource = node.resource
+        self.static_path = node.path if isinstance(node, StaticResourceNode) else None
+        self.static_subnodes: dict[str, list[CompiledResourceNode]] = {}
+        self.dynamic_subnodes: list[CompiledResourceNode] = []
+        for subnode in node.subnodes:
+            compiled = CompiledResourceNode(subnode)
+            if compiled.static_path:
+                self.static_subnodes.setdefault(compiled.static_path[0], []).append(compiled)
+            else:
+                self.dynamic_subnodes.append(compiled)
+
+    def find(self, path: str, path_params: dict[str, Any]) -> "CompiledResourceNode | None":
+        if self.static_path is not None:
+            length = len(self.static_path) if path.startswith(self.static_path) else 0
+        else:
+            length = self.node.match(path, path_params)
+        if length <= 0:
+            return None
+        if length == len(path):
+            return self
+        path = path[length:]
+        for subnode in self.static_subnodes.get(path[0], ()):
+            if (res := subnode.find(path, path_params)) is not None:
+                return res
+        for subnode in self.dynamic_subnodes:
+            if (res := subnode.find(path, path_params)) is not None:
+                return res
+        return None
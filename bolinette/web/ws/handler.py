@@ -1,11 +1,9 @@
 import inspect
-import json
 from typing import Any, TypeGuard
 
 from bolinette.core import Cache, CoreSection, meta
 from bolinette.core.injection import Injection, post_init
 from bolinette.core.logging import Logger
-from bolinette.core.mapping.json import JsonObjectEncoder
 from bolinette.core.types import Type, TypeChecker
 from bolinette.core.utils import AttributeUtils
 from bolinette.web.abstract import WebSocketRequest, WebSocketResponse
@@ -200,4 +198,4 @@ class WebSocketContext:
         if channel not in topic_t.subs:
             return
         for ws in topic_t.subs[channel]:
-            await ws.send(json=content, encoder=lambda o: json.dumps(o, cls=JsonObjectEncoder))
+            await ws.send(json=content)
@@ -0,0 +1,77 @@
+import json
+from typing import Any
+
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from bolinette.api import autoroute
+from bolinette.core.mapping import JsonBytes, Mapper
+from bolinette.core.mapping.mapper import IntegerMapper, ObjectMapper, SequenceMapper, StringMapper
+from bolinette.core.testing import Mock
+from bolinette.core.types import Type
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Entity(_Base):
+    __tablename__ = "entity"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    secret: Mapped[str]
+
+
+class _Dto:
+    id: int
+    name: str
+
+
+class _Service:
+    def __init__(self, entities: list[_Entity]) -> None:
+        self.entities = entities
+
+    async def get_all(self) -> list[_Entity]:
+        return self.entities
+
+    async def get_by_primary(self, *values: Any) -> _Entity:
+        return next(e for e in self.entities if str(e.id) == values[0])
+
+
+class _Controller:
+    def __init__(self, service: _Service, mapper: Mapper) -> None:
+        self.service = service
+        self.mapper = mapper
+        self.cls = _Entity
+
+
+def _create_controller() -> _Controller:
+    mock = Mock()
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    mapper.set_default_type_mapper(ObjectMapper)
+    mapper.add_type_mapper(Type(IntegerMapper), match_all=False)
+    mapper.add_type_mapper(Type(StringMapper), match_all=False)
+    mapper.add_type_mapper(Type(SequenceMapper), match_all=True)
+    entities = [_Entity(id=1, name="first", secret="1"), _Entity(id=2, name="second", secret="2")]
+    return _Controller(_Service(entities), mapper)
+
+
+async def test_get_all_serializes_entities() -> None:
+    async def get_all(self: Any) -> list[_Dto]: ...
+
+    route = autoroute.get_all(get_all)
+    result = await route(_create_controller())  # pyright: ignore
+
+    assert isinstance(result, JsonBytes)
+    assert json.loads(result) == [{"id": 1, "name": "first"}, {"id": 2, "name": "second"}]
+
+
+async def test_get_one_serializes_entity() -> None:
+    async def get_one(self: Any) -> _Dto: ...
+
+    route = autoroute.get_one(get_one)
+    result = await route(_create_controller(), "2")  # pyright: ignore
+
+    assert isinstance(result, JsonBytes)
+    assert json.loads(result) == {"id": 2, "name": "second"}
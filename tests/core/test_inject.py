@@ -7,7 +7,9 @@ import pytest
 from bolinette.core import Cache
 from bolinette.core.exceptions import InjectionError, TypingError, UnregisteredTypeError
 from bolinette.core.injection import Injection, after_init, before_init, injectable, post_init, require
+from bolinette.core.injection.plan import ResolutionPlanCache
 from bolinette.core.injection.resolver import ArgResolverOptions, injection_arg_resolver
+from bolinette.core.types import Function, TypeVarLookup
 from bolinette.core.types.type import Type
 
 
@@ -1621,3 +1623,270 @@ def test_post_init_called_once() -> None:
     inject.require(Service)
 
     assert passed["count"] == 1
+
+
+def test_resolution_plan_cached() -> None:
+    def _test_func(b: InjectableClassB, value: int = 0) -> None:
+        pass
+
+    plans = ResolutionPlanCache()
+    plan = plans.get(Function(_test_func), None)
+
+    assert plans.get(Function(_test_func), None) is plan
+    assert [s.name for s in plan.slots] == ["b", "value"]
+    assert plan.slots[0].hint == Type(InjectableClassB)
+    assert len(plans) == 1
+
+
+def test_resolution_plan_per_lookup() -> None:
+    class _Service[T]:
+        def __init__(self, value: T) -> None:
+            self.value = value
+
+    plans = ResolutionPlanCache()
+    int_plan = plans.get(Type(_Service[int]), TypeVarLookup(Type(_Service[int])))
+    str_plan = plans.get(Type(_Service[str]), TypeVarLookup(Type(_Service[str])))
+
+    assert int_plan is not str_plan
+    assert int_plan.slots[0].hint == Type(int)
+    assert str_plan.slots[0].hint == Type(str)
+    assert plans.get(Type(_Service[int]), TypeVarLookup(Type(_Service[int]))) is int_plan
+
+
+def test_resolution_plan_shared_with_scoped_sessions() -> None:
+    cache = Cache()
+    calls: list[tuple[InjectableClassB, str]] = []
+
+    def _test_func(b: InjectableClassB, value: str) -> None:
+        calls.append((b, value))
+
+    inject = Injection(cache)
+    inject.add_singleton(InjectableClassB)
+
+    inject.call(_test_func, named_args={"value": "root"})
+    with inject.get_scoped_session() as scoped:
+        scoped.call(_test_func, named_args={"value": "scoped"})
+
+    assert [c[1] for c in calls] == ["root", "scoped"]
+    assert calls[0][0] is calls[1][0]
+
+
+def test_resolution_plan_deferred_errors() -> None:
+    def _test_func(a, b: int | str) -> None:
+        pass
+
+    inject = Injection(Cache())
+    inject.call(_test_func, args=["a", 1])
+
+    with pytest.raises(InjectionError) as info:
+        inject.call(_test_func, args=["a"])
+
+    assert (
+        "Callable test_resolution_plan_deferred_errors.<locals>._test_func, Parameter 'b', "
+        "Type unions are not allowed" == info.value.message
+    )
+
+
+def test_hook_proxies_reused_across_instances() -> None:
+    class _Service:
+        def __init__(self, b: InjectableClassB) -> None:
+            self.b = b
+
+    inject = Injection(Cache())
+    inject.add_singleton(InjectableClassB)
+    inject.add_transient(_Service)
+
+    s1 = inject.require(_Service)
+    proxy = vars(_Service)["b"]
+    s2 = inject.require(_Service)
+
+    assert vars(_Service)["b"] is proxy
+    assert s1 is not s2
+    assert s1.b is s2.b
+    assert isinstance(s2.b, InjectableClassB)
+
+
+def test_hook_proxies_keep_instance_context() -> None:
+    class _ScopedDep:
+        pass
+
+    class _SingletonI:
+        pass
+
+    class _ScopedI:
+        pass
+
+    class _Shared(_SingletonI, _ScopedI):
+        def __init__(self, dep: _ScopedDep) -> None:
+            self.dep = dep
+
+    inject = Injection(Cache())
+    inject.add_scoped(_ScopedDep)
+    inject.add_singleton(_SingletonI, _Shared)
+    inject.add_scoped(_ScopedI, _Shared)
+
+    scoped = inject.get_scoped_session()
+    s1 = scoped.require(_ScopedI)
+    s2 = inject.require(_SingletonI)
+
+    assert s1 is not s2
+    assert isinstance(s1, _Shared) and isinstance(s2, _Shared)
+    assert isinstance(s1.dep, _ScopedDep)
+
+    with pytest.raises(InjectionError) as info:
+        _ = s2.dep
+
+    assert "Cannot instantiate a scoped service in a singleton service" in info.value.message
+
+
+def test_hook_proxies_inherited_by_subclass() -> None:
+    class _Dep:
+        pass
+
+    class _Other:
+        pass
+
+    class _Base:
+        @require(_Dep)
+        def dep(self):
+            pass
+
+    class _Service(_Base):
+        @require(_Other)
+        def other(self):
+            pass
+
+    class _Child(_Base):
+        pass
+
+    inject = Injection(Cache())
+    inject.add_singleton(_Dep)
+    inject.add_singleton(_Other)
+    inject.add_singleton(_Base)
+    inject.add_singleton(_Service)
+    inject.add_singleton(_Child)
+
+    base = inject.require(_Base)
+    service = inject.require(_Service)
+    child = inject.require(_Child)
+
+    assert isinstance(base.dep, _Dep)
+    assert isinstance(service.other, _Other)
+    assert service.dep is base.dep
+    assert child.dep is base.dep
+
+
+def test_post_init_plan_reused_across_instances() -> None:
+    order: list[str] = []
+
+    class _Base:
+        @post_init
+        def init(self) -> None:
+            order.append("base")
+
+    class _Service(_Base):
+        @post_init
+        def init(self) -> None:
+            order.append("service")
+
+    inject = Injection(Cache())
+    inject.add_transient(_Service)
+
+    inject.require(_Service)
+    inject.require(_Service)
+    inject.instantiate(_Service)
+
+    assert order == ["base", "service"] * 3
+
+
+def test_post_init_with_builtin_base() -> None:
+    order: list[str] = []
+
+    class _Service(dict[str, int]):
+        def __init__(self) -> None:
+            super().__init__()
+
+        @post_init
+        def init(self) -> None:
+            self["value"] = 1
+            order.append("service")
+
+    inject = Injection(Cache())
+    inject.add_transient(_Service)
+
+    s1 = inject.require(_Service)
+    s2 = inject.require(_Service)
+
+    assert s1 == s2 == {"value": 1}
+    assert order == ["service", "service"]
+
+
+def test_scoped_resolvers_created_lazily() -> None:
+    cache = Cache()
+
+    class _Service:
+        pass
+
+    created: list[object] = []
+
+    class _Resolver:
+        def __init__(self) -> None:
+            created.append(self)
+
+        def supports(self, options: ArgResolverOptions) -> bool:
+            return options.t.cls is _Service
+
+        def resolve(self, options: ArgResolverOptions) -> Any:
+            return _Service()
+
+    injection_arg_resolver(cache=cache, scoped=True)(_Resolver)
+
+    inject = Injection(cache)
+    inject.add_singleton(InjectableClassB)
+
+    scoped = inject.get_scoped_session()
+    assert isinstance(scoped.require(InjectableClassB), InjectableClassB)
+    assert created == []
+
+    assert isinstance(scoped.require(_Service), _Service)
+    assert isinstance(scoped.require(_Service), _Service)
+    assert len(created) == 1
+
+    with scoped.get_scoped_session() as sub_scoped:
+        assert isinstance(sub_scoped.require(_Service), _Service)
+    assert len(created) == 1
+
+    assert isinstance(inject.get_scoped_session().require(_Service), _Service)
+    assert len(created) == 2
+
+
+def test_scoped_resolvers_retried_after_failure() -> None:
+    cache = Cache()
+
+    class _Service:
+        pass
+
+    attempts: list[object] = []
+
+    class _Resolver:
+        def __init__(self) -> None:
+            attempts.append(self)
+            if len(attempts) == 1:
+                raise ValueError()
+
+        def supports(self, options: ArgResolverOptions) -> bool:
+            return options.t.cls is _Service
+
+        def resolve(self, options: ArgResolverOptions) -> Any:
+            return _Service()
+
+    injection_arg_resolver(cache=cache, scoped=True)(_Resolver)
+
+    inject = Injection(cache)
+    scoped = inject.get_scoped_session()
+
+    with pytest.raises(ValueError):
+        scoped.require(_Service)
+
+    assert isinstance(scoped.require(_Service), _Service)
+    assert len(attempts) == 2
@@ -1,4 +1,7 @@
 # pyright: reportUninitializedInstanceVariable=false
+import json
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, Literal, NotRequired, TypedDict, override
 
 import pytest
@@ -6,8 +9,23 @@ import pytest
 from bolinette.core import Cache
 from bolinette.core.expressions import ExpressionNode
 from bolinette.core.expressions.exceptions import MaxDepthExpressionError
-from bolinette.core.mapping import Mapper, MappingRunner, MappingWorker, Profile, mapping, mapping_worker
-from bolinette.core.mapping.exceptions import MappingError
+from bolinette.core.mapping import (
+    JsonBytes,
+    JsonCodec,
+    Mapper,
+    MappingRunner,
+    MappingWorker,
+    Profile,
+    StdJsonCodec,
+    mapping,
+    mapping_worker,
+)
+from bolinette.core.mapping.exceptions import (
+    DestinationNotNullableError,
+    InstantiationError,
+    MappingError,
+    ValidationError,
+)
 from bolinette.core.mapping.mapper import (
     BoolMapper,
     DictMapper,
@@ -1303,3 +1321,383 @@ def test_fail_map_literal_no_match() -> None:
         "From source path 'dict[Any, Any]['type']', "
         "Could not match value 4.5 to possible values (0, 'value')" == info.value.message
     )
+
+
+def test_map_compiled_mapping_cached() -> None:
+    class _Source:
+        def __init__(self, id: int, name: str) -> None:
+            self.id = id
+            self.name = name
+
+    class _Destination:
+        id: int
+        name: str
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    dest1 = mapper.map(_Source, _Destination, _Source(1, "first"))
+    compiled = mapper.runner.compile(Type(_Source), Type(_Destination))
+    dest2 = mapper.map(_Source, _Destination, _Source(2, "second"))
+
+    assert compiled is not None
+    assert mapper.runner.compile(Type(_Source), Type(_Destination)) is compiled
+    assert dest1.id == 1 and dest1.name == "first"
+    assert dest2.id == 2 and dest2.name == "second"
+
+
+def test_map_compiled_mapping_falls_back_on_error() -> None:
+    class _Destination:
+        id: int
+        name: str
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    assert mapper.map(dict, _Destination, {"id": "1", "name": "test"}).id == 1
+
+    with pytest.raises(MappingError) as info:
+        mapper.map(dict, _Destination, {"id": 1})
+
+    assert (
+        "Destination path 'test_map_compiled_mapping_falls_back_on_error.<locals>._Destination.name', "
+        "From source path 'dict[Any, Any]['name']', "
+        "Source path not found, could not bind a None value to non nullable type str" == info.value.message
+    )
+
+
+def test_map_callbacks_not_compiled() -> None:
+    class _Destination:
+        id: int
+        name: str
+
+    calls: list[str] = []
+
+    class _Profile(Profile):
+        def __init__(self) -> None:
+            super().__init__()
+            (
+                self.register(dict, _Destination)
+                .before_mapping(lambda s, d: calls.append("before"))
+                .after_mapping(lambda s, d: calls.append("after"))
+            )
+
+    cache = Cache()
+    mapping(cache=cache)(_Profile)
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    with pytest.raises(MappingError):
+        mapper.map(dict, _Destination, {"id": 1})
+
+    assert calls == ["before"]
+    assert mapper.runner.compile(Type(dict), Type(_Destination)) is None
+
+    calls.clear()
+    mapper.map(dict, _Destination, {"id": 1, "name": "test"})
+
+    assert calls == ["before", "after"]
+
+
+def test_map_many() -> None:
+    class _Source:
+        def __init__(self, id: int) -> None:
+            self.id = id
+
+    class _Destination:
+        id: int
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    mapped = mapper.map_many(_Source, _Destination, (_Source(i) for i in range(3)))
+
+    assert not isinstance(mapped, list)
+    assert [d.id for d in mapped] == [0, 1, 2]
+
+
+def test_fail_map_many() -> None:
+    class _Destination:
+        id: int
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    mapped = mapper.map_many(dict, _Destination, [{"id": 1}, {}, None])
+
+    assert next(mapped).id == 1
+    with pytest.raises(MappingError) as info:
+        next(mapped)
+
+    assert (
+        "Destination path 'list[test_fail_map_many.<locals>._Destination][1].id', "
+        "From source path 'list[dict][1]['id']', "
+        "Source path not found, could not bind a None value to non nullable type int" == info.value.message
+    )
+
+
+def test_fail_map_many_validate() -> None:
+    class _Destination:
+        id: int
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    with pytest.raises(ValidationError) as info:
+        list(mapper.map_many(dict, _Destination, [{}, {"id": 2}, None], validate=True))
+
+    assert len(info.value.errors) == 3
+
+
+def test_map_many_callbacks_run_once() -> None:
+    class _Destination:
+        id: int
+        name: str
+
+    calls: list[int] = []
+
+    class _Profile(Profile):
+        def __init__(self) -> None:
+            super().__init__()
+            self.register(dict, _Destination).before_mapping(lambda s, d: calls.append(s["id"]))
+
+    cache = Cache()
+    mapping(cache=cache)(_Profile)
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    mapped = mapper.map_many(dict, _Destination, [{"id": 1, "name": "test"}, {"id": 2}])
+
+    assert next(mapped).name == "test"
+    with pytest.raises(MappingError):
+        next(mapped)
+
+    assert calls == [1, 2]
+
+
+def test_serialize() -> None:
+    class _Source:
+        def __init__(self, id: int, content: str, secret: str) -> None:
+            self.id = id
+            self.content = content
+            self.secret = secret
+
+    class _Child:
+        value: int
+
+    class _Destination:
+        id: int
+        name: str
+        secret: str | None
+        children: list[_Child]
+
+    class _Profile(Profile):
+        def __init__(self) -> None:
+            super().__init__()
+            (
+                self.register(_Source, _Destination)
+                .for_attr(lambda d: d.name, lambda opt: opt.map_from(lambda s: s.content))
+                .for_attr(lambda d: d.secret, lambda opt: opt.ignore())
+            )
+
+    cache = Cache()
+    mapping(cache=cache)(_Profile)
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    src = _Source(1, "test", "password")
+    src.children = [{"value": 1}, {"value": "2"}]  # pyright: ignore[reportAttributeAccessIssue]
+    serialized = mapper.serialize(_Source, _Destination, src)
+
+    assert isinstance(serialized, JsonBytes)
+    assert json.loads(serialized) == {
+        "id": 1,
+        "name": "test",
+        "secret": None,
+        "children": [{"value": 1}, {"value": 2}],
+    }
+    assert mapper.runner.compile_projection(Type(_Source), Type(_Destination)) is not None
+
+
+def test_serialize_falls_back_to_mapping() -> None:
+    class _Source:
+        def __init__(self, id: int) -> None:
+            self.id = id
+
+    class _Destination:
+        id: int
+        label: str | None
+
+    class _Profile(Profile):
+        def __init__(self) -> None:
+            super().__init__()
+            (
+                self.register(_Source, _Destination)
+                .for_attr(lambda d: d.label, lambda opt: opt.ignore())
+                .after_mapping(lambda s, d: setattr(d, "label", f"#{s.id}"))
+            )
+
+    cache = Cache()
+    mapping(cache=cache)(_Profile)
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    assert json.loads(mapper.serialize(_Source, _Destination, _Source(1))) == {"id": 1, "label": "#1"}
+    assert mapper.runner.compile_projection(Type(_Source), Type(_Destination)) is None
+
+    with pytest.raises(MappingError):
+        mapper.serialize(dict, _Destination, {})
+
+
+def test_serialize_nullable_projectors() -> None:
+    class _Source:
+        def __init__(self, first: int | None, second: int) -> None:
+            self.first = first
+            self.second = second
+
+    class _Optional:
+        first: int | None
+        second: int
+
+    class _Required:
+        first: int
+        second: int
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    assert json.loads(mapper.serialize(_Source, _Optional, _Source(None, 2))) == {"first": None, "second": 2}
+
+    with pytest.raises(DestinationNotNullableError):
+        mapper.serialize(_Source, _Required, _Source(None, 2))
+
+
+def test_serialize_no_projection_without_annotations() -> None:
+    class _Source:
+        def __init__(self, id: int, created: datetime) -> None:
+            self.id = id
+            self.created = created
+
+    class _Destination:
+        id: int
+        created: datetime
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    with pytest.raises(InstantiationError):
+        mapper.serialize(_Source, _Destination, _Source(1, datetime(2024, 1, 1)))
+
+    assert mapper.runner.compile_projection(Type(datetime), Type(datetime)) is None
+
+
+def test_serialize_runs_destination_init() -> None:
+    class _Source:
+        def __init__(self, first: str, last: str) -> None:
+            self.first = first
+            self.last = last
+
+    class _WithInit:
+        first: str
+        last: str
+
+        def __init__(self, first: str, last: str) -> None:
+            self.first = first
+            self.last = last
+            self.full = f"{first} {last}"
+
+    @dataclass
+    class _WithPostInit:
+        first: str
+        last: str
+
+        def __post_init__(self) -> None:
+            self.initials = f"{self.first[0]}{self.last[0]}"
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    assert json.loads(mapper.serialize(_Source, _WithInit, _Source("John", "Doe"))) == {
+        "first": "John",
+        "last": "Doe",
+        "full": "John Doe",
+    }
+    assert json.loads(mapper.serialize(_Source, _WithPostInit, _Source("John", "Doe"))) == {
+        "first": "John",
+        "last": "Doe",
+        "initials": "JD",
+    }
+    assert mapper.runner.compile_projection(Type(_Source), Type(_WithInit)) is None
+    assert mapper.runner.compile_projection(Type(_Source), Type(_WithPostInit)) is None
+
+
+def test_serialize_uses_injected_codec() -> None:
+    class _Source:
+        def __init__(self, id: int) -> None:
+            self.id = id
+
+    class _Destination:
+        id: int
+
+    class _Codec(StdJsonCodec):
+        @override
+        def encode(self, value: Any) -> bytes:
+            return b"encoded:" + super().encode(value)
+
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(JsonCodec, _Codec)
+    mock.injection.add_singleton(Mapper)
+    mapper = mock.injection.require(Mapper)
+    load_default_mappers(mapper)
+
+    serialized = mapper.serialize(_Source, _Destination, _Source(1))
+
+    assert isinstance(serialized, JsonBytes)
+    assert serialized == b'encoded:{"id": 1}'
+
+
+def test_std_json_codec() -> None:
+    class _Value:
+        def __init__(self, id: int, tags: set[str]) -> None:
+            self.id = id
+            self.tags = tags
+
+    codec = StdJsonCodec()
+
+    assert codec.encode({"value": _Value(1, {"a"})}) == b'{"value": {"id": 1, "tags": ["a"]}}'
+    assert codec.encode(JsonBytes(b'{"id": 1}')) == b'{"id": 1}'
+    assert codec.decode(b'{"id": 1}') == {"id": 1}
+    assert codec.decode('{"id": 1}') == {"id": 1}
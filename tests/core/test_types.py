@@ -1,14 +1,16 @@
 # pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false
 # pyright: reportUnknownVariableType=false, reportGeneralTypeIssues=false
+import gc
+import weakref
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any, ForwardRef, Generic, NotRequired, TypedDict, TypeVar
+from typing import Annotated, Any, ForwardRef, Generic, NotRequired, TypedDict, TypeVar
 
 import pytest
 
 from bolinette.core.exceptions import TypingError
 from bolinette.core.testing import Mock
-from bolinette.core.types import Type, TypeVarLookup
+from bolinette.core.types import Function, Type, TypeVarLookup
 from bolinette.core.types.checker import (
     DefaultTypeChecker,
     ProtocolTypeChecker,
@@ -366,3 +368,164 @@ def test_get_bases_generic_child() -> None:
 
     c_t = Type(Child[str])
     assert c_t.bases == (Type(Parent[str]),)
+
+
+def test_interned_type() -> None:
+    class _T:
+        pass
+
+    t = Type.of(_T)
+
+    assert t is Type.of(_T)
+    assert t == Type(_T)
+    assert t is not Type(_T)
+
+
+def test_interned_generic_type() -> None:
+    class _T[T]:
+        pass
+
+    assert Type.of(_T[int]) is Type.of(_T[int])
+    assert Type.of(_T[int]) is not Type.of(_T[str])
+    assert Type.of(_T[int]).vars == (int,)
+
+
+def test_interned_type_with_lookup() -> None:
+    class _T[T]:
+        pass
+
+    T = TypeVar("T")
+    int_t = Type.of(_T[T], lookup={T: int})
+    str_t = Type.of(_T[T], lookup={T: str})
+
+    assert int_t is Type.of(_T[T], lookup={T: int})
+    assert int_t.vars == (int,)
+    assert str_t.vars == (str,)
+
+
+def test_interned_type_keeps_annotations() -> None:
+    class _T:
+        pass
+
+    t = Type.of(_T)
+    nullable_t = Type.of(_T | None)
+    annotated_t = Type.of(Annotated[_T, "value"])
+
+    assert not t.nullable
+    assert nullable_t.nullable
+    assert annotated_t.annotated == ["value"]
+    assert t == nullable_t == annotated_t
+
+
+def test_interned_generic_forms_do_not_keep_classes_alive() -> None:
+    class _T:
+        pass
+
+    ref = weakref.ref(_T)
+    Type.of(list[_T])
+    Type.of(_T | None)
+    Type.of(dict[str, _T])
+
+    assert Type.of(list[_T]) is Type.of(list[_T])
+
+    del _T
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_intern_stats() -> None:
+    class _T:
+        pass
+
+    stats = Type.intern_stats()
+    hits, misses = stats.hits, stats.misses
+
+    Type.of(_T)
+    Type.of(_T)
+    Type.of(_T)
+
+    assert stats.misses == misses + 1
+    assert stats.hits == hits + 2
+    assert 0 < stats.hit_rate <= 1
+
+
+def test_cached_annotations_and_parameters() -> None:
+    class _T:
+        value: int
+
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+    t = Type(_T)
+    annotations = t.annotations()
+    parameters = t.parameters()
+
+    assert annotations == {"value": Type(int)}
+    assert [*parameters] == ["value"]
+    assert t.annotations() is annotations
+    assert t.parameters() is parameters
+
+    t.clear_cache()
+
+    assert t.annotations() is not annotations
+    assert t.annotations() == annotations
+    assert t.parameters() is not parameters
+
+
+def test_annotations_not_cached_with_unresolved_forward_ref() -> None:
+    global _LateDefined
+
+    class _T:
+        x: int
+        b: "_LateDefined"
+
+    t = Type(_T)
+
+    assert t.annotations() == {}
+
+    class _LateDefined:
+        pass
+
+    try:
+        assert t.annotations() == {"x": Type(int), "b": Type(_LateDefined)}
+        assert t.annotations() is t.annotations()
+    finally:
+        del _LateDefined
+
+
+def test_function_annotations_per_lookup() -> None:
+    class _A:
+        pass
+
+    class _B:
+        pass
+
+    class _Repository[T]:
+        def get(self, value: T) -> T:
+            return value
+
+    func = Function(_Repository.get)
+    a_annotations = func.annotations(lookup=TypeVarLookup(Type(_Repository[_A])))
+    b_annotations = func.annotations(lookup=TypeVarLookup(Type(_Repository[_B])))
+
+    assert a_annotations["value"] == Type(_A)
+    assert b_annotations["value"] == Type(_B)
+    assert func.annotations(lookup=TypeVarLookup(Type(_Repository[_A]))) is a_annotations
+
+
+def test_function_annotations_cache_is_bounded() -> None:
+    class _Repository[T]:
+        def get(self, value: T) -> T:
+            return value
+
+    func = Function(_Repository.get)
+    classes = [type(f"_E{i}", (), {}) for i in range(Function.ANNOTATIONS_CACHE_SIZE + 1)]
+    first = func.annotations(lookup=TypeVarLookup(Type(_Repository[classes[0]])))
+    for cls in classes[1:]:
+        func.annotations(lookup=TypeVarLookup(Type(_Repository[cls])))
+
+    again = func.annotations(lookup=TypeVarLookup(Type(_Repository[classes[0]])))
+
+    assert again is not first
+    assert again == first
@@ -1,8 +1,11 @@
-from typing import override
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, override
 
 import pytest
 from sqlalchemy import Integer, String, Table, UniqueConstraint
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, mapped_column
+from sqlalchemy.pool import AsyncAdaptedQueuePool, SingletonThreadPool, StaticPool
 
 from bolinette.core import Cache, meta
 from bolinette.core.exceptions import InitError
@@ -10,7 +13,7 @@ from bolinette.core.logging import Logger
 from bolinette.core.testing import Mock
 from bolinette.data import DatabaseManager
 from bolinette.data.databases import DatabaseConnection
-from bolinette.data.exceptions import EntityError
+from bolinette.data.exceptions import DatabaseError, EntityError
 from bolinette.data.relational import (
     AbstractDatabase,
     AsyncRelationalDatabase,
@@ -18,13 +21,18 @@ from bolinette.data.relational import (
     DeclarativeMeta,
     EntityManager,
     EntityMeta,
+    EntitySession,
+    PoolStatistics,
+    RelationalDatabase,
     Repository,
     repository,
 )
 
 
 class _MockedRelationalDatabase(AsyncRelationalDatabase):
-    def __init__(self, base: type[DeclarativeBase], name: str, uri: str, echo: bool):
+    def __init__(
+        self, base: type[DeclarativeBase], name: str, uri: str, echo: bool, options: dict[str, Any] | None = None
+    ):
         pass
 
 
@@ -43,6 +51,7 @@ def mock_db_manager(mock: Mock, engine_type: type[AsyncRelationalDatabase] | Non
         mock.mock(DatabaseManager)
         .setup_callable(lambda m: m.has_connection, lambda name: True)
         .setup_callable(lambda m: m.get_connection, _get_connection)
+        .setup(lambda m: m.executor, ThreadPoolExecutor(1))
     )
 
 
@@ -103,6 +112,7 @@ def test_fail_init_engines_non_relational_system() -> None:
         mock.mock(DatabaseManager)
         .setup_callable(lambda m: m.has_connection, lambda name: True)
         .setup_callable(lambda m: m.get_connection, _get_connection)
+        .setup(lambda m: m.executor, ThreadPoolExecutor(1))
     )
 
     with pytest.raises(EntityError) as info:
@@ -120,7 +130,9 @@ async def test_create_all() -> None:
     visited: list[str] = []
 
     class _MockedRelationalDatabase(AsyncRelationalDatabase):
-        def __init__(self, base: type[DeclarativeBase], name: str, uri: str, echo: bool):
+        def __init__(
+            self, base: type[DeclarativeBase], name: str, uri: str, echo: bool, options: dict[str, Any] | None = None
+        ):
             self._name = name
 
         @override
@@ -148,19 +160,26 @@ async def test_open_sessions() -> None:
     visited: list[str] = []
 
     class _MockedRelationalDatabase(AsyncRelationalDatabase):
-        def __init__(self, base: type[DeclarativeBase], name: str, uri: str, echo: bool):
+        def __init__(
+            self, base: type[DeclarativeBase], name: str, uri: str, echo: bool, options: dict[str, Any] | None = None
+        ):
             self._name = name
 
         @override
         def open_session(self, sessions: AsyncTransaction, /) -> None:
             visited.append(self._name)
+            sessions.add(self._name, EntitySession(AsyncSession()))
 
     create_entity_base(cache)
     mock_db_manager(mock, _MockedRelationalDatabase)
 
     async with mock.injection.get_async_scoped_session() as scoped_inject:
-        scoped_inject.require(AsyncTransaction)
+        transaction = scoped_inject.require(AsyncTransaction)
 
+    assert visited == []
+    assert "test" in transaction
+
+    assert transaction.get("test") is transaction.get("test")
     assert visited == ["test"]
 
 
@@ -293,3 +312,60 @@ def test_fail_init_repositories_unused_repository() -> None:
         mock.injection.require(EntityManager)
 
     assert f"Repository {_EntityRepository}, entity {entity_type} is not a registered entity type" == info.value.message
+
+
+def test_pool_statistics() -> None:
+    cache = Cache()
+
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(EntityManager)
+    mock.injection.add_singleton(PoolStatistics)
+
+    def _get_connection(name: str) -> DatabaseConnection:
+        return DatabaseConnection(
+            name,
+            "sqlite+aiosqlite:///:memory:",
+            False,
+            AsyncRelationalDatabase,
+            {"pool_size": 3, "max_overflow": 2, "pool_timeout": 5, "poolclass": AsyncAdaptedQueuePool},
+        )
+
+    (
+        mock.mock(DatabaseManager)
+        .setup_callable(lambda m: m.has_connection, lambda name: True)
+        .setup_callable(lambda m: m.get_connection, _get_connection)
+        .setup(lambda m: m.executor, ThreadPoolExecutor(1))
+    )
+    create_entity_base(cache)
+
+    pools = mock.injection.require(PoolStatistics)
+    stats = pools.get("test")
+
+    assert [s.name for s in pools.all()] == ["test"]
+    assert stats.name == "test"
+    assert stats.size == 3
+    assert stats.checked_out == 0
+    assert stats.overflow == -3
+    assert stats.timeout == 5
+
+    with pytest.raises(DatabaseError) as info:
+        pools.get("other")
+
+    assert "Database connection 'other', No relational engine was found" == info.value.message
+
+
+async def test_in_memory_engines_pool_options() -> None:
+    cache = Cache()
+    base = create_entity_base(cache)
+    options = {"pool_size": 20, "max_overflow": 5, "pool_timeout": 2.5, "pool_pre_ping": True}
+
+    engine = RelationalDatabase(base, "test", "sqlite://", False, options)
+    async_engine = AsyncRelationalDatabase(base, "test", "sqlite+aiosqlite://", False, options)
+
+    assert isinstance(engine.pool, SingletonThreadPool)
+    assert isinstance(async_engine.pool, StaticPool)
+
+    await engine.create_all()
+    await async_engine.create_all()
+    await engine.dispose()
+    await async_engine.dispose()
@@ -0,0 +1,29 @@
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from bolinette.data.relational.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    values = [
+        1,
+        "name",
+        None,
+        True,
+        datetime(2024, 1, 2, 3, 4, 5),
+        date(2024, 1, 2),
+        UUID("2f1c3d7e-0b5a-4f4e-9d4c-8c3b7a6f5e4d"),
+        Decimal("1.50"),
+    ]
+
+    cursor = encode_cursor(values)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == values
+
+
+def test_decode_invalid_cursor() -> None:
+    assert decode_cursor("not a cursor") is None
+    assert decode_cursor(encode_cursor([{"x": 1}])) is None
+    assert decode_cursor("eyJhIjoxfQ") is None
@@ -3,13 +3,15 @@ from typing import Any
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from bolinette.core import Cache, meta
 from bolinette.core.testing import Mock
 from bolinette.core.types import Type
-from bolinette.data.exceptions import DataError, EntityNotFoundError
+from bolinette.data.exceptions import DataError, EntityNotFoundError, InvalidCursorError
 from bolinette.data.relational import EntitySession, Repository, declarative_base, entity, repository
+from bolinette.data.relational.pagination import encode_cursor
 from bolinette.data.relational.repository import RepositoryMeta
 
 
@@ -52,14 +54,11 @@ async def test_iterate() -> None:
     e1 = Entity()
     e2 = Entity()
 
-    class _MockedResult:
-        def scalars(self):
-            return [e1, e2]
-
-    async def _execute(*_: Any):
-        return _MockedResult()
+    async def _stream(*_: Any, batch_size: int):
+        yield [e1]
+        yield [e2]
 
-    mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.stream, _stream)
     mock.injection.add_singleton(Repository[Entity])
 
     repo = mock.injection.require(Repository[Entity])
@@ -88,14 +87,11 @@ async def test_find_all() -> None:
     e1 = Entity()
     e2 = Entity()
 
-    class _MockedResult:
-        def scalars(self):
-            return [e1, e2]
+    async def _stream(*_: Any, batch_size: int):
+        yield [e1]
+        yield [e2]
 
-    async def _execute(*_: Any):
-        return _MockedResult()
-
-    mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.stream, _stream)
     mock.injection.add_singleton(Repository[Entity])
 
     repo = mock.injection.require(Repository[Entity])
@@ -107,6 +103,122 @@ async def test_find_all() -> None:
     assert res == [e1, e2]
 
 
+async def test_stream() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    mock = Mock(cache=cache)
+
+    entities = [Entity(id=i) for i in range(5)]
+    batch_sizes: list[int] = []
+
+    async def _stream(*_: Any, batch_size: int):
+        batch_sizes.append(batch_size)
+        for i in range(0, len(entities), batch_size):
+            yield entities[i : i + batch_size]
+
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.stream, _stream)
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    res: list[Entity] = []
+    async for e in repo.stream(select(Entity), batch_size=2):
+        res.append(e)
+
+    assert res == entities
+    assert batch_sizes == [2]
+
+
+async def test_paginate() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    mock = Mock(cache=cache)
+
+    entities = [Entity(id=i, name=f"e{i}") for i in range(5)]
+    statements: list[str] = []
+
+    class _MockedResult:
+        def __init__(self, items: list[Entity]) -> None:
+            self.items = items
+
+        def scalars(self):
+            return self.items
+
+    async def _execute(statement: Any):
+        statements.append(str(statement.compile(compile_kwargs={"literal_binds": True})))
+        if len(statements) == 1:
+            return _MockedResult(entities[:3])
+        return _MockedResult(entities[2:4])
+
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    page = await repo.paginate(limit=2, order_by=[Entity.name])
+
+    assert page.items == entities[:2]
+    assert page.has_next
+    assert page.next_cursor is not None
+    assert "ORDER BY entities.name ASC, entities.id ASC" in statements[0]
+    assert "LIMIT 3" in statements[0]
+
+    page = await repo.paginate(limit=2, cursor=page.next_cursor, order_by=[Entity.name])
+
+    assert page.items == entities[2:4]
+    assert not page.has_next
+    assert page.next_cursor is None
+    assert "WHERE (entities.name, entities.id) > ('e1', 1)" in statements[1]
+
+
+async def test_fail_paginate_invalid_cursor() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    mock = Mock(cache=cache)
+
+    mock.mock(EntitySession[Entity])
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    with pytest.raises(InvalidCursorError) as info:
+        await repo.paginate(limit=2, cursor=encode_cursor([1]), order_by=[Entity.name])
+
+    assert info.value.entity is Entity
+
+    with pytest.raises(InvalidCursorError):
+        await repo.paginate(limit=2, cursor="not a cursor")
+
+
 async def test_first() -> None:
     cache = Cache()
 
@@ -218,15 +330,13 @@ async def test_get_by_primary() -> None:
     mock = Mock(cache=cache)
 
     e1 = Entity()
+    idents: list[Any] = []
 
-    class _MockedResult:
-        def scalar_one_or_none(self):
-            return e1
-
-    async def _execute(*_: Any):
-        return _MockedResult()
+    async def _get(entity: type[Entity], ident: Any):
+        idents.append((entity, ident))
+        return e1
 
-    mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.get, _get)
     mock.injection.add_singleton(Repository[Entity])
 
     repo = mock.injection.require(Repository[Entity])
@@ -234,6 +344,7 @@ async def test_get_by_primary() -> None:
     res = await repo.get_by_primary(1)
 
     assert res == e1
+    assert idents == [(Entity, 1)]
 
 
 async def test_get_by_primary_none() -> None:
@@ -250,14 +361,10 @@ async def test_get_by_primary_none() -> None:
 
     mock = Mock(cache=cache)
 
-    class _MockedResult:
-        def scalar_one_or_none(self):
-            return None
-
-    async def _execute(*_: Any):
-        return _MockedResult()
+    async def _get(*_: Any):
+        return None
 
-    mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.get, _get)
     mock.injection.add_singleton(Repository[Entity])
 
     repo = mock.injection.require(Repository[Entity])
@@ -281,11 +388,44 @@ async def test_fail_get_by_primary_none() -> None:
 
     mock = Mock(cache=cache)
 
+    async def _get(*_: Any):
+        return None
+
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.get, _get)
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    with pytest.raises(EntityNotFoundError) as info:
+        await repo.get_by_primary(1)
+
+    assert f"Entity {Entity} not found" == info.value.message
+
+
+async def test_get_many_by_primary() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    mock = Mock(cache=cache)
+
+    e1 = Entity(id=1)
+    e3 = Entity(id=3)
+    statements: list[str] = []
+
     class _MockedResult:
-        def scalar_one_or_none(self):
-            return None
+        def scalars(self):
+            return [e1, e3]
 
-    async def _execute(*_: Any):
+    async def _execute(statement: Any):
+        statements.append(str(statement.compile(compile_kwargs={"literal_binds": True})))
         return _MockedResult()
 
     mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
@@ -293,10 +433,62 @@ async def test_fail_get_by_primary_none() -> None:
 
     repo = mock.injection.require(Repository[Entity])
 
-    with pytest.raises(EntityNotFoundError) as info:
-        await repo.get_by_primary(1)
+    assert await repo.get_many_by_primary([3, 2, 1], raises=False) == [e3, None, e1]
+    assert statements == [
+        "SELECT entities.id \nFROM entities \nWHERE entities.id IN (3, 2, 1)",
+    ]
+
+    with pytest.raises(EntityNotFoundError):
+        await repo.get_many_by_primary([3, 2, 1])
+
+    assert await repo.get_many_by_primary([3, 1]) == [e3, e1]
+    assert await repo.get_many_by_primary([]) == []
+    assert len(statements) == 3
+
+    assert await repo.get_many_by_primary(["3", "1"]) == [e3, e1]
+    assert statements[3] == "SELECT entities.id \nFROM entities \nWHERE entities.id IN (3, 1)"
 
-    assert f"Entity {Entity} not found" == info.value.message
+
+async def test_get_many_by_composite_primary() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id1: Mapped[int] = mapped_column(primary_key=True)
+        id2: Mapped[str] = mapped_column(primary_key=True)
+
+    mock = Mock(cache=cache)
+
+    e1 = Entity(id1=1, id2="a")
+    e2 = Entity(id1=1, id2="b")
+    statements: list[str] = []
+
+    class _MockedResult:
+        def scalars(self):
+            return [e1, e2]
+
+    async def _execute(statement: Any):
+        statements.append(str(statement.compile(compile_kwargs={"literal_binds": True})))
+        return _MockedResult()
+
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    assert await repo.get_many_by_primary([(1, "b"), (1, "a")]) == [e2, e1]
+    assert "WHERE (entities.id1, entities.id2) IN ((1, 'b'), (1, 'a'))" in statements[0]
+    assert await repo.get_many_by_primary([("1", "a")]) == [e1]
+
+    with pytest.raises(DataError) as info:
+        await repo.get_many_by_primary([(1,)])
+
+    assert f"Primary key of {Entity} has 2 columns, but 1 values were provided" == info.value.message
 
 
 async def test_fail_get_by_primary_values_mismatch() -> None:
@@ -384,6 +576,121 @@ async def test_delete() -> None:
     assert entities == []
 
 
+async def test_add_many() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    mock = Mock(cache=cache)
+
+    chunks: list[list[dict[str, Any]]] = []
+
+    class _MockedResult:
+        def __init__(self, rows: list[dict[str, Any]]) -> None:
+            self.rows = rows
+
+        def scalars(self):
+            return [Entity(id=len(chunks) * 10 + i, **r) for i, r in enumerate(self.rows)]
+
+    async def _execute(statement: Any, rows: list[dict[str, Any]]):
+        assert str(statement) == (
+            "INSERT INTO entities (id, name) VALUES (:id, :name) RETURNING entities.id, entities.name"
+        )
+        chunks.append(rows)
+        return _MockedResult(rows)
+
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    persisted = await repo.add_many((Entity(name=f"e{i}") for i in range(5)), chunk_size=2)
+
+    assert chunks == [[{"name": "e0"}, {"name": "e1"}], [{"name": "e2"}, {"name": "e3"}], [{"name": "e4"}]]
+    assert [e.name for e in persisted] == ["e0", "e1", "e2", "e3", "e4"]
+    assert [e.id for e in persisted] == [10, 11, 20, 21, 30]
+
+
+async def test_add_many_returns_session_instances() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(TestBase.metadata.create_all)
+
+    mock = Mock(cache=cache)
+    mock.injection.add_scoped(EntitySession[Entity])
+    mock.injection.add_scoped(Repository[Entity])
+
+    async with AsyncSession(engine) as session:
+        scoped = mock.injection.get_scoped_session()
+        scoped.add_instance(EntitySession[Entity], EntitySession(session))
+        repo = scoped.require(Repository[Entity])
+
+        entities = [Entity(name=f"e{i}") for i in range(5)]
+        persisted = await repo.add_many(entities, chunk_size=2)
+
+        assert [e.name for e in persisted] == ["e0", "e1", "e2", "e3", "e4"]
+        assert all(e in session for e in persisted)
+        assert not any(e in session for e in entities)
+
+
+async def test_update_many_delete_where() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    mock = Mock(cache=cache)
+
+    statements: list[str] = []
+
+    class _MockedResult:
+        rowcount = 3
+
+    async def _execute(statement: Any):
+        statements.append(str(statement.compile(compile_kwargs={"literal_binds": True})))
+        return _MockedResult()
+
+    mock.mock(EntitySession[Entity]).setup(lambda s: s.execute, _execute)
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    assert await repo.update_many(Entity.id > 1, {"name": "updated"}) == 3
+    assert await repo.delete_where(Entity.name == "old") == 3
+
+    assert statements == [
+        "UPDATE entities SET name='updated' WHERE entities.id > 1",
+        "DELETE FROM entities WHERE entities.name = 'old'",
+    ]
+
+
 async def test_commit() -> None:
     cache = Cache()
 
@@ -0,0 +1,393 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import ForeignKey, create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, load_only, mapped_column, relationship
+
+from bolinette.core import Cache
+from bolinette.core.logging import Logger
+from bolinette.core.testing import Mock
+from bolinette.data import DataSection
+from bolinette.data.relational import (
+    AsyncTransaction,
+    EntityManager,
+    EntitySession,
+    LruResultCache,
+    Repository,
+    ResultCache,
+    TrackedSession,
+    declarative_base,
+    entity,
+)
+
+
+def _create_cache(size: int = 10, ttl: float | None = None) -> LruResultCache:
+    return LruResultCache(DataSection(databases=[], result_cache_size=size, result_cache_ttl=ttl))
+
+
+def test_lru_get_set() -> None:
+    results = _create_cache()
+
+    results.set("k1", 1, frozenset(["t1"]))
+
+    assert results.get("k1") == 1
+    assert results.get("k2") is None
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    results = _create_cache(size=2)
+
+    results.set("k1", 1, frozenset(["t1"]))
+    results.set("k2", 2, frozenset(["t1"]))
+    assert results.get("k1") == 1
+    results.set("k3", 3, frozenset(["t2"]))
+
+    assert len(results) == 2
+    assert results.get("k1") == 1
+    assert results.get("k2") is None
+    assert results.get("k3") == 3
+
+
+def test_lru_ttl() -> None:
+    results = _create_cache(ttl=60)
+
+    results.set("k1", 1, frozenset(["t1"]))
+    results.set("k2", 2, frozenset(["t1"]), ttl=0)
+    time.sleep(0.001)
+
+    assert results.get("k1") == 1
+    assert results.get("k2") is None
+    assert len(results) == 1
+
+
+def test_lru_invalidate_tables() -> None:
+    results = _create_cache()
+
+    results.set("k1", 1, frozenset(["t1"]))
+    results.set("k2", 2, frozenset(["t1", "t2"]))
+    results.set("k3", 3, frozenset(["t3"]))
+
+    results.invalidate(["t2"])
+
+    assert results.get("k1") == 1
+    assert results.get("k2") is None
+    assert results.get("k3") == 3
+
+    results.invalidate(["t1", "t4"])
+
+    assert len(results) == 1
+
+    results.clear()
+
+    assert len(results) == 0
+
+
+def test_lru_refuses_stale_generation() -> None:
+    results = _create_cache()
+
+    generation = results.generation(frozenset(["t1", "t2"]))
+    results.invalidate(["t2"])
+    results.set("k1", 1, frozenset(["t1", "t2"]), generation=generation)
+
+    assert results.get("k1") is None
+
+    generation = results.generation(frozenset(["t1"]))
+    results.invalidate(["t2"])
+    results.set("k1", 1, frozenset(["t1"]), generation=generation)
+
+    assert results.get("k1") == 1
+
+    generation = results.generation(frozenset(["t3"]))
+    results.clear()
+    results.set("k2", 2, frozenset(["t3"]), generation=generation)
+
+    assert results.get("k2") is None
+
+
+async def test_repository_cached_first() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    mock = Mock(cache=cache)
+
+    e1 = Entity(id=1)
+    executed: list[Any] = []
+
+    class _MockedResult:
+        def freeze(self) -> "_MockedResult":
+            return self
+
+        def __call__(self) -> "_MockedResult":
+            return self
+
+        def scalar_one_or_none(self) -> Entity:
+            return e1
+
+    async def _execute(statement: Any) -> _MockedResult:
+        executed.append(statement)
+        return _MockedResult()
+
+    (
+        mock.mock(EntitySession[Entity])
+        .setup(lambda s: s.execute, _execute)
+        .setup_callable(lambda s: s.has_pending_writes, lambda: False)
+        .setup_callable(lambda s: s.detach_frozen, lambda frozen: frozen)
+        .setup_callable(lambda s: s.merge_frozen, lambda frozen: frozen)
+    )
+    results = _create_cache()
+    mock.injection.add_singleton(ResultCache, LruResultCache, instance=results)
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    assert await repo.first(select(Entity).where(Entity.id == 1), cached=True) is e1
+    assert await repo.first(select(Entity).where(Entity.id == 1), cached=True) is e1
+    assert len(executed) == 1
+    assert len(results) == 1
+
+    assert await repo.first(select(Entity).where(Entity.id == 2), cached=True) is e1
+    assert await repo.first(select(Entity).where(Entity.id == 1)) is e1
+    assert len(executed) == 3
+    assert len(results) == 2
+
+    results.invalidate(["entities"])
+
+    assert await repo.first(select(Entity).where(Entity.id == 1), cached=True) is e1
+    assert len(executed) == 4
+
+    assert await repo.first(select(Entity).where(Entity.id == 1).options(load_only(Entity.id)), cached=True) is e1
+    assert (
+        await repo.first(select(Entity).where(Entity.id == 1).execution_options(populate_existing=True), cached=True)
+        is e1
+    )
+    assert len(executed) == 6
+    assert len(results) == 1
+
+
+async def test_repository_cached_first_invalidated_during_execution() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    mock = Mock(cache=cache)
+
+    e1 = Entity(id=1)
+    results = _create_cache()
+    executed: list[Any] = []
+
+    class _MockedResult:
+        def freeze(self) -> "_MockedResult":
+            return self
+
+        def __call__(self) -> "_MockedResult":
+            return self
+
+        def scalar_one_or_none(self) -> Entity:
+            return e1
+
+    async def _execute(statement: Any) -> _MockedResult:
+        executed.append(statement)
+        if len(executed) == 1:
+            results.invalidate(["entities"])
+        return _MockedResult()
+
+    (
+        mock.mock(EntitySession[Entity])
+        .setup(lambda s: s.execute, _execute)
+        .setup_callable(lambda s: s.has_pending_writes, lambda: False)
+        .setup_callable(lambda s: s.detach_frozen, lambda frozen: frozen)
+        .setup_callable(lambda s: s.merge_frozen, lambda frozen: frozen)
+    )
+    mock.injection.add_singleton(ResultCache, LruResultCache, instance=results)
+    mock.injection.add_singleton(Repository[Entity])
+
+    repo = mock.injection.require(Repository[Entity])
+
+    assert await repo.first(select(Entity).where(Entity.id == 1), cached=True) is e1
+    assert len(results) == 0
+
+    assert await repo.first(select(Entity).where(Entity.id == 1), cached=True) is e1
+    assert await repo.first(select(Entity).where(Entity.id == 1), cached=True) is e1
+    assert len(executed) == 2
+    assert len(results) == 1
+
+
+async def test_transaction_invalidates_committed_tables() -> None:
+    cache = Cache()
+
+    mock = Mock(cache=cache)
+    mock.mock(EntityManager).setup(lambda m: m.engines, {})
+    mock.mock(Logger[AsyncTransaction]).dummy()
+    results = _create_cache()
+    mock.injection.add_singleton(ResultCache, LruResultCache, instance=results)
+    mock.injection.add_scoped(AsyncTransaction)
+
+    class _Session:
+        async def commit(self) -> None:
+            pass
+
+        async def close(self) -> None:
+            pass
+
+        def pop_committed_tables(self) -> set[str]:
+            return {"t1"}
+
+    results.set("k1", 1, frozenset(["t1"]))
+    results.set("k2", 2, frozenset(["t2"]))
+
+    async with mock.injection.get_async_scoped_session() as scoped_inject:
+        async with scoped_inject.require(AsyncTransaction) as transaction:
+            transaction.add("test", _Session())  # pyright: ignore
+
+    assert results.get("k1") is None
+    assert results.get("k2") == 2
+
+
+def test_tracked_session_written_tables() -> None:
+    class TestBase(DeclarativeBase):
+        pass
+
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    engine = create_engine("sqlite://")
+    TestBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Entity(id=1))
+        session.commit()
+        assert EntitySession(session).pop_committed_tables() == set()
+
+    with TrackedSession(engine) as session:
+        session.add(Entity(id=2))
+        session.flush()
+        assert EntitySession(session).has_pending_writes()
+        session.commit()
+        assert EntitySession(session).pop_committed_tables() == {"entities"}
+
+
+async def _create_cached_repositories(
+    cache: Cache,
+) -> tuple[Any, async_sessionmaker[AsyncSession], Callable[[AsyncSession], Any]]:
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Entity(TestBase):
+        __tablename__ = "entities"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(TestBase.metadata.create_all)
+    session_maker = async_sessionmaker(engine, sync_session_class=TrackedSession, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add(Entity(id=1, name="first"))
+        await session.commit()
+
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(ResultCache, LruResultCache, instance=_create_cache())
+    mock.injection.add_scoped(EntitySession[Entity])
+    mock.injection.add_scoped(Repository[Entity])
+
+    def _get_repository(session: AsyncSession) -> Any:
+        scoped = mock.injection.get_scoped_session()
+        scoped.add_instance(EntitySession[Entity], EntitySession(session))
+        return scoped.require(Repository[Entity])
+
+    return Entity, session_maker, _get_repository
+
+
+async def test_cached_results_after_rollback() -> None:
+    cache = Cache()
+    entity_t, session_maker, get_repository = await _create_cached_repositories(cache)
+    statement = select(entity_t).where(entity_t.id == 1)
+
+    async with session_maker() as session:
+        await get_repository(session).first(statement, cached=True)
+        await session.rollback()
+
+    async with session_maker() as session:
+        e1 = await get_repository(session).first(statement, cached=True)
+        assert e1.name == "first"
+        assert e1 in session
+
+
+async def test_cached_results_modified_without_commit() -> None:
+    cache = Cache()
+    entity_t, session_maker, get_repository = await _create_cached_repositories(cache)
+    statement = select(entity_t).where(entity_t.id == 1)
+
+    async with session_maker() as session:
+        e1 = await get_repository(session).first(statement, cached=True)
+        e1.name = "changed"
+
+        async with session_maker() as other_session:
+            e2 = await get_repository(other_session).first(statement, cached=True)
+            assert e2 is not e1
+            assert e2.name == "first"
+            assert e2 in other_session
+
+
+async def test_cached_results_skip_eager_relationships() -> None:
+    cache = Cache()
+
+    @declarative_base("tests", cache=cache)
+    class TestBase(DeclarativeBase):
+        pass
+
+    @entity(cache=cache)
+    class Parent(TestBase):
+        __tablename__ = "parents"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        children: Mapped[list["Child"]] = relationship(lazy="selectin")
+
+    @entity(cache=cache)
+    class Child(TestBase):
+        __tablename__ = "children"
+        id: Mapped[int] = mapped_column(primary_key=True)
+        parent_id: Mapped[int] = mapped_column(ForeignKey("parents.id"))
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(TestBase.metadata.create_all)
+    session_maker = async_sessionmaker(engine, sync_session_class=TrackedSession, expire_on_commit=False)
+    async with session_maker() as session:
+        session.add(Parent(id=1, children=[Child(id=1), Child(id=2)]))
+        await session.commit()
+
+    results = _create_cache()
+    mock = Mock(cache=cache)
+    mock.injection.add_singleton(ResultCache, LruResultCache, instance=results)
+    mock.injection.add_scoped(EntitySession[Parent])
+    mock.injection.add_scoped(Repository[Parent])
+    statement = select(Parent).where(Parent.id == 1)
+
+    for _ in range(2):
+        async with session_maker() as session:
+            scoped = mock.injection.get_scoped_session()
+            scoped.add_instance(EntitySession[Parent], EntitySession(session))
+            parent = await scoped.require(Repository[Parent]).first(statement, cached=True)
+            assert [c.id for c in parent.children] == [1, 2]
+
+    assert len(results) == 0
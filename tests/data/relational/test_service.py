@@ -8,7 +8,7 @@ from bolinette.core import Cache
 from bolinette.core.mapping import Mapper
 from bolinette.core.testing import Mock
 from bolinette.data.exceptions import ColumnNotNullableError, WrongColumnTypeError
-from bolinette.data.relational import Repository, Service
+from bolinette.data.relational import Page, Repository, Service
 
 
 def test_create() -> None:
@@ -87,6 +87,79 @@ def test_update() -> None:
     assert entity2.name == "name"
 
 
+async def test_get_page() -> None:
+    cache = Cache()
+
+    mock = Mock(cache=cache)
+
+    class TestBase(DeclarativeBase):
+        pass
+
+    class _Entity(TestBase):
+        __tablename__ = "entity"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    calls: list[dict[str, Any]] = []
+    page = Page([_Entity(id=1, name="name")], "cursor")
+
+    async def _paginate(**kwargs: Any) -> Page[_Entity]:
+        calls.append(kwargs)
+        return page
+
+    mock.mock(Repository[_Entity]).setup(lambda r: r.paginate, _paginate)
+    mock.mock(Mapper).dummy()
+    mock.injection.add_singleton(Service[_Entity])
+
+    service = mock.injection.require(Service[_Entity])
+
+    assert await service.get_page(10, "prev", order_by=[_Entity.name]) is page
+    assert calls == [{"limit": 10, "cursor": "prev", "order_by": [_Entity.name], "desc": False}]
+
+
+async def test_create_many() -> None:
+    cache = Cache()
+
+    mock = Mock(cache=cache)
+
+    class TestBase(DeclarativeBase):
+        pass
+
+    class _Entity(TestBase):
+        __tablename__ = "entity"
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        name: Mapped[str]
+
+    class _Payload:
+        def __init__(self, id: int, name: str) -> None:
+            self.id = id
+            self.name = name
+
+    mapped: list[tuple[type[Any], type[Any], list[Any]]] = []
+
+    def _map_many(src_cls: type[Any], dest_cls: type[Any], src: Any, *, validate: bool = False) -> Any:
+        mapped.append((src_cls, dest_cls, list(src)))
+        return (_Entity(id=p.id, name=p.name) for p in src)
+
+    async def _add_many(entities: list[_Entity]) -> list[_Entity]:
+        return entities
+
+    mock.mock(Repository[_Entity]).setup(lambda r: r.add_many, _add_many)
+    mock.mock(Mapper).setup(lambda m: m.map_many, _map_many)
+    mock.injection.add_singleton(Service[_Entity])
+
+    service = mock.injection.require(Service[_Entity])
+
+    payloads = [_Payload(1, "a"), _Payload(2, "b")]
+    entities = await service.create_many(payloads)
+
+    assert [(e.id, e.name) for e in entities] == [(1, "a"), (2, "b")]
+    assert mapped == [(_Payload, _Entity, payloads)]
+    assert await service.create_many([]) == []
+
+
 def test_fail_validate_non_nullable_column() -> None:
     cache = Cache()
 
@@ -0,0 +1,98 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from bolinette.data.relational import EntitySession
+
+
+class _SyncSession:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def _record(self, name: str, **kwargs: Any) -> None:
+        self.calls.append((name, threading.current_thread().name, kwargs))
+
+    def execute(self, statement: Any, params: Any = None, **kwargs: Any) -> None:
+        self._record("execute", **kwargs)
+
+    def get(self, entity: Any, ident: Any) -> None:
+        self._record("get")
+
+    def add(self, instance: Any) -> None:
+        self._record("add")
+
+    def delete(self, instance: Any) -> None:
+        self._record("delete")
+
+    def commit(self) -> None:
+        self._record("commit")
+
+    def rollback(self) -> None:
+        self._record("rollback")
+
+    def close(self) -> None:
+        self._record("close")
+
+
+async def test_sync_session_inline() -> None:
+    sync_session = _SyncSession()
+    session = EntitySession(sync_session)  # pyright: ignore
+
+    await session.execute(None)  # pyright: ignore
+    await session.commit()
+
+    main_thread = threading.current_thread().name
+    assert [(c[0], c[1]) for c in sync_session.calls] == [("execute", main_thread), ("commit", main_thread)]
+
+
+async def test_sync_session_in_executor() -> None:
+    sync_session = _SyncSession()
+    with ThreadPoolExecutor(1, thread_name_prefix="test-db") as executor:
+        session = EntitySession(sync_session, executor)  # pyright: ignore
+
+        await session.execute(None)  # pyright: ignore
+        session.add(None)  # pyright: ignore
+        await session.commit()
+        await session.close()
+
+    main_thread = threading.current_thread().name
+    assert [c[0] for c in sync_session.calls] == ["execute", "add", "commit", "close"]
+    assert sync_session.calls[0][1].startswith("test-db")
+    assert sync_session.calls[0][2] == {"execution_options": {"prebuffer_rows": True}}
+    assert sync_session.calls[1][1] == main_thread
+    assert sync_session.calls[2][1].startswith("test-db")
+    assert sync_session.calls[3][1].startswith("test-db")
+
+
+async def test_sync_session_stream_in_executor() -> None:
+    threads: list[str] = []
+
+    class _Result:
+        def __init__(self) -> None:
+            self.rows = [1, 2, 3, 4, 5]
+            self.closed = False
+
+        def fetchmany(self, size: int) -> list[int]:
+            threads.append(threading.current_thread().name)
+            batch, self.rows = self.rows[:size], self.rows[size:]
+            return batch
+
+        def close(self) -> None:
+            self.closed = True
+
+    result = _Result()
+    options: list[dict[str, Any]] = []
+
+    class _StreamSession(_SyncSession):
+        def scalars(self, statement: Any, params: Any = None, **kwargs: Any) -> _Result:
+            options.append(kwargs)
+            return result
+
+    with ThreadPoolExecutor(1, thread_name_prefix="test-db") as executor:
+        session = EntitySession(_StreamSession(), executor)  # pyright: ignore
+        batches = [b async for b in session.stream(None, batch_size=2)]  # pyright: ignore
+
+    assert batches == [[1, 2], [3, 4], [5]]
+    assert options == [{"execution_options": {"yield_per": 2}}]
+    assert all(t.startswith("test-db") for t in threads)
+    assert result.closed
@@ -133,3 +133,36 @@ def test_fail_init_connections_system_not_found() -> None:
         "Database connection 'test-connection', Database system supporting scheme 'protocol://' was not found"
         == info.value.message
     )
+
+
+def test_init_connections_engine_options() -> None:
+    cache = Cache()
+    database_system(cache=cache)(SQLite)
+
+    def get_sections() -> list[DatabaseSection]:
+        return [
+            DatabaseSection(name="default", url="sqlite+aiosqlite://"),
+            DatabaseSection(
+                name="tuned",
+                url="sqlite+aiosqlite://",
+                pool_size=20,
+                max_overflow=5,
+                pool_timeout=2.5,
+                pool_pre_ping=True,
+            ),
+        ]
+
+    mock = Mock(cache=cache)
+    mock.mock(DataSection).setup(lambda s: s.databases, get_sections())
+    mock.mock(Logger[DatabaseManager]).dummy()
+    mock.injection.add_singleton(DatabaseManager)
+
+    manager = mock.injection.require(DatabaseManager)
+
+    assert manager.get_connection("default").options == {}
+    assert manager.get_connection("tuned").options == {
+        "pool_size": 20,
+        "max_overflow": 5,
+        "pool_timeout": 2.5,
+        "pool_pre_ping": True,
+    }
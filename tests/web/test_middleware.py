@@ -1,10 +1,14 @@
+import logging
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import Any, override
 
 from bolinette.core import meta
-from bolinette.core.types import Type
-from bolinette.web import with_middleware, without_middleware
-from bolinette.web.middleware import MiddlewareBag
+from bolinette.core.logging import Logger
+from bolinette.core.testing import Mock
+from bolinette.core.types import Function, Type
+from bolinette.web import middleware_options, with_middleware, without_middleware
+from bolinette.web.middleware import MiddlewareBag, MiddlewarePipeline
+from bolinette.web.routing import Route
 
 
 def test_add_middleware() -> None:
@@ -151,3 +155,114 @@ def test_remove_two_middlewares() -> None:
     assert mdlw1_t in bag.removed
     mdlw2_t = Type(TestMiddleware2)
     assert mdlw2_t in bag.removed
+
+
+def test_middleware_pipeline_from_route() -> None:
+    class TestMiddleware1:
+        def options(self) -> None: ...
+
+        async def handle(self, next: Callable[[], Awaitable[Any]]) -> Any: ...
+
+    class TestMiddleware2:
+        def options(self, value: int) -> None: ...
+
+        async def handle(self, next: Callable[[], Awaitable[Any]]) -> Any: ...
+
+    @with_middleware(TestMiddleware1)
+    @with_middleware(TestMiddleware2, 1)
+    class TestCtrl:
+        @with_middleware(TestMiddleware2, 2)
+        @without_middleware(TestMiddleware1)
+        def test_route(self) -> None:
+            pass
+
+    pipeline = MiddlewarePipeline.from_route(
+        Route("GET", "/", Type(TestCtrl), Function(TestCtrl.test_route)), Logger("test")
+    )
+
+    assert [s.t for s in pipeline.steps] == [Type(TestMiddleware2)]
+    assert pipeline.steps[0].args == (2,)
+
+
+async def test_middleware_pipeline_reuses_singleton() -> None:
+    instances: list[Any] = []
+    calls: list[str] = []
+
+    @middleware_options(strategy="singleton")
+    class SingletonMiddleware:
+        def __init__(self) -> None:
+            instances.append(self)
+
+        def options(self) -> None: ...
+
+        async def handle(self, next: Callable[[], Awaitable[Any]]) -> Any:
+            calls.append("singleton")
+            return await next()
+
+    class ScopedMiddleware:
+        def __init__(self) -> None:
+            instances.append(self)
+
+        def options(self) -> None: ...
+
+        async def handle(self, next: Callable[[], Awaitable[Any]]) -> Any:
+            calls.append("scoped")
+            return await next()
+
+    @with_middleware(SingletonMiddleware)
+    @with_middleware(ScopedMiddleware)
+    class TestCtrl:
+        def test_route(self) -> None:
+            pass
+
+    async def handler() -> str:
+        calls.append("handler")
+        return "result"
+
+    inject = Mock().injection
+    pipeline = MiddlewarePipeline.from_route(
+        Route("GET", "/", Type(TestCtrl), Function(TestCtrl.test_route)), Logger("test")
+    )
+
+    for _ in range(2):
+        async with inject.get_async_scoped_session() as scoped:
+            assert await pipeline.run(inject, scoped, handler) == "result"
+
+    assert len(instances) == 3
+    assert len([i for i in instances if isinstance(i, SingletonMiddleware)]) == 1
+    assert calls == ["singleton", "scoped", "handler"] * 2
+
+
+async def test_middleware_pipeline_logs_calls() -> None:
+    class TestMiddleware:
+        def options(self) -> None: ...
+
+        async def handle(self, next: Callable[[], Awaitable[Any]]) -> Any:
+            return await next()
+
+    @with_middleware(TestMiddleware)
+    class TestCtrl:
+        def test_route(self) -> None:
+            pass
+
+    async def handler() -> str:
+        return "result"
+
+    records: list[logging.LogRecord] = []
+
+    class _Handler(logging.Handler):
+        @override
+        def emit(self, record: logging.LogRecord) -> None:
+            records.append(record)
+
+    logger = Logger[Any]("test")
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(_Handler())
+
+    inject = Mock().injection
+    pipeline = MiddlewarePipeline.from_route(Route("GET", "/", Type(TestCtrl), Function(TestCtrl.test_route)), logger)
+
+    async with inject.get_async_scoped_session() as scoped:
+        assert await pipeline.run(inject, scoped, handler) == "result"
+
+    assert [r.getMessage() for r in records] == [f"Calling middleware {TestMiddleware.__qualname__}"]
@@ -5,9 +5,12 @@ from http import HTTPStatus
 from io import BytesIO
 from typing import Annotated, Any
 
+import pytest
+
 from bolinette.core import Cache, CoreSection
+from bolinette.core.exceptions import InjectionError
 from bolinette.core.logging import Logger
-from bolinette.core.mapping import Mapper
+from bolinette.core.mapping import JsonBytes, JsonCodec, Mapper, StdJsonCodec
 from bolinette.core.testing import Mock
 from bolinette.core.types import TypeChecker
 from bolinette.web import Payload, controller, delete, get, patch, post, put
@@ -105,6 +108,7 @@ async def test_call_route_returns_str() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     resources = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -134,6 +138,7 @@ async def test_call_route_returns_int() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     resources = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -162,6 +167,7 @@ async def test_call_route_returns_bytes() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     resources = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -174,6 +180,36 @@ async def test_call_route_returns_bytes() -> None:
     assert resp.headers[HttpHeaders.ContentType] == "application/octet-stream"
 
 
+async def test_call_route_returns_serialized_json() -> None:
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.mock(Logger[WebResources]).dummy()
+    mock.mock(CoreSection).dummy()
+    mock.mock(TypeChecker).dummy()
+    mock.mock(Mapper).dummy()
+    mock.mock(AuthProviders).dummy()
+
+    class Controller:
+        @get("")
+        def test_route(self) -> Generator[JsonBytes, None, None]:
+            yield JsonBytes(b'{"id": 1}')
+            yield JsonBytes(b'{"id": 2}')
+
+    controller("/", cache=cache)(Controller)
+
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
+    mock.injection.add_singleton(WebResources)
+    resources = mock.injection.instantiate(WebResources)
+    buffer = BytesIO()
+
+    resp = MockResponse(buffer)
+    await resources.dispatch(MockRequest("GET", "/"), resp)
+
+    buffer.seek(0)
+    assert buffer.read() == b'[{"id": 1}, {"id": 2}]'
+    assert resp.headers[HttpHeaders.ContentType] == "application/json"
+
+
 async def test_call_route_params() -> None:
     cache = Cache()
     mock = Mock(cache=cache)
@@ -190,6 +226,7 @@ async def test_call_route_params() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -200,6 +237,34 @@ async def test_call_route_params() -> None:
     assert buffer.read() == b'[2, 3.2, true, "tset"]'
 
 
+async def test_call_route_typed_params() -> None:
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.mock(Logger[WebResources]).dummy()
+    mock.mock(CoreSection).dummy()
+    mock.mock(TypeChecker).dummy()
+    mock.mock(Mapper).dummy()
+    mock.mock(AuthProviders).dummy()
+
+    class Controller:
+        @get(r"{_int:int}/{_float:int}")
+        async def test_route(self, _int: int, _float: float) -> list[Any]:
+            assert type(_int) is int and type(_float) is float
+            return [_int + 1, _float / 2]
+
+    controller("/", cache=cache)(Controller)
+
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
+    mock.injection.add_singleton(WebResources)
+    res = mock.injection.instantiate(WebResources)
+    buffer = BytesIO()
+
+    await res.dispatch(MockRequest("GET", "/1/3"), MockResponse(buffer))
+
+    buffer.seek(0)
+    assert buffer.read() == b"[2, 1.5]"
+
+
 async def test_fail_call_route_param_wrong_type() -> None:
     cache = Cache()
     mock = Mock(cache=cache)
@@ -215,6 +280,7 @@ async def test_fail_call_route_param_wrong_type() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -255,6 +321,7 @@ async def test_call_route_int_asyncgenerator() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -283,6 +350,7 @@ async def test_call_route_int_generator() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -312,6 +380,7 @@ async def test_call_route_returns_coroutine() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -343,6 +412,7 @@ async def test_call_route_returns_asyncgen() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -366,6 +436,7 @@ async def test_fail_route_not_found() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -393,6 +464,7 @@ async def test_fail_route_method_not_allowed() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -421,6 +493,7 @@ async def test_fail_route_raises_exception() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -461,6 +534,7 @@ async def test_fail_route_raises_exception_debug() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -520,6 +594,7 @@ async def test_call_many_routes() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
 
@@ -564,6 +639,7 @@ async def test_call_route_with_class_payload() -> None:
 
     mock.mock(Mapper).setup(lambda m: m.map, mock_map)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     res = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
@@ -578,6 +654,101 @@ async def test_call_route_with_class_payload() -> None:
     assert response.status == 200
 
 
+async def test_call_route_without_payload_skips_body() -> None:
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.mock(Logger[WebResources]).dummy()
+    mock.mock(CoreSection).dummy()
+    mock.mock(TypeChecker).dummy()
+    mock.mock(Mapper).dummy()
+    mock.mock(AuthProviders).dummy()
+
+    class Controller:
+        @post("")
+        async def test_route(self) -> str:
+            return "test"
+
+    controller("/", cache=cache)(Controller)
+
+    class _Request(MockRequest):
+        async def json(self, *, cls: type[json.JSONDecoder] | None = None) -> Any:
+            raise AssertionError("Body should not be parsed")
+
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
+    mock.injection.add_singleton(WebResources)
+    resources = mock.injection.instantiate(WebResources)
+    buffer = BytesIO()
+
+    resp = MockResponse(buffer)
+    await resources.dispatch(_Request("POST", "/", payload=b"{"), resp)
+
+    buffer.seek(0)
+    assert buffer.read() == b"test"
+    assert resp.status == 200
+
+
+async def test_call_singleton_controller() -> None:
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.mock(Logger[WebResources]).dummy()
+    mock.mock(CoreSection).dummy()
+    mock.mock(TypeChecker).dummy()
+    mock.mock(Mapper).dummy()
+    mock.mock(AuthProviders).dummy()
+
+    instances: list[Any] = []
+
+    class Controller:
+        def __init__(self) -> None:
+            instances.append(self)
+
+        @get("{value}")
+        async def test_route(self, value: int, response: ResponseData) -> int:
+            response.set_status(201)
+            return value
+
+    controller("/", strategy="singleton", cache=cache)(Controller)
+
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
+    mock.injection.add_singleton(WebResources)
+    resources = mock.injection.instantiate(WebResources)
+
+    assert len(instances) == 1
+
+    for value in range(2):
+        buffer = BytesIO()
+        resp = MockResponse(buffer)
+        await resources.dispatch(MockRequest("GET", f"/{value}"), resp)
+        buffer.seek(0)
+        assert buffer.read() == str(value).encode()
+        assert resp.status == 201
+
+    assert len(instances) == 1
+
+
+def test_fail_singleton_controller_wiring() -> None:
+    cache = Cache()
+    mock = Mock(cache=cache)
+    mock.mock(Logger[WebResources]).dummy()
+    mock.mock(CoreSection).dummy()
+    mock.mock(TypeChecker).dummy()
+
+    class Controller:
+        def __init__(self, service) -> None:  # pyright: ignore[reportMissingParameterType]
+            self.service = service
+
+        @get("")
+        async def test_route(self) -> None: ...
+
+    controller("/", strategy="singleton", cache=cache)(Controller)
+
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
+    mock.injection.add_singleton(WebResources)
+
+    with pytest.raises(InjectionError):
+        mock.injection.instantiate(WebResources)
+
+
 async def test_set_response_status() -> None:
     cache = Cache()
     mock = Mock(cache=cache)
@@ -595,6 +766,7 @@ async def test_set_response_status() -> None:
 
     controller("/", cache=cache)(Controller)
 
+    mock.injection.add_singleton(JsonCodec, StdJsonCodec)
     mock.injection.add_singleton(WebResources)
     resources = mock.injection.instantiate(WebResources)
     buffer = BytesIO()
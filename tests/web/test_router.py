@@ -1,9 +1,11 @@
 import json
-from typing import Any
+from typing import Annotated, Any
+from uuid import UUID
 
 import pytest
 
 from bolinette.core.types import Function, Type
+from bolinette.web import Payload
 from bolinette.web.exceptions import MethodNotAllowedDispatchError, NotFoundDispatchError
 from bolinette.web.routing import Route, Router
 from bolinette.web.routing.resource import PatternResourceNode, StaticResourceNode
@@ -248,6 +250,44 @@ def test_dispatch_route_with_params() -> None:
     assert req.path_params == {"b": "b"}
 
 
+def test_dispatch_route_with_typed_params() -> None:
+    router = Router()
+
+    class Controller:
+        def test_route_1(self) -> Any: ...
+
+    router.add_route(
+        Route("GET", "/a/{id:int}/{key:uuid}/{rest:path}", Type(Controller), Function(Controller.test_route_1))
+    )
+
+    req = MockRequest("GET", "/a/42/0b0d1c8e-8c9a-4f37-9e0d-7b5e1f2c3a4d/some/file.txt", {}, {}, {})
+    route = router.dispatch(req)
+
+    assert route.path == "/a/{id:int}/{key:uuid}/{rest:path}"
+    assert req.path_params == {
+        "id": 42,
+        "key": UUID("0b0d1c8e-8c9a-4f37-9e0d-7b5e1f2c3a4d"),
+        "rest": "some/file.txt",
+    }
+
+
+def test_fail_dispatch_route_with_typed_params() -> None:
+    router = Router()
+
+    class Controller:
+        def test_route_1(self) -> Any: ...
+
+    router.add_route(Route("GET", "/a/{id:int}", Type(Controller), Function(Controller.test_route_1)))
+    router.add_route(Route("GET", "/b/{key:uuid}", Type(Controller), Function(Controller.test_route_1)))
+
+    with pytest.raises(NotFoundDispatchError):
+        router.dispatch(MockRequest("GET", "/a/abc", {}, {}, {}))
+    with pytest.raises(NotFoundDispatchError):
+        router.dispatch(MockRequest("GET", "/a/12abc", {}, {}, {}))
+    with pytest.raises(NotFoundDispatchError):
+        router.dispatch(MockRequest("GET", "/b/not-a-valid-uuid-but-36-characters", {}, {}, {}))
+
+
 def test_dispatch_multiple_routes_with_params() -> None:
     router = Router()
 
@@ -299,3 +339,49 @@ def test_fail_dispatch_method_not_allowed() -> None:
 
     with pytest.raises(MethodNotAllowedDispatchError):
         router.dispatch(MockRequest("PUT", "/", {}, {}, {}))
+
+
+def test_dispatch_static_route_before_pattern() -> None:
+    router = Router()
+
+    class Controller:
+        def test_route_1(self) -> Any: ...
+        def test_route_2(self) -> Any: ...
+
+    router.add_route(Route("GET", "/users/{id}", Type(Controller), Function(Controller.test_route_1)))
+    router.add_route(Route("GET", "/users/new", Type(Controller), Function(Controller.test_route_2)))
+
+    compiled = router.compile()
+    assert router.compile() is compiled
+    assert {*compiled.static_routes.keys()} == {"/users/new"}
+
+    req = MockRequest("GET", "/users/new", {}, {}, {})
+    assert router.dispatch(req).path == "/users/new"
+    assert req.path_params == {}
+
+    req = MockRequest("GET", "/users/42", {}, {}, {})
+    assert router.dispatch(req).path == "/users/{id}"
+    assert req.path_params == {"id": "42"}
+
+
+def test_dispatch_recompiles_after_add_route() -> None:
+    router = Router()
+
+    class Controller:
+        def test_route_1(self) -> Any: ...
+
+    router.add_route(Route("GET", "/a", Type(Controller), Function(Controller.test_route_1)))
+    compiled = router.compile()
+    router.add_route(Route("GET", "/b", Type(Controller), Function(Controller.test_route_1)))
+
+    assert router.compile() is not compiled
+    assert router.dispatch(MockRequest("GET", "/b", {}, {}, {})).path == "/b"
+
+
+def test_route_consumes_payload() -> None:
+    class Controller:
+        def test_route_1(self, value: int) -> Any: ...
+        def test_route_2(self, payload: Annotated[dict[str, Any], Payload]) -> Any: ...
+
+    assert not Route("GET", "/", Type(Controller), Function(Controller.test_route_1)).consumes_payload
+    assert Route("POST", "/", Type(Controller), Function(Controller.test_route_2)).consumes_payload